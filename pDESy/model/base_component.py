@@ -22,6 +22,7 @@ from pDESy.model.pdesy_utils import (
     SingleNodeCommonMixin,
     SingleNodeLogJsonMixin,
 )
+from pDESy.model.record_utils import get_record_value_list, get_state_record_list
 
 from pDESy.model.base_priority_rule import (
     ResourcePriorityRuleMode,
@@ -56,6 +57,27 @@ class BaseComponent(
     object,
     metaclass=abc.ABCMeta,
 ):
+    _absence_state_record_attr_name = "state_record_list"
+    _absence_aux_record_attr_names = ("placed_workplace_id_record_list",)
+    _absence_initial_state_value = BaseComponentState.NONE
+    _absence_state_working_value = BaseComponentState.WORKING
+    _absence_state_ready_value = BaseComponentState.READY
+    _absence_state_finished_value = BaseComponentState.FINISHED
+    _absence_state_none_value = BaseComponentState.NONE
+    __slots__ = (
+        "ID",
+        "child_component_id_set",
+        "error",
+        "error_tolerance",
+        "name",
+        "parent_product_id",
+        "placed_workplace_id",
+        "placed_workplace_id_record_list",
+        "space_size",
+        "state",
+        "state_record_list",
+        "targeted_task_id_set",
+    )
     """BaseComponent.
 
     BaseComponent class for expressing target product.
@@ -117,13 +139,6 @@ class BaseComponent(
             if placed_workplace_id_record_list is not None
             else []
         )
-        self._absence_state_record_attr_name = "state_record_list"
-        self._absence_aux_record_attr_names = ["placed_workplace_id_record_list"]
-        self._absence_initial_state_value = BaseComponentState.NONE
-        self._absence_state_working_value = BaseComponentState.WORKING
-        self._absence_state_ready_value = BaseComponentState.READY
-        self._absence_state_finished_value = BaseComponentState.FINISHED
-        self._absence_state_none_value = BaseComponentState.NONE
         # --
         # Advanced parameter for customized simulation
         self.error_tolerance = error_tolerance if error_tolerance is not None else 0.0
@@ -399,7 +414,11 @@ class BaseComponent(
         self.placed_workplace_id_record_list = []
 
     def update_error_value(
-        self, no_error_prob: float, error_increment: float, seed=None
+        self,
+        no_error_prob: float,
+        error_increment: float,
+        seed=None,
+        rng: np.random.Generator = None,
     ) -> None:
         """Update error value randomly.
 
@@ -409,13 +428,18 @@ class BaseComponent(
             no_error_prob (float): Probability of no error (0.0~1.0).
             error_increment (float): Increment of error variables if error has occurred.
             seed (int, optional): Seed of creating random.rand(). Defaults to None.
+                This is used only when rng is None.
+            rng (numpy.random.Generator, optional): Random generator for sampling.
+                Defaults to None -> global numpy.random.
 
         Note:
             This method is developed for customized simulation.
         """
-        if seed is not None:
-            np.random.seed(seed=seed)
-        if np.random.rand() > no_error_prob:
+        if rng is None:
+            if seed is not None:
+                np.random.seed(seed=seed)
+            rng = np.random
+        if rng.random() > no_error_prob:
             self.error = self.error + error_increment
 
     def _get_reverse_log_lists(self) -> list[list]:
@@ -455,7 +479,7 @@ class BaseComponent(
             "targeted_task_id_set": list(self.targeted_task_id_set),
             "space_size": int(self.space_size),
             "state": int(self.state),
-            "state_record_list": [int(state) for state in self.state_record_list],
+            "state_record_list": get_record_value_list(self.state_record_list),
             "placed_workplace_id": self.placed_workplace_id,
             "placed_workplace_id_record_list": self.placed_workplace_id_record_list,
         }
@@ -468,7 +492,7 @@ class BaseComponent(
             ("state", BaseComponentState),
             (
                 "state_record_list",
-                lambda values: [BaseComponentState(num) for num in values],
+                lambda values: get_state_record_list(values, BaseComponentState),
             ),
             "placed_workplace_id",
             "placed_workplace_id_record_list",
@@ -18,6 +18,7 @@ from pDESy.model.pdesy_utils import (
     SingleNodeLogJsonMixin,
     WorkerFacilityCommonMixin,
 )
+from pDESy.model.record_utils import get_record_value_list, get_state_record_list
 
 
 class BaseFacilityState(IntEnum):
@@ -48,6 +49,22 @@ class BaseFacility(
     _state_working_value = BaseFacilityState.WORKING
     _state_absence_value = BaseFacilityState.ABSENCE
     _assigned_record_attr_name = "assigned_task_worker_id_tuple_set_record_list"
+    _assigned_pairs_attr_name = "assigned_task_worker_id_tuple_set"
+    __slots__ = (
+        "ID",
+        "absence_time_list",
+        "assigned_task_worker_id_tuple_set",
+        "assigned_task_worker_id_tuple_set_record_list",
+        "cost_per_time",
+        "cost_record_list",
+        "name",
+        "solo_working",
+        "state",
+        "state_record_list",
+        "workamount_skill_mean_map",
+        "workamount_skill_sd_map",
+        "workplace_id",
+    )
     """BaseFacility.
 
     BaseFacility class for expressing a workplace. This class will be used as a template.
@@ -116,7 +133,6 @@ class BaseFacility(
         self.assigned_task_worker_id_tuple_set_record_list = (
             assigned_task_worker_id_tuple_set_record_list or []
         )
-        self._assigned_pairs_attr_name = "assigned_task_worker_id_tuple_set"
 
     def _get_export_dict_extra_fields(self) -> dict:
         return {
@@ -129,8 +145,8 @@ class BaseFacility(
             "workamount_skill_sd_map": self.workamount_skill_sd_map,
             "absence_time_list": self.absence_time_list,
             "state": int(self.state),
-            "state_record_list": [int(state) for state in self.state_record_list],
-            "cost_record_list": self.cost_record_list,
+            "state_record_list": get_record_value_list(self.state_record_list),
+            "cost_record_list": get_record_value_list(self.cost_record_list),
             "assigned_task_worker_id_tuple_set": list(
                 self.assigned_task_worker_id_tuple_set
             ),
@@ -151,7 +167,7 @@ class BaseFacility(
             ("state", BaseFacilityState),
             (
                 "state_record_list",
-                lambda values: [BaseFacilityState(state_num) for state_num in values],
+                lambda values: get_state_record_list(values, BaseFacilityState),
             ),
             "cost_record_list",
             (
@@ -6,6 +6,7 @@ This module defines enums and functions for sorting workplaces, workers, facilit
 according to various priority rules.
 """
 
+from bisect import bisect_left, insort
 from enum import IntEnum
 
 
@@ -107,74 +108,79 @@ def sort_workplace_list(
     return workplace_list
 
 
-def sort_worker_list(
-    worker_list: list,
+def get_worker_priority_key_function(
     priority_rule_mode=ResourcePriorityRuleMode.SSP,
     **kwargs,
 ):
-    """Sort worker_list as priority_rule_mode.
+    """Get the key function of sort_worker_list for priority_rule_mode.
 
     Args:
-        worker_list (List[BaseWorker]): Target worker list of sorting.
         priority_rule_mode (ResourcePriorityRuleMode, optional): Mode of priority rule for sorting. Defaults to ResourcePriorityRuleMode.SSP.
         **kwargs: Other information of each rule.
 
     Returns:
-        List[BaseWorker]: worker_list after sorted.
+        Callable[[BaseWorker], tuple] | None: Key function of sorting. None if priority_rule_mode does not sort.
+
+    Raises:
+        ValueError: If task name is not provided for HSV mode.
     """
     target_workplace_id = None
     if "workplace_id" in kwargs:
         target_workplace_id = kwargs["workplace_id"]
 
-    skill_point_sum_dict = {
-        w: sum(w.workamount_skill_mean_map.values()) for w in worker_list
-    }
-
     # MW: a worker whose main workplace is equal to target has high priority
     if priority_rule_mode == ResourcePriorityRuleMode.MW:
-        worker_list = sorted(
-            worker_list,
-            key=lambda worker: (
-                worker.main_workplace_id is not target_workplace_id,  # MW1
-                worker.main_workplace_id is not None,  # MW2
-                skill_point_sum_dict[worker],  # SSP (additional)
-            ),
+        return lambda worker: (
+            worker.main_workplace_id is not target_workplace_id,  # MW1
+            worker.main_workplace_id is not None,  # MW2
+            sum(worker.workamount_skill_mean_map.values()),  # SSP (additional)
         )
     # SSP: a worker which amount of skill point is lower has high priority
-    elif priority_rule_mode == ResourcePriorityRuleMode.SSP:
-        worker_list = sorted(
-            worker_list,
-            key=lambda worker: (
-                skill_point_sum_dict[worker],
-                worker.main_workplace_id is not target_workplace_id,
-                worker.main_workplace_id is not None,
-            ),
+    if priority_rule_mode == ResourcePriorityRuleMode.SSP:
+        return lambda worker: (
+            sum(worker.workamount_skill_mean_map.values()),
+            worker.main_workplace_id is not target_workplace_id,
+            worker.main_workplace_id is not None,
         )
     # VC: a worker which cost is lower has high priority
-    elif priority_rule_mode == ResourcePriorityRuleMode.VC:
-        worker_list = sorted(
-            worker_list,
-            key=lambda worker: (
-                worker.cost_per_time,
-                worker.main_workplace_id is not target_workplace_id,
-                worker.main_workplace_id is not None,
-            ),
+    if priority_rule_mode == ResourcePriorityRuleMode.VC:
+        return lambda worker: (
+            worker.cost_per_time,
+            worker.main_workplace_id is not target_workplace_id,
+            worker.main_workplace_id is not None,
         )
     # HSV: a worker which target skill point is higher has high priority
-    elif priority_rule_mode == ResourcePriorityRuleMode.HSV:
+    if priority_rule_mode == ResourcePriorityRuleMode.HSV:
         task_name = kwargs.get("name")
         if task_name is None:
             raise ValueError("task name must be provided for HSV mode.")
-        worker_list = sorted(
-            worker_list,
-            key=lambda worker: (
-                -worker.workamount_skill_mean_map.get(task_name, -float("inf")),
-                worker.main_workplace_id is not target_workplace_id,
-                worker.main_workplace_id is not None,
-            ),
+        return lambda worker: (
+            -worker.workamount_skill_mean_map.get(task_name, -float("inf")),
+            worker.main_workplace_id is not target_workplace_id,
+            worker.main_workplace_id is not None,
         )
+    return None
 
-    return worker_list
+
+def sort_worker_list(
+    worker_list: list,
+    priority_rule_mode=ResourcePriorityRuleMode.SSP,
+    **kwargs,
+):
+    """Sort worker_list as priority_rule_mode.
+
+    Args:
+        worker_list (List[BaseWorker]): Target worker list of sorting.
+        priority_rule_mode (ResourcePriorityRuleMode, optional): Mode of priority rule for sorting. Defaults to ResourcePriorityRuleMode.SSP.
+        **kwargs: Other information of each rule.
+
+    Returns:
+        List[BaseWorker]: worker_list after sorted.
+    """
+    key_function = get_worker_priority_key_function(priority_rule_mode, **kwargs)
+    if key_function is None:
+        return worker_list
+    return sorted(worker_list, key=key_function)
 
 
 def sort_facility_list(
@@ -223,6 +229,60 @@ def sort_facility_list(
     return facility_list
 
 
+def get_task_priority_key_function(
+    priority_rule_mode=TaskPriorityRuleMode.TSLACK,
+    ready_count_dict: dict = None,
+):
+    """Get the key function of sort_task_list for priority_rule_mode.
+
+    The key of the rules which prioritize higher values is negated,
+    so ascending sort by the key keeps the order of sort_task_list including ties.
+
+    Args:
+        priority_rule_mode (TaskPriorityRuleMode, optional): Mode of priority rule for sorting. Defaults to TaskPriorityRuleMode.TSLACK.
+        ready_count_dict (dict[str, int], optional): Number of READY records of each task ID for FIFO. Defaults to None -> counted from state_record_list of each task.
+
+    Returns:
+        Callable[[BaseTask], float] | None: Key function of sorting. None if priority_rule_mode does not sort.
+    """
+    # Task: TSLACK (a task which Slack time(LS-ES) is lower has high priority)
+    if priority_rule_mode == TaskPriorityRuleMode.TSLACK:
+        return lambda task: task.lst - task.est
+    # Task: EST (a task which EST is lower has high priority)
+    if priority_rule_mode == TaskPriorityRuleMode.EST:
+        return lambda task: task.est
+    # Task: SPT (a task which default_work_amount is lower has high priority)
+    if priority_rule_mode == TaskPriorityRuleMode.SPT:
+        return lambda task: task.default_work_amount
+    # Task: LPT (a task which default_work_amount is higher has high priority)
+    if priority_rule_mode == TaskPriorityRuleMode.LPT:
+        return lambda task: -task.default_work_amount
+    # Task: FIFO (First In First Out rule)
+    if priority_rule_mode == TaskPriorityRuleMode.FIFO:
+        if ready_count_dict is not None:
+            return lambda task: -ready_count_dict[task.ID]
+        return lambda task: -count_ready_record(task)
+    # Task: LRPT (Longest Remaining Process Time)
+    if priority_rule_mode == TaskPriorityRuleMode.LRPT:
+        return lambda task: -task.remaining_work_amount
+    # Task: SRPT (Shortest Remaining Process Time)
+    if priority_rule_mode == TaskPriorityRuleMode.SRPT:
+        return lambda task: task.remaining_work_amount
+    return None
+
+
+def count_ready_record(task) -> int:
+    """Count READY records in state_record_list of a task.
+
+    Args:
+        task (BaseTask): Target task.
+
+    Returns:
+        int: Number of READY records.
+    """
+    return sum(1 for state in task.state_record_list if state.name == "READY")
+
+
 def sort_task_list(
     task_list: list,
     priority_rule_mode=TaskPriorityRuleMode.TSLACK,
@@ -236,48 +296,120 @@ def sort_task_list(
     Returns:
         List[BaseTask]: task_list after sorted.
     """
-    # Task: TSLACK (a task which Slack time(LS-ES) is lower has high priority)
-    if priority_rule_mode == TaskPriorityRuleMode.TSLACK:
-        task_list = sorted(task_list, key=lambda task: task.lst - task.est)
+    key_function = get_task_priority_key_function(priority_rule_mode)
+    if key_function is None:
+        return task_list
+    return sorted(task_list, key=key_function)
 
-    elif priority_rule_mode == TaskPriorityRuleMode.EST:
-        # Task: EST (a task which EST is lower has high priority)
-        task_list = sorted(task_list, key=lambda task: task.est)
 
-    elif priority_rule_mode == TaskPriorityRuleMode.SPT:
-        # Task: SPT (a task which default_work_amount is lower has high priority)
-        task_list = sorted(task_list, key=lambda task: task.default_work_amount)
+class TaskPriorityQueue:
+    """TaskPriorityQueue.
 
-    elif priority_rule_mode == TaskPriorityRuleMode.LPT:
-        # Task: LPT (a task which default_work_amount is higher has high priority)
-        task_list = sorted(
-            task_list, key=lambda task: task.default_work_amount, reverse=True
-        )
-    elif priority_rule_mode == TaskPriorityRuleMode.FIFO:
-        # Task: FIFO (First In First Out rule)
-        ready_count_cache = {}
-
-        def count_ready(x):
-            if x in ready_count_cache:
-                return ready_count_cache[x]
-            k = x.state_record_list
-            num = sum(1 for state in k if state.name == "READY")
-            ready_count_cache[x] = num
-            return num
-
-        task_list = sorted(task_list, key=count_ready, reverse=True)
-
-    elif priority_rule_mode == TaskPriorityRuleMode.LRPT:
-        # Task: LRPT (Longest Remaining Process Time)
-        task_list = sorted(
-            task_list,
-            key=lambda task: task.remaining_work_amount,
-            reverse=True,
-        )
-    elif priority_rule_mode == TaskPriorityRuleMode.SRPT:
-        # Task: SRPT (Shortest Remaining Process Time)
-        task_list = sorted(
-            task_list,
-            key=lambda task: task.remaining_work_amount,
+    Task list kept in the order of sort_task_list for a TaskPriorityRuleMode.
+    Tasks are kept sorted by (key, order), where order is the position of each task
+    in the base order, so iterating this queue gives the same order as sort_task_list
+    over the tasks listed in the base order.
+    Keys are recalculated only by `update` for the tasks marked by `mark_changed`,
+    and a task is moved only when its key changed.
+
+    Args:
+        priority_rule_mode (TaskPriorityRuleMode): Mode of priority rule for sorting.
+        order_dict (dict[str, int]): Position of each task ID in the base order.
+        ready_count_dict (dict[str, int], optional): Number of READY records of each task ID for FIFO. Defaults to None.
+    """
+
+    # Rules whose key does not change in simulation
+    STATIC_PRIORITY_RULE_MODE_SET = {TaskPriorityRuleMode.SPT, TaskPriorityRuleMode.LPT}
+
+    def __init__(
+        self,
+        priority_rule_mode: TaskPriorityRuleMode,
+        order_dict: dict,
+        ready_count_dict: dict = None,
+    ):
+        """init."""
+        self.priority_rule_mode = priority_rule_mode
+        self.order_dict = order_dict
+        key_function = get_task_priority_key_function(
+            priority_rule_mode, ready_count_dict=ready_count_dict
         )
-    return task_list
+        self.key_function = key_function if key_function is not None else lambda _: 0
+        self.entry_list = []
+        self.entry_dict = {}
+        self.changed_task_id_set = set()
+        self.__task_list = None
+
+    def __len__(self):
+        """Return the number of tasks in this queue."""
+        return len(self.entry_list)
+
+    def __contains__(self, task):
+        """Return whether the task is in this queue."""
+        return task.ID in self.entry_dict
+
+    def get_task_list(self):
+        """
+        Get tasks in priority order.
+
+        The list is reused until the order of this queue changes,
+        so it should not be modified.
+
+        Returns:
+            List[BaseTask]: Tasks in priority order.
+        """
+        if self.__task_list is None:
+            self.__task_list = [entry[2] for entry in self.entry_list]
+        return self.__task_list
+
+    def add(self, task):
+        """
+        Add a task to this queue.
+
+        Args:
+            task (BaseTask): Target task.
+        """
+        if task.ID in self.entry_dict:
+            return
+        entry = (self.key_function(task), self.order_dict[task.ID], task)
+        self.entry_dict[task.ID] = entry
+        insort(self.entry_list, entry)
+        self.__task_list = None
+
+    def discard(self, task):
+        """
+        Remove a task from this queue if it is in this queue.
+
+        Args:
+            task (BaseTask): Target task.
+        """
+        entry = self.entry_dict.pop(task.ID, None)
+        if entry is None:
+            return
+        del self.entry_list[bisect_left(self.entry_list, entry[:2])]
+        self.__task_list = None
+
+    def mark_changed(self, task_id_list):
+        """
+        Mark tasks whose values used by the key may have changed.
+        Their keys are recalculated by the next `update`.
+
+        Args:
+            task_id_list (Iterable[str]): IDs of target tasks.
+        """
+        if self.priority_rule_mode in self.STATIC_PRIORITY_RULE_MODE_SET:
+            return
+        self.changed_task_id_set.update(task_id_list)
+
+    def update(self):
+        """Recalculate keys of the marked tasks and move the tasks whose key changed."""
+        changed_task_id_set = self.changed_task_id_set
+        if len(changed_task_id_set) == 0:
+            return
+        self.changed_task_id_set = set()
+        key_function = self.key_function
+        for task_id in changed_task_id_set:
+            entry = self.entry_dict.get(task_id, None)
+            if entry is None or key_function(entry[2]) == entry[0]:
+                continue
+            self.discard(entry[2])
+            self.add(entry[2])
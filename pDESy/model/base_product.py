@@ -16,6 +16,7 @@ from .mermaid_utils import (
     print_mermaid_diagram as print_mermaid_diagram_lines,
 )
 from .pdesy_utils import CollectionCommonMixin, CollectionLogJsonMixin
+from .record_utils import get_state_record_list
 
 
 class BaseProduct(
@@ -210,9 +211,9 @@ class BaseProduct(
                 targeted_task_id_set=set(j["targeted_task_id_set"]),
                 space_size=j["space_size"],
                 state=BaseComponentState(j["state"]),
-                state_record_list=[
-                    BaseComponentState(num) for num in j["state_record_list"]
-                ],
+                state_record_list=get_state_record_list(
+                    j["state_record_list"], BaseComponentState
+                ),
                 placed_workplace_id=j["placed_workplace_id"],
                 placed_workplace_id_record_list=j["placed_workplace_id_record_list"],
             )
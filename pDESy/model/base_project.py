@@ -4,12 +4,13 @@
 
 import datetime
 import itertools
-import json
+import math
 import sys
 from typing import Optional
 import uuid
 import warnings
 from abc import ABCMeta
+from bisect import bisect_left
 from enum import IntEnum
 
 from tqdm import tqdm
@@ -20,24 +21,50 @@ import numpy as np
 from .base_component import BaseComponent, BaseComponentState
 from .base_facility import BaseFacility, BaseFacilityState
 from .base_priority_rule import (
+    ResourcePriorityRuleMode,
+    TaskPriorityQueue,
     TaskPriorityRuleMode,
+    count_ready_record,
+    get_worker_priority_key_function,
     sort_worker_list,
     sort_facility_list,
-    sort_task_list,
     sort_workplace_list,
 )
 from .base_product import BaseProduct
 from .base_task import BaseTask, BaseTaskDependency, BaseTaskState
 from .base_team import BaseTeam
 from .base_worker import BaseWorker, BaseWorkerState
-from .base_workflow import BaseWorkflow
+from .base_workflow import BaseWorkflow, PertUpdateMode
 from .base_workplace import BaseWorkplace
 from .mermaid_utils import (
     CollectionMermaidDiagramMixin,
     convert_steps_to_datetime_gantt_mermaid,
     print_mermaid_diagram as print_mermaid_diagram_lines,
 )
-from .pdesy_utils import print_all_log_in_chronological_order
+from .parallel_utils import iter_parallel_simulation
+from .pdesy_utils import (
+    print_all_log_in_chronological_order,
+    write_json_node_stream,
+)
+from .record_utils import (
+    ColumnarRecord,
+    ColumnarRecorder,
+    RecordMode,
+    RecordPolicy,
+    RunLengthRecord,
+    get_state_record_list,
+    repeat_last_record,
+    set_last_records,
+)
+from .json_utils import decode_json_float, load_json
+from .registry_utils import EntityRegistry
+from .result_utils import read_simulation_result, write_simulation_result
+from .snapshot_utils import (
+    decode_value_list,
+    dump_snapshot,
+    encode_value_list,
+    load_snapshot,
+)
 
 
 class SimulationMode(IntEnum):
@@ -156,6 +183,55 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         else:
             self.status = BaseProjectStatus.NONE
 
+        # Random generator used in simulation (None -> global numpy.random)
+        self.rng = None
+
+        # Steps in which the logs of instances are recorded in simulation
+        self.record_policy = RecordPolicy.FULL
+        self.record_interval = 1
+
+        # Dense integer indices of instances used in simulation
+        self.entity_registry = None
+
+        # Number of WORKING tasks assigned to each worker and facility by index
+        self.__working_task_count_list_dict = {}
+
+        # Number of tasks in each state, READY tasks and WORKING tasks by auto_task flag
+        self.__task_state_count_dict = {}
+        self.__ready_task_set = set()
+        self.__working_task_set_dict = {}
+        self.__working_remaining_work_amount_dict = {}
+
+        # Frontier of tasks which can be READY by task index
+        self.__output_task_dependency_list = None
+        self.__unsatisfied_dependency_count_list = None
+        self.__ready_candidate_dict = None
+
+        # Workers which can be allocated to each task
+        self.__allocation_worker_list = []
+        self.__allocation_worker_order_dict = {}
+        self.__allocatable_worker_dict = {}
+        self.__allocatable_facility_id_dict = {}
+        self.__worker_priority_key_dict = {}
+
+        # READY and WORKING tasks in priority order
+        self.__task_priority_queue = None
+        self.__ready_record_count_dict = {}
+
+        # Timing of PERT data update in simulation
+        self.__pert_update_mode = PertUpdateMode.FULL
+        self.__pert_update_time_interval = 1
+        self.__pert_updated_time = None
+        self.__task_state_changed = True
+
+        # Storage of simulation logs
+        self.__record_mode = RecordMode.LIST
+        self.__recorder = None
+        self.__record_required = True
+        self.__unrecorded_step_count = 0
+        self.__recorded_signature = None
+        self.__task_finish_step_dict = {}
+
         self.__initialize_child_instance_set_id_instance_dict()
 
     def __initialize_child_instance_set_id_instance_dict(self):
@@ -173,6 +249,13 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         self.worker_dict = {w.ID: w for w in self.worker_set}
         self.facility_dict = {f.ID: f for f in self.facility_set}
 
+        self.entity_registry = EntityRegistry(
+            workflow_list=list(self.workflow_set),
+            product_list=list(self.product_set),
+            team_list=list(self.team_set),
+            workplace_list=list(self.workplace_set),
+        )
+
     def __str__(self):
         """
         Returns a string representation of the project.
@@ -605,10 +688,13 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
             self.status = BaseProjectStatus.NONE
 
         self.__initialize_child_instance_set_id_instance_dict()
+        self.__task_priority_queue = None
 
         # product should be initialized after initializing workflow
         for workflow in self.workflow_set:
             workflow.initialize(state_info=state_info, log_info=log_info)
+        self.__initialize_ready_frontier()
+        for workflow in self.workflow_set:
             self.check_state_workflow(workflow, BaseTaskState.READY)
         for product in self.product_set:
             product.initialize(state_info=state_info, log_info=log_info)
@@ -619,6 +705,27 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         for workplace in self.workplace_set:
             workplace.initialize(state_info=state_info, log_info=log_info)
 
+        self.__working_task_count_list_dict = {
+            kind: [
+                self.__count_working_task(resource)
+                for resource in getattr(self.entity_registry, f"{kind}_list")
+            ]
+            for kind in ("worker", "facility")
+        }
+
+        self.__initialize_task_state_counter()
+
+        self.__pert_updated_time = None
+        self.__task_state_changed = True
+
+        self.__initialize_allocation_index()
+        self.__initialize_recorder()
+        self.__record_required = True
+        self.__unrecorded_step_count = 0
+        self.__recorded_signature = None
+        if log_info:
+            self.__task_finish_step_dict = {}
+
     def check_state_component(self, component: BaseComponent):
         """
         Check and update the state of a component based on its targeted tasks.
@@ -660,6 +767,13 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         max_time: int = 10000,
         unit_time: int = 1,
         progress_bar: bool = False,
+        next_event_time_advance: bool = False,
+        rng: np.random.Generator | None = None,
+        pert_update_mode: PertUpdateMode = PertUpdateMode.FULL,
+        pert_update_interval: int = 1,
+        record_mode: RecordMode = RecordMode.LIST,
+        record_policy: RecordPolicy = RecordPolicy.FULL,
+        record_interval: int = 1,
     ):
         """
         Simulate this BaseProject.
@@ -693,14 +807,62 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                 Unit time of simulation. Defaults to 1.
             progress_bar (bool, optional):
                 Whether to show progress bar during simulation. Defaults to False.
+            next_event_time_advance (bool, optional):
+                Whether to skip the update and allocation phases of the steps in which
+                no state transition can happen. When a step changes nothing, the following
+                steps only perform and record until any task can finish or any absence
+                boundary is crossed. If the progress is deterministic, these steps are
+                calculated at once, otherwise they are performed one by one.
+                Simulation logs are identical to the ones of the step-by-step advance.
+                Defaults to False.
+            rng (numpy.random.Generator, optional):
+                Random generator for sampling skills and errors in this simulation.
+                Defaults to None -> global numpy.random.
+            pert_update_mode (PertUpdateMode, optional):
+                Calculation mode of PERT data of each workflow. Defaults to PertUpdateMode.FULL.
+            pert_update_interval (int, optional):
+                Number of steps between PERT data updates. PERT data is also updated
+                in the step after any task state changes. Defaults to 1 (every step).
+            record_mode (RecordMode, optional):
+                Storage of simulation logs. In COLUMNAR mode, the states, remaining work
+                amounts and costs are written into NumPy buffers, and the record lists of
+                tasks, components, workers, facilities, teams and workplaces are lazy views
+                of them. In RLE mode, the state records are RunLengthRecord which store
+                only the transitions of states. In both modes, the records of allocations
+                and placements store only their changes. Defaults to RecordMode.LIST.
+            record_policy (RecordPolicy, optional):
+                Steps in which the logs of instances are recorded. The logs of the other
+                steps hold the values of the last recorded step. In INTERVAL and
+                TRANSITION policies, the record lists are RunLengthRecord storing only
+                the recorded values except in COLUMNAR record mode. In NONE policy, only
+                the time, the status and the cost record list of this project are kept.
+                Defaults to RecordPolicy.FULL.
+            record_interval (int, optional):
+                Number of steps between records in INTERVAL policy. Defaults to 1.
+
+        Raises:
+            ValueError: If pert_update_interval or record_interval is less than 1.
         """
+        if pert_update_interval < 1:
+            raise ValueError("pert_update_interval should be 1 or more")
+        if record_interval < 1:
+            raise ValueError("record_interval should be 1 or more")
+
         if absence_time_list is None:
             absence_time_list = []
 
+        self.__pert_update_mode = pert_update_mode
+        self.__pert_update_time_interval = pert_update_interval * unit_time
+        self.__record_mode = record_mode
+        self.record_policy = record_policy
+        self.record_interval = record_interval
+
         self.initialize(state_info=initialize_state_info, log_info=initialize_log_info)
 
         self.simulation_mode = SimulationMode.FORWARD
 
+        self.rng = rng
+
         self.absence_time_list = absence_time_list
 
         self.perform_auto_task_while_absence_time = perform_auto_task_while_absence_time
@@ -711,14 +873,23 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
             else None
         )
 
+        if next_event_time_advance:
+            next_event_time_list = sorted(
+                self.__get_absence_boundary_time_set(absence_time_list, unit_time)
+            )
+
         try:
             while True:
+                if next_event_time_advance:
+                    signature_before_update = self.__get_transition_signature(
+                        error_tol=error_tol
+                    )
+
                 # 0. Update status
-                self.__update()
+                self.__update(error_tol=error_tol)
 
                 # 1. Check finished or not
-                state_list = set(map(lambda task: task.state, self.task_set))
-                if all(state == BaseTaskState.FINISHED for state in state_list):
+                if self.__is_all_task_finished():
                     self.status = BaseProjectStatus.FINISHED_SUCCESS
                     if pbar is not None:
                         pbar.n = self.time
@@ -764,15 +935,13 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
 
                 # Update state of task newly allocated workers and facilities (READY -> WORKING)
                 # Calculate total work amount once before processing all workflows
-                total_work_amount_in_working_tasks = sum(
-                    task.remaining_work_amount
-                    for task in self.task_set
-                    if task.state == BaseTaskState.WORKING
-                    and (
-                        count_auto_task_in_work_amount_limit
-                        or not task.auto_task
+                total_work_amount_in_working_tasks = None
+                if work_amount_limit_per_unit_time < math.inf:
+                    total_work_amount_in_working_tasks = (
+                        self.__get_working_remaining_work_amount(
+                            count_auto_task_in_work_amount_limit
+                        )
                     )
-                )
                 for workflow in self.workflow_set:
                     total_work_amount_in_working_tasks = self.check_state_workflow(
                         workflow,
@@ -786,26 +955,15 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                     for component in product.component_set:
                         self.check_state_component(component)
 
-                # 3. Pay cost to all workers and facilities in this time
-                cost_this_time = 0.0
-
-                add_zero_to_all_workers = False
-                add_zero_to_all_facilities = False
-                if not working:
-                    add_zero_to_all_workers = True
-                    add_zero_to_all_facilities = True
-
-                for team in self.team_set:
-                    cost_this_time += team.add_labor_cost(
-                        only_working=True,
-                        add_zero_to_all_workers=add_zero_to_all_workers,
+                if next_event_time_advance:
+                    steady = (
+                        signature_before_update is not None
+                        and signature_before_update
+                        == self.__get_transition_signature(error_tol=error_tol)
                     )
-                for workplace in self.workplace_set:
-                    cost_this_time += workplace.add_labor_cost(
-                        only_working=True,
-                        add_zero_to_all_facilities=add_zero_to_all_facilities,
-                    )
-                self.cost_record_list.append(cost_this_time)
+
+                # 3. Pay cost to all workers and facilities in this time
+                self.__add_labor_cost(working=working)
 
                 # 4, Perform
                 if working:
@@ -822,7 +980,19 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                 if pbar is not None:
                     pbar.update(unit_time)
 
+                # 7. Skip the steps until the next event if nothing changed
+                if next_event_time_advance and steady:
+                    self.__advance_to_next_event(
+                        working=working,
+                        next_event_time_list=next_event_time_list,
+                        max_time=max_time,
+                        unit_time=unit_time,
+                        pbar=pbar,
+                        error_tol=error_tol,
+                    )
+
         finally:
+            self.__record_unrecorded_step()
             if pbar is not None:
                 pbar.close()
 
@@ -841,6 +1011,13 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         progress_bar: bool = False,
         considering_due_time_of_tail_tasks: bool = False,
         reverse_log_information: bool = True,
+        next_event_time_advance: bool = False,
+        rng: np.random.Generator | None = None,
+        pert_update_mode: PertUpdateMode = PertUpdateMode.FULL,
+        pert_update_interval: int = 1,
+        record_mode: RecordMode = RecordMode.LIST,
+        record_policy: RecordPolicy = RecordPolicy.FULL,
+        record_interval: int = 1,
     ):
         """
         Simulate this BaseProject using backward simulation.
@@ -878,6 +1055,23 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                 Whether to consider due time of tail tasks. Defaults to False.
             reverse_log_information (bool, optional):
                 Whether to reverse simulation log information after simulation. Defaults to True.
+            next_event_time_advance (bool, optional):
+                Whether to skip the update and allocation phases of the steps in which
+                no state transition can happen. Defaults to False.
+            rng (numpy.random.Generator, optional):
+                Random generator for sampling skills and errors in this simulation.
+                Defaults to None -> global numpy.random.
+            pert_update_mode (PertUpdateMode, optional):
+                Calculation mode of PERT data of each workflow. Defaults to PertUpdateMode.FULL.
+            pert_update_interval (int, optional):
+                Number of steps between PERT data updates. Defaults to 1 (every step).
+            record_mode (RecordMode, optional):
+                Storage of simulation logs. Defaults to RecordMode.LIST.
+            record_policy (RecordPolicy, optional):
+                Steps in which the logs of instances are recorded.
+                Defaults to RecordPolicy.FULL.
+            record_interval (int, optional):
+                Number of steps between records in INTERVAL policy. Defaults to 1.
 
         Note:
             This function is experimental and mainly for research use.
@@ -939,6 +1133,13 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                 max_time=max_time,
                 unit_time=unit_time,
                 progress_bar=progress_bar,
+                next_event_time_advance=next_event_time_advance,
+                rng=rng,
+                pert_update_mode=pert_update_mode,
+                pert_update_interval=pert_update_interval,
+                record_mode=record_mode,
+                record_policy=record_policy,
+                record_interval=record_interval,
             )
 
         finally:
@@ -978,6 +1179,452 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                 if hasattr(workplace, "original_output_workplace_id_set"):
                     del workplace.original_output_workplace_id_set
 
+    def simulate_monte_carlo(
+        self,
+        n_runs: int,
+        seed: int | None = None,
+        task_priority_rule: TaskPriorityRuleMode = TaskPriorityRuleMode.TSLACK,
+        error_tol: float = 1e-10,
+        work_amount_limit_per_unit_time: float = 1e10,
+        count_auto_task_in_work_amount_limit: bool = False,
+        absence_time_list: list[int] | None = None,
+        perform_auto_task_while_absence_time: bool = False,
+        max_time: int = 10000,
+        unit_time: int = 1,
+        progress_bar: bool = False,
+        next_event_time_advance: bool = False,
+        pert_update_mode: PertUpdateMode = PertUpdateMode.FULL,
+        pert_update_interval: int = 1,
+        record_mode: RecordMode = RecordMode.LIST,
+        record_policy: RecordPolicy = RecordPolicy.FULL,
+        record_interval: int = 1,
+    ):
+        """
+        Simulate this BaseProject repeatedly and summarize the results of each run.
+
+        This is a convenience API over `simulate`, not a faster one. Each run is
+        a full call of `simulate` with a random generator shared by all runs,
+        so the cost of n_runs runs is the same as the one of n_runs calls.
+        Use `simulate_parallel` to spread runs over processes, and
+        RecordPolicy.NONE to skip the logs which are not summarized here.
+
+        This project is initialized and reused in each run, so the simulation
+        result of the last run remains in this project after this method.
+        Time over warnings of each run are suppressed and reported by "status",
+        while other warnings are raised as usual.
+
+        Args:
+            n_runs (int):
+                Number of simulation runs.
+            seed (int, optional):
+                Seed of the random generator shared by all runs. Defaults to None.
+            task_priority_rule (TaskPriorityRuleMode, optional):
+                Task priority rule for simulation. Defaults to TaskPriorityRuleMode.TSLACK.
+            error_tol (float, optional):
+                Measures against numerical error. Defaults to 1e-10.
+            work_amount_limit_per_unit_time (float, optional):
+                Upper limit on the total remaining work amount that can be in the
+                WORKING state at any given time. Defaults to 1e10.
+            count_auto_task_in_work_amount_limit (bool, optional):
+                Whether auto tasks should be counted toward the work amount limit.
+                Defaults to False.
+            absence_time_list (list[int], optional):
+                List of absence times in simulation. Defaults to None (workers work every time).
+            perform_auto_task_while_absence_time (bool, optional):
+                Whether to perform auto tasks during absence time. Defaults to False.
+            max_time (int, optional):
+                Maximum simulation time of each run. Defaults to 10000.
+            unit_time (int, optional):
+                Unit time of simulation. Defaults to 1.
+            progress_bar (bool, optional):
+                Whether to show progress bar of runs. Defaults to False.
+            next_event_time_advance (bool, optional):
+                Whether to skip the update and allocation phases of the steps in which
+                no state transition can happen. Defaults to False.
+            pert_update_mode (PertUpdateMode, optional):
+                Calculation mode of PERT data of each workflow. Defaults to PertUpdateMode.FULL.
+            pert_update_interval (int, optional):
+                Number of steps between PERT data updates. Defaults to 1 (every step).
+            record_mode (RecordMode, optional):
+                Storage of simulation logs. Defaults to RecordMode.LIST.
+            record_policy (RecordPolicy, optional):
+                Steps in which the logs of instances are recorded.
+                Defaults to RecordPolicy.FULL.
+            record_interval (int, optional):
+                Number of steps between records in INTERVAL policy. Defaults to 1.
+
+        Returns:
+            dict: Summary of runs with the following keys.
+                - "task_id_list" (list[str]): IDs of tasks in the column order of "task_finish_time".
+                - "status" (numpy.ndarray): BaseProjectStatus value of each run.
+                - "makespan" (numpy.ndarray): Simulation time at the end of each run.
+                - "total_cost" (numpy.ndarray): Total cost of each run.
+                - "task_finish_time" (numpy.ndarray): Finish time of each task in each run
+                  with shape (n_runs, number of tasks). NaN if the task is not finished.
+
+        Raises:
+            ValueError: If n_runs is not positive.
+        """
+        if n_runs <= 0:
+            raise ValueError("n_runs should be positive")
+
+        rng = np.random.default_rng(seed)
+
+        task_list = [
+            task for workflow in self.workflow_set for task in workflow.task_set
+        ]
+        status_array = np.zeros(n_runs, dtype=np.int8)
+        makespan_array = np.zeros(n_runs, dtype=np.float64)
+        total_cost_array = np.zeros(n_runs, dtype=np.float64)
+        task_finish_time_array = np.full((n_runs, len(task_list)), np.nan)
+
+        run_range = (
+            tqdm(range(n_runs), desc="Monte Carlo", unit="run")
+            if progress_bar
+            else range(n_runs)
+        )
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore", message="Time Over!", category=UserWarning
+            )
+            for i in run_range:
+                self.simulate(
+                    task_priority_rule=task_priority_rule,
+                    error_tol=error_tol,
+                    work_amount_limit_per_unit_time=work_amount_limit_per_unit_time,
+                    count_auto_task_in_work_amount_limit=count_auto_task_in_work_amount_limit,
+                    absence_time_list=absence_time_list,
+                    perform_auto_task_while_absence_time=perform_auto_task_while_absence_time,
+                    max_time=max_time,
+                    unit_time=unit_time,
+                    next_event_time_advance=next_event_time_advance,
+                    rng=rng,
+                    pert_update_mode=pert_update_mode,
+                    pert_update_interval=pert_update_interval,
+                    record_mode=record_mode,
+                    record_policy=record_policy,
+                    record_interval=record_interval,
+                )
+                status_array[i] = self.status
+                makespan_array[i] = self.time
+                total_cost_array[i] = sum(self.cost_record_list)
+                task_finish_time_array[i] = self.get_task_finish_time_list(task_list)
+
+        return {
+            "task_id_list": [task.ID for task in task_list],
+            "status": status_array,
+            "makespan": makespan_array,
+            "total_cost": total_cost_array,
+            "task_finish_time": task_finish_time_array,
+        }
+
+    def simulate_parallel(
+        self,
+        n_runs: int | None = None,
+        seed: int | None = None,
+        simulate_kwargs_list: list[dict] | None = None,
+        max_workers: int | None = None,
+        chunksize: int = 1,
+        **simulate_kwargs,
+    ):
+        """
+        Simulate replications of this BaseProject in a process pool.
+
+        This project is serialized once per worker process and is not changed by this method.
+
+        Args:
+            n_runs (int, optional):
+                Number of seeded replications with the same simulation settings.
+                Defaults to None -> len(simulate_kwargs_list).
+            seed (int, optional):
+                Root seed of replications. Defaults to None.
+            simulate_kwargs_list (list[dict], optional):
+                Keyword arguments of simulate for each parameter variant. Defaults to None.
+            max_workers (int, optional):
+                Maximum number of worker processes. Defaults to None -> number of CPUs.
+            chunksize (int, optional):
+                Number of replications sent to a worker at once. Defaults to 1.
+            **simulate_kwargs:
+                Keyword arguments of simulate common to all replications.
+
+        Returns:
+            Iterator[dict]: Summary of each replication streamed in the order of replications.
+                See pDESy.model.parallel_utils.iter_parallel_simulation for details.
+
+        Raises:
+            ValueError: If the arguments are rejected by iter_parallel_simulation,
+                e.g. rng is given, because each replication uses its own generator.
+        """
+        return iter_parallel_simulation(
+            self,
+            n_runs=n_runs,
+            seed=seed,
+            simulate_kwargs_list=simulate_kwargs_list,
+            max_workers=max_workers,
+            chunksize=chunksize,
+            **simulate_kwargs,
+        )
+
+    def __get_snapshot_attr_spec_list(self):
+        """
+        Get the changeable attributes of instances captured by snapshot.
+
+        Returns:
+            list[tuple]: Kind of instances in the entity registry, and the list of
+                attribute names with the value types of encode_value_list.
+        """
+        return [
+            ("workflow", [("critical_path_length", float)]),
+            (
+                "task",
+                [
+                    ("state", BaseTaskState),
+                    ("remaining_work_amount", float),
+                    ("actual_work_amount", float),
+                    ("additional_task_flag", bool),
+                    ("est", float),
+                    ("eft", float),
+                    ("lst", float),
+                    ("lft", float),
+                    ("allocated_worker_facility_id_tuple_set", None),
+                    ("state_record_list", [BaseTaskState]),
+                    ("remaining_work_amount_record_list", [float]),
+                    ("allocated_worker_facility_id_tuple_set_record_list", [None]),
+                ],
+            ),
+            (
+                "component",
+                [
+                    ("state", BaseComponentState),
+                    ("placed_workplace_id", None),
+                    ("error", float),
+                    ("state_record_list", [BaseComponentState]),
+                    ("placed_workplace_id_record_list", [None]),
+                ],
+            ),
+            ("team", [("cost_record_list", [float])]),
+            (
+                "worker",
+                [
+                    ("state", BaseWorkerState),
+                    (BaseWorker._assigned_pairs_attr_name, None),
+                    ("state_record_list", [BaseWorkerState]),
+                    ("cost_record_list", [float]),
+                    (BaseWorker._assigned_record_attr_name, [None]),
+                ],
+            ),
+            (
+                "workplace",
+                [
+                    ("placed_component_id_set", None),
+                    ("available_space_size", float),
+                    ("cost_record_list", [float]),
+                    ("placed_component_id_set_record_list", [None]),
+                ],
+            ),
+            (
+                "facility",
+                [
+                    ("state", BaseFacilityState),
+                    (BaseFacility._assigned_pairs_attr_name, None),
+                    ("state_record_list", [BaseFacilityState]),
+                    ("cost_record_list", [float]),
+                    (BaseFacility._assigned_record_attr_name, [None]),
+                ],
+            ),
+        ]
+
+    def snapshot(self) -> bytes:
+        """
+        Take a snapshot of all changeable variables of this project.
+
+        The snapshot captures the states, remaining work amounts, allocations, placements
+        and logs of all instances, the time, cost records, status and record policy of
+        this project, and the state of the random generator used in simulation.
+        States and numeric values are stored as NumPy arrays in the order of the entity
+        registry, so that the snapshot is compact.
+
+        A simulation can be branched from a snapshot by `restore` and
+        `simulate(initialize_state_info=False, initialize_log_info=False, rng=project.rng)`.
+
+        Returns:
+            bytes: Snapshot of this project.
+        """
+        self.__initialize_child_instance_set_id_instance_dict()
+        registry = self.entity_registry
+
+        instance_data = {}
+        for kind, attr_spec_list in self.__get_snapshot_attr_spec_list():
+            instance_list = getattr(registry, f"{kind}_list")
+            for attr_name, value_type in attr_spec_list:
+                if isinstance(value_type, list):
+                    instance_data[(kind, attr_name)] = [
+                        encode_value_list(getattr(instance, attr_name), value_type[0])
+                        for instance in instance_list
+                    ]
+                else:
+                    instance_data[(kind, attr_name)] = encode_value_list(
+                        (getattr(instance, attr_name) for instance in instance_list),
+                        value_type,
+                    )
+
+        if self.rng is not None:
+            rng_state = ("generator", self.rng.bit_generator.state)
+        else:
+            rng_state = ("global", np.random.get_state())
+
+        return dump_snapshot(
+            {
+                "id_list_dict": {
+                    kind: registry.get_id_list(kind) for kind in registry.KIND_LIST
+                },
+                "project": {
+                    "time": self.time,
+                    "cost_record_list": encode_value_list(self.cost_record_list, float),
+                    "simulation_mode": int(self.simulation_mode),
+                    "status": int(self.status),
+                    "absence_time_list": list(self.absence_time_list),
+                    "perform_auto_task_while_absence_time": (
+                        self.perform_auto_task_while_absence_time
+                    ),
+                    "record_policy": int(self.record_policy),
+                    "record_interval": self.record_interval,
+                    "task_finish_step_dict": dict(self.__task_finish_step_dict),
+                    "rng_state": rng_state,
+                },
+                "instance": instance_data,
+            }
+        )
+
+    def restore(self, snapshot: bytes):
+        """
+        Restore all changeable variables of this project from a snapshot.
+
+        The snapshot should be taken by `snapshot` of this project or of a project which
+        has the instances with the same IDs, e.g. the one read from the same JSON file.
+        If the snapshot was taken with a random generator, `rng` of this project is set
+        to the generator at the time of the snapshot.
+        Snapshots are unpickled, so only restore snapshots from trusted sources.
+
+        Args:
+            snapshot (bytes): Snapshot taken by `snapshot`.
+
+        Raises:
+            ValueError: If the snapshot does not match the instances of this project.
+        """
+        data = load_snapshot(snapshot)
+        self.__initialize_child_instance_set_id_instance_dict()
+        registry = self.entity_registry
+
+        instance_list_dict = {}
+        for kind, ID_list in data["id_list_dict"].items():
+            index_dict = getattr(registry, f"{kind}_index_dict")
+            if len(ID_list) != len(index_dict) or any(
+                ID not in index_dict for ID in ID_list
+            ):
+                raise ValueError(f"snapshot does not match the {kind}s of this project")
+            instance_list = getattr(registry, f"{kind}_list")
+            instance_list_dict[kind] = [instance_list[index_dict[ID]] for ID in ID_list]
+
+        instance_data = data["instance"]
+        for kind, attr_spec_list in self.__get_snapshot_attr_spec_list():
+            instance_list = instance_list_dict[kind]
+            for attr_name, value_type in attr_spec_list:
+                encoded = instance_data[(kind, attr_name)]
+                if isinstance(value_type, list):
+                    for instance, encoded_record in zip(instance_list, encoded):
+                        setattr(
+                            instance,
+                            attr_name,
+                            decode_value_list(encoded_record, value_type[0]),
+                        )
+                else:
+                    for instance, value in zip(
+                        instance_list, decode_value_list(encoded, value_type)
+                    ):
+                        setattr(instance, attr_name, value)
+
+        project_data = data["project"]
+        self.time = project_data["time"]
+        self.cost_record_list = decode_value_list(
+            project_data["cost_record_list"], float
+        )
+        self.simulation_mode = SimulationMode(project_data["simulation_mode"])
+        self.status = BaseProjectStatus(project_data["status"])
+        self.absence_time_list = project_data["absence_time_list"]
+        self.perform_auto_task_while_absence_time = project_data[
+            "perform_auto_task_while_absence_time"
+        ]
+        self.record_policy = RecordPolicy(project_data["record_policy"])
+        self.record_interval = project_data["record_interval"]
+        self.__task_finish_step_dict = project_data["task_finish_step_dict"]
+
+        rng_type, rng_state = project_data["rng_state"]
+        if rng_type == "global":
+            np.random.set_state(rng_state)
+        else:
+            if not (
+                isinstance(self.rng, np.random.Generator)
+                and self.rng.bit_generator.state["bit_generator"]
+                == rng_state["bit_generator"]
+            ):
+                self.rng = np.random.Generator(
+                    getattr(np.random, rng_state["bit_generator"])()
+                )
+            self.rng.bit_generator.state = rng_state
+
+        # Indices and counters of simulation are rebuilt by the next initialize.
+        self.__task_priority_queue = None
+        self.__ready_candidate_dict = None
+        self.__working_task_count_list_dict = {}
+        self.__task_state_count_dict = {}
+        self.__ready_task_set = set()
+        self.__working_task_set_dict = {}
+        self.__working_remaining_work_amount_dict = {}
+
+    def get_task_finish_time_list(self, task_list: list[BaseTask] | None = None):
+        """
+        Get the finish time of tasks in the last simulation.
+
+        Args:
+            task_list (list[BaseTask], optional):
+                Target tasks. Defaults to None -> all tasks in this project.
+
+        Returns:
+            list[float]: Finish step time of each task, i.e. the step in which
+                the task became FINISHED. NaN if the task is not finished.
+                The finish steps are stored in simulation for every record policy,
+                and are written and read with the logs by write_simple_json and
+                write_simulation_result. For logs read from files of older versions,
+                the index of the first FINISHED record is used instead, which is
+                the step of the first record after finishing in RecordPolicy.INTERVAL.
+        """
+        if task_list is None:
+            task_list = [
+                task for workflow in self.workflow_set for task in workflow.task_set
+            ]
+        finish_time_list = []
+        for task in task_list:
+            if task.state is not BaseTaskState.FINISHED:
+                finish_time_list.append(np.nan)
+                continue
+            finish_step = self.__task_finish_step_dict.get(task.ID, None)
+            if finish_step is not None:
+                finish_time_list.append(float(finish_step))
+                continue
+            if self.record_policy == RecordPolicy.NONE:
+                # Logs of tasks are not recorded.
+                finish_time_list.append(np.nan)
+                continue
+            try:
+                finish_time_list.append(
+                    float(task.state_record_list.index(BaseTaskState.FINISHED))
+                )
+            except ValueError:
+                # Finished at the last update, which is not recorded.
+                finish_time_list.append(float(len(task.state_record_list)))
+        return finish_time_list
+
     def reverse_log_information(self):
         """
         Reverse the log information for the project and all its elements.
@@ -999,6 +1646,11 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                 )
             )
         )
+        # Align the finish steps with the first FINISHED index of reversed records.
+        self.__task_finish_step_dict = {
+            task_id: 0 if step < total_step_length else total_step_length
+            for task_id, step in self.__task_finish_step_dict.items()
+        }
         for product in self.product_set:
             product.reverse_log_information()
         for workflow in self.workflow_set:
@@ -1008,79 +1660,793 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         for workplace in self.workplace_set:
             workplace.reverse_log_information()
 
+    def __add_labor_cost(self, working: bool = True):
+        self.__record_required = self.__is_record_required(working=working)
+        if not self.__record_required:
+            self.cost_record_list.append(self.__get_labor_cost(working=working))
+            return
+        self.__record_unrecorded_step()
+        if self.__recorder is not None:
+            self.__add_labor_cost_to_recorder(working=working)
+            return
+        cost_this_time = 0.0
+        for team in self.team_set:
+            cost_this_time += team.add_labor_cost(
+                only_working=True,
+                add_zero_to_all_workers=not working,
+            )
+        for workplace in self.workplace_set:
+            cost_this_time += workplace.add_labor_cost(
+                only_working=True,
+                add_zero_to_all_facilities=not working,
+            )
+        self.cost_record_list.append(cost_this_time)
+
+    def __get_labor_cost(self, working: bool = True) -> float:
+        """
+        Get labor cost in this time without recording the costs of instances.
+        The costs are summed up in the same order as __add_labor_cost.
+        """
+        cost_this_time = 0.0
+        if not working:
+            return cost_this_time
+        for collection_set, child_set_attr_name, working_state in (
+            (self.team_set, "worker_set", BaseWorkerState.WORKING),
+            (self.workplace_set, "facility_set", BaseFacilityState.WORKING),
+        ):
+            for collection in collection_set:
+                collection_cost = 0.0
+                for child in getattr(collection, child_set_attr_name):
+                    if child.state == working_state:
+                        collection_cost += child.cost_per_time
+                cost_this_time += collection_cost
+        return cost_this_time
+
+    def __is_record_required(self, working: bool = True) -> bool:
+        """Judge whether the logs of instances are recorded in this step."""
+        if self.record_policy == RecordPolicy.FULL:
+            return True
+        if self.record_policy == RecordPolicy.NONE:
+            return False
+        if self.record_policy == RecordPolicy.INTERVAL:
+            return len(self.cost_record_list) % self.record_interval == 0
+        signature = (
+            working,
+            tuple(
+                (task.state, task.allocated_worker_facility_id_tuple_set)
+                for task in self.task_set
+            ),
+            tuple(
+                (component.state, component.placed_workplace_id)
+                for component in self.component_set
+            ),
+            tuple(worker.state for worker in self.worker_set),
+            tuple(facility.state for facility in self.facility_set),
+        )
+        if signature == self.__recorded_signature:
+            return False
+        self.__recorded_signature = signature
+        return True
+
+    def __get_record_attr_name_list(self):
+        """
+        Get the pairs of the instance set and the names of its record lists,
+        which are recorded in each step except the cost record list of this project.
+        """
+        return [
+            (
+                self.task_set,
+                [
+                    "state_record_list",
+                    "remaining_work_amount_record_list",
+                    "allocated_worker_facility_id_tuple_set_record_list",
+                ],
+            ),
+            (
+                self.component_set,
+                ["state_record_list", "placed_workplace_id_record_list"],
+            ),
+            (self.team_set, ["cost_record_list"]),
+            (
+                self.worker_set,
+                [
+                    "state_record_list",
+                    "cost_record_list",
+                    BaseWorker._assigned_record_attr_name,
+                ],
+            ),
+            (
+                self.workplace_set,
+                ["cost_record_list", "placed_component_id_set_record_list"],
+            ),
+            (
+                self.facility_set,
+                [
+                    "state_record_list",
+                    "cost_record_list",
+                    BaseFacility._assigned_record_attr_name,
+                ],
+            ),
+        ]
+
+    def __record_unrecorded_step(self):
+        """
+        Fill the logs of the steps which are not recorded since the last recorded
+        step with the values of the last recorded step.
+
+        In INTERVAL and TRANSITION policies, the record lists other than the views
+        of COLUMNAR record mode are RunLengthRecord, so that filling the steps only
+        extends the last run and only the recorded values and their start steps
+        are stored. In COLUMNAR record mode, the rows of the recorder are repeated.
+        """
+        n = self.__unrecorded_step_count
+        self.__unrecorded_step_count = 0
+        if n == 0:
+            return
+        if self.__recorder is not None:
+            self.__recorder.repeat_last_row(n)
+        for instance_set, attr_name_list in self.__get_record_attr_name_list():
+            for instance in instance_set:
+                for attr_name in attr_name_list:
+                    record_list = getattr(instance, attr_name)
+                    if not isinstance(record_list, ColumnarRecord):
+                        repeat_last_record(record_list, n)
+
+    def __add_labor_cost_to_recorder(self, working: bool = True):
+        """
+        Add labor cost as __add_labor_cost by appending rows to the recorder.
+        The costs are summed up in the same order as BaseTeam.add_labor_cost
+        and BaseWorkplace.add_labor_cost.
+        """
+        recorder = self.__recorder
+        cost_this_time = 0.0
+        for collection_name, child_name, child_set_attr_name, working_state in (
+            ("team", "worker", "worker_set", BaseWorkerState.WORKING),
+            ("workplace", "facility", "facility_set", BaseFacilityState.WORKING),
+        ):
+            collection_cost_row = []
+            child_cost_row = []
+            for collection in recorder.instance_list_dict[f"{collection_name}_cost"]:
+                collection_cost = 0.0
+                for child in getattr(collection, child_set_attr_name):
+                    if working and child.state == working_state:
+                        child_cost_row.append(child.cost_per_time)
+                        collection_cost += child.cost_per_time
+                    else:
+                        child_cost_row.append(0.0)
+                collection_cost_row.append(collection_cost)
+                cost_this_time += collection_cost
+            recorder.append_row(f"{collection_name}_cost", collection_cost_row)
+            recorder.append_row(f"{child_name}_cost", child_cost_row)
+        self.cost_record_list.append(cost_this_time)
+
+    def __get_absence_boundary_time_set(
+        self, absence_time_list: list[int], unit_time: int = 1
+    ):
+        """
+        Get the set of times at which the absence state of the project,
+        any worker or any facility differs from the one of the previous step.
+        """
+        time_list_list = [absence_time_list]
+        time_list_list.extend(worker.absence_time_list for worker in self.worker_set)
+        time_list_list.extend(
+            facility.absence_time_list for facility in self.facility_set
+        )
+        boundary_time_set = set()
+        for time_list in time_list_list:
+            time_set = set(time_list)
+            for time in time_set:
+                if time - unit_time not in time_set:
+                    boundary_time_set.add(time)
+                if time + unit_time not in time_set:
+                    boundary_time_set.add(time + unit_time)
+        return boundary_time_set
+
+    def __get_transition_signature(self, error_tol: float = 1e-10):
+        """
+        Get the discrete state of this project which is used for judging that
+        a step changed nothing. Return None if a state transition is pending,
+        i.e. a WORKING task can finish or a READY task waits for the work amount limit.
+        """
+        READY = BaseTaskState.READY
+        WORKING = BaseTaskState.WORKING
+        task_signature_list = []
+        for task in self.task_set:
+            if task.state is READY and (
+                task.auto_task or task.allocated_worker_facility_id_tuple_set
+            ):
+                return None
+            if task.state is WORKING and task.remaining_work_amount < error_tol:
+                return None
+            task_signature_list.append(
+                (task.state, task.allocated_worker_facility_id_tuple_set)
+            )
+        return (
+            tuple(task_signature_list),
+            tuple(component.placed_workplace_id for component in self.component_set),
+        )
+
+    def __advance_to_next_event(
+        self,
+        working: bool,
+        next_event_time_list: list[int],
+        max_time: int,
+        unit_time: int = 1,
+        pbar=None,
+        error_tol: float = 1e-10,
+    ):
+        """
+        Advance the steps until any task can finish or any absence boundary is
+        crossed, without updating states or allocating resources.
+        The last step did not change any state, so neither can these steps.
+
+        If the progress of all performing tasks is deterministic, i.e. the standard
+        deviations of skills are 0, no quality skill is used and no skill method is
+        overridden, the number of steps is calculated from the remaining work amounts
+        and the work, costs and records of all steps are applied at once. Otherwise,
+        the steps are performed and recorded one by one.
+        """
+        n_step = self.__get_step_count_to_next_event(
+            next_event_time_list, max_time, unit_time
+        )
+        if n_step == 0:
+            return
+
+        if working:
+            performing_task_list = self.__get_performing_task_list()
+        elif self.perform_auto_task_while_absence_time:
+            performing_task_list = self.__get_performing_task_list(only_auto_task=True)
+        else:
+            performing_task_list = []
+        if any(
+            task.remaining_work_amount < error_tol for task in performing_task_list
+        ):
+            # The last step finished a task, which is updated in the next step.
+            return
+        sample_dict = self.__get_progress_sample_dict(performing_task_list)
+        if (
+            np.any(sample_dict["sd"] != 0.0)
+            or len(sample_dict["quality_mean"]) > 0
+            or sample_dict["hook_resource"]
+            or sample_dict["quality_hook_worker"]
+        ):
+            self.__advance_step_by_step(
+                working, performing_task_list, n_step, unit_time, pbar, error_tol
+            )
+            return
+
+        # The progress of each step is the same as the one of __perform.
+        n_normal = len(sample_dict["mean"])
+        progress_array, _ = self.__get_progress(sample_dict, np.zeros(n_normal))
+        remaining_work_amount_array = np.array(
+            [task.remaining_work_amount for task in performing_task_list]
+        )
+        moving = progress_array > 0.0
+        if np.any(moving):
+            # Estimate the steps until the first finish, which are checked below.
+            n_finish_step = np.ceil(
+                (remaining_work_amount_array[moving] - error_tol)
+                / progress_array[moving]
+            ).min()
+            n_step = int(min(n_step, max(n_finish_step, 0) + 2))
+
+        # Subtract the progress step by step as __perform to keep the rounding.
+        step_array = np.empty((n_step + 1, len(performing_task_list)))
+        step_array[0] = remaining_work_amount_array
+        step_array[1:] = progress_array
+        remaining_work_amount_step_array = np.subtract.accumulate(step_array, axis=0)[
+            1:
+        ]
+        finished_step_array = np.flatnonzero(
+            (remaining_work_amount_step_array < error_tol).any(axis=1)
+        )
+        if len(finished_step_array) > 0:
+            n_step = int(finished_step_array[0]) + 1
+            remaining_work_amount_step_array = remaining_work_amount_step_array[
+                :n_step
+            ]
+
+        # Draw the samples of the skipped steps to keep the random number stream.
+        rng = self.rng if self.rng is not None else np.random
+        n_random = sum(
+            task.target_component_id is not None for task in performing_task_list
+        )
+        if n_random == 0:
+            rng.standard_normal(n_normal * n_step)
+        elif n_normal == 0:
+            rng.random(n_random * n_step)
+        else:
+            for _ in range(n_step):
+                rng.standard_normal(n_normal)
+                rng.random(n_random)
+
+        self.__record_in_bulk(
+            working, performing_task_list, remaining_work_amount_step_array
+        )
+        if self.__task_priority_queue is not None:
+            self.__task_priority_queue.mark_changed(
+                task.ID for task in performing_task_list
+            )
+
+        working_remaining_work_amount_dict = self.__working_remaining_work_amount_dict
+        for task, remaining_work_amount in zip(
+            performing_task_list, remaining_work_amount_step_array[-1].tolist()
+        ):
+            if working_remaining_work_amount_dict:
+                working_remaining_work_amount_dict[task.auto_task] += (
+                    remaining_work_amount - task.remaining_work_amount
+                )
+            task.remaining_work_amount = remaining_work_amount
+
+        self.time = self.time + unit_time * n_step
+        if pbar is not None:
+            pbar.update(unit_time * n_step)
+
+    def __get_step_count_to_next_event(
+        self, next_event_time_list: list[int], max_time: int, unit_time: int = 1
+    ) -> int:
+        """Get the number of steps until max_time or the next absence boundary."""
+        if self.time >= max_time:
+            return 0
+        n_step = -(-(max_time - self.time) // unit_time)
+        for time in next_event_time_list[
+            bisect_left(next_event_time_list, self.time) :
+        ]:
+            if time >= self.time + unit_time * n_step:
+                break
+            if (time - self.time) % unit_time == 0:
+                return (time - self.time) // unit_time
+        return n_step
+
+    def __advance_step_by_step(
+        self,
+        working: bool,
+        performing_task_list: list[BaseTask],
+        n_step: int,
+        unit_time: int = 1,
+        pbar=None,
+        error_tol: float = 1e-10,
+    ):
+        """Perform and record the steps of __advance_to_next_event one by one."""
+        for _ in range(n_step):
+            if any(
+                task.remaining_work_amount < error_tol
+                for task in performing_task_list
+            ):
+                return
+            self.__add_labor_cost(working=working)
+            if working:
+                self.__perform(only_auto_task=False, task_list=performing_task_list)
+            elif self.perform_auto_task_while_absence_time:
+                self.__perform(only_auto_task=True, task_list=performing_task_list)
+            self.__record(working=working)
+            self.time = self.time + unit_time
+
+            if pbar is not None:
+                pbar.update(unit_time)
+
+    def __record_in_bulk(
+        self,
+        working: bool,
+        performing_task_list: list[BaseTask],
+        remaining_work_amount_step_array: np.ndarray,
+    ):
+        """
+        Record the steps skipped by __advance_to_next_event at once.
+
+        States, allocations and costs of these steps are the same as the ones of
+        the last step, so only the remaining work amounts of performing tasks differ.
+        Remaining work amounts of tasks are set to the ones of each recorded step.
+        """
+        n_step = len(remaining_work_amount_step_array)
+        cost = self.cost_record_list[-1]
+        n_recorded_step = len(self.cost_record_list)
+
+        self.__add_ready_record_count(working=working, n_step=n_step)
+
+        if self.record_policy == RecordPolicy.FULL:
+            # The last step is recorded, so the records are repeated and
+            # the remaining work amounts are overwritten.
+            self.cost_record_list.extend([cost] * n_step)
+            self.__unrecorded_step_count += n_step
+            self.__record_unrecorded_step()
+            for task, remaining_work_amount_list in zip(
+                performing_task_list, remaining_work_amount_step_array.T.tolist()
+            ):
+                set_last_records(
+                    task.remaining_work_amount_record_list,
+                    remaining_work_amount_list,
+                )
+            return
+
+        recorded_step_list = []
+        if self.record_policy == RecordPolicy.INTERVAL:
+            first_step = -n_recorded_step % self.record_interval
+            recorded_step_list = list(range(first_step, n_step, self.record_interval))
+        # In TRANSITION policy, nothing changes and nothing is recorded.
+        previous_step = 0
+        for step in recorded_step_list:
+            self.cost_record_list.extend([cost] * (step - previous_step))
+            self.__unrecorded_step_count += step - previous_step
+            for task, remaining_work_amount in zip(
+                performing_task_list, remaining_work_amount_step_array[step].tolist()
+            ):
+                task.remaining_work_amount = remaining_work_amount
+            self.__add_labor_cost(working=working)
+            self.__record_instance(working=working)
+            previous_step = step + 1
+        self.cost_record_list.extend([cost] * (n_step - previous_step))
+        if self.record_policy != RecordPolicy.NONE:
+            self.__unrecorded_step_count += n_step - previous_step
+
     def __perform(
         self,
         only_auto_task: bool = False,
         seed=None,
         increase_component_error: float = 1.0,
+        task_list: list[BaseTask] | None = None,
     ):
-        for workflow in self.workflow_set:
-
-            for task in workflow.task_set:
-                if only_auto_task:
-                    if task.auto_task:
-                        self.__perform_task(task, seed=seed)
-                else:
-                    self.__perform_task(
-                        task,
-                        seed=seed,
-                        increase_component_error=increase_component_error,
-                    )
+        if seed is not None:
+            np.random.seed(seed=seed)
+        rng = self.rng if self.rng is not None else np.random
 
-    def __perform_task(
-        self, task: BaseTask, seed=None, increase_component_error: float = 1.0
-    ):
-        if task.state == BaseTaskState.WORKING:
-            work_amount_progress = 0.0
-            no_error_probability = 1.0
-            if task.auto_task:
-                work_amount_progress = task.work_amount_progress_of_unit_step_time
-            else:
-                if task.need_facility:
-                    for (
-                        worker_id,
-                        facility_id,
-                    ) in task.allocated_worker_facility_id_tuple_set:
-                        worker = self.worker_dict.get(worker_id, None)
-                        w_progress = self.get_work_amount_skill_progress(
-                            worker, task.name, seed=seed
-                        )
-                        facility = self.facility_dict.get(facility_id, None)
-                        f_progress = self.get_work_amount_skill_progress(
-                            facility, task.name, seed=seed
-                        )
-                        work_amount_progress += w_progress * f_progress
-                        no_error_probability = (
-                            no_error_probability
-                            - worker.get_quality_skill_point(task.name, seed=seed)
-                        )
-                else:
-                    for worker_id, _ in task.allocated_worker_facility_id_tuple_set:
-                        worker = self.worker_dict.get(worker_id, None)
-                        work_amount_progress = (
-                            work_amount_progress
-                            + self.get_work_amount_skill_progress(
-                                worker, task.name, seed=seed
-                            )
-                        )
-                        no_error_probability = (
-                            no_error_probability
-                            - worker.get_quality_skill_point(task.name, seed=seed)
-                        )
+        performing_task_list = self.__get_performing_task_list(
+            only_auto_task=only_auto_task, task_list=task_list
+        )
+        if len(performing_task_list) == 0:
+            return
 
-            task.remaining_work_amount = (
-                task.remaining_work_amount - work_amount_progress
+        # 1. Gather skill distributions of the current allocation as arrays
+        sample_dict = self.__get_progress_sample_dict(performing_task_list)
+        if sample_dict["hook_resource"]:
+            sample_dict["hook_progress"] = np.array(
+                [
+                    self.get_work_amount_skill_progress(resource, task_name, rng=rng)
+                    for resource, task_name in sample_dict["hook_resource"]
+                ],
+                dtype=float,
+            )
+        if sample_dict["quality_hook_worker"]:
+            sample_dict["hook_quality"] = np.array(
+                [
+                    worker.get_quality_skill_point(task_name, rng=rng)
+                    for worker, task_name in sample_dict["quality_hook_worker"]
+                ],
+                dtype=float,
             )
 
+        # 2. Draw all samples of this step at once
+        normal_array = rng.standard_normal(
+            len(sample_dict["mean"]) + len(sample_dict["quality_mean"])
+        )
+
+        # 3. Calculate the progress and the probability of no error of each task
+        progress_array, no_error_probability_array = self.__get_progress(
+            sample_dict, normal_array
+        )
+
+        # 4. Subtract from remaining work amount
+        remaining_work_amount_array = (
+            np.array([task.remaining_work_amount for task in performing_task_list])
+            - progress_array
+        )
+        if self.__task_priority_queue is not None:
+            self.__task_priority_queue.mark_changed(
+                task.ID for task in performing_task_list
+            )
+        working_remaining_work_amount_dict = self.__working_remaining_work_amount_dict
+        for task, remaining_work_amount, no_error_probability in zip(
+            performing_task_list,
+            remaining_work_amount_array.tolist(),
+            no_error_probability_array.tolist(),
+        ):
+            if working_remaining_work_amount_dict:
+                working_remaining_work_amount_dict[task.auto_task] += (
+                    remaining_work_amount - task.remaining_work_amount
+                )
+            task.remaining_work_amount = remaining_work_amount
             if task.target_component_id is not None:
                 target_component = self.component_dict.get(
                     task.target_component_id, None
                 )
                 target_component.update_error_value(
-                    no_error_probability, increase_component_error, seed=seed
+                    no_error_probability, increase_component_error, rng=rng
+                )
+
+    def __get_performing_task_list(
+        self, only_auto_task: bool = False, task_list: list[BaseTask] | None = None
+    ) -> list[BaseTask]:
+        if task_list is None:
+            task_list = [
+                task for workflow in self.workflow_set for task in workflow.task_set
+            ]
+        return [
+            task
+            for task in task_list
+            if task.state == BaseTaskState.WORKING
+            and (task.auto_task or not only_auto_task)
+        ]
+
+    def __get_progress_sample_dict(self, performing_task_list: list[BaseTask]) -> dict:
+        """
+        Gather the skill distributions of the workers and facilities allocated to
+        performing tasks as arrays, which are used by __get_progress.
+
+        If get_work_amount_skill_progress of this project or get_quality_skill_point
+        of a worker is overridden, the resources are listed instead of their skill
+        distributions, and the overridden methods are called by __perform.
+        """
+        progress_hook_overridden = (
+            type(self).get_work_amount_skill_progress
+            is not BaseProject.get_work_amount_skill_progress
+        )
+        n_task = len(performing_task_list)
+        base_progress_array = np.zeros(n_task)
+        pair_task_index_list = []
+        disabled_pair_index_list = []
+        sample_pair_index_list = []
+        sample_mean_list = []
+        sample_sd_list = []
+        sample_divisor_list = []
+        quality_task_index_list = []
+        quality_mean_list = []
+        quality_sd_list = []
+        hook_pair_index_list = []
+        hook_resource_list = []
+        quality_hook_task_index_list = []
+        quality_hook_worker_list = []
+        for task_index, task in enumerate(performing_task_list):
+            if task.auto_task:
+                base_progress_array[task_index] = (
+                    task.work_amount_progress_of_unit_step_time
+                )
+                continue
+            for worker_id, facility_id in task.allocated_worker_facility_id_tuple_set:
+                pair_index = len(pair_task_index_list)
+                pair_task_index_list.append(task_index)
+                worker = self.worker_dict.get(worker_id, None)
+                resource_list = [worker]
+                if task.need_facility:
+                    resource_list.append(self.facility_dict.get(facility_id, None))
+                for resource in resource_list:
+                    if progress_hook_overridden:
+                        hook_pair_index_list.append(pair_index)
+                        hook_resource_list.append((resource, task.name))
+                    elif (
+                        resource.has_workamount_skill(task.name)
+                        and resource.state != BaseWorkerState.ABSENCE
+                    ):
+                        sample_pair_index_list.append(pair_index)
+                        sample_mean_list.append(
+                            resource.workamount_skill_mean_map[task.name]
+                        )
+                        sample_sd_list.append(
+                            resource.workamount_skill_sd_map.get(task.name, 0)
+                        )
+                        sample_divisor_list.append(
+                            self.__get_working_task_count(resource)
+                        )
+                    else:
+                        disabled_pair_index_list.append(pair_index)
+                if (
+                    type(worker).get_quality_skill_point
+                    is not BaseWorker.get_quality_skill_point
+                ):
+                    quality_hook_task_index_list.append(task_index)
+                    quality_hook_worker_list.append((worker, task.name))
+                elif worker.has_quality_skill(task.name):
+                    quality_task_index_list.append(task_index)
+                    quality_mean_list.append(worker.quality_skill_mean_map[task.name])
+                    quality_sd_list.append(worker.quality_skill_sd_map.get(task.name, 0))
+        return {
+            "base_progress": base_progress_array,
+            "pair_task_index": np.array(pair_task_index_list, dtype=np.intp),
+            "disabled_pair_index": np.array(disabled_pair_index_list, dtype=np.intp),
+            "pair_index": np.array(sample_pair_index_list, dtype=np.intp),
+            "mean": np.array(sample_mean_list, dtype=float),
+            "sd": np.array(sample_sd_list, dtype=float),
+            "divisor": np.array(sample_divisor_list, dtype=float),
+            "quality_task_index": np.array(quality_task_index_list, dtype=np.intp),
+            "quality_mean": np.array(quality_mean_list, dtype=float),
+            "quality_sd": np.array(quality_sd_list, dtype=float),
+            # Values of the overridden methods, which are set by __perform
+            "hook_pair_index": np.array(hook_pair_index_list, dtype=np.intp),
+            "hook_resource": hook_resource_list,
+            "hook_progress": np.zeros(len(hook_resource_list)),
+            "quality_hook_task_index": np.array(
+                quality_hook_task_index_list, dtype=np.intp
+            ),
+            "quality_hook_worker": quality_hook_worker_list,
+            "hook_quality": np.zeros(len(quality_hook_worker_list)),
+        }
+
+    @staticmethod
+    def __get_progress(sample_dict: dict, normal_array: np.ndarray):
+        """
+        Calculate the progress and the probability of no error of performing tasks
+        from the samples of standard normal distribution.
+        """
+        n_task = len(sample_dict["base_progress"])
+        n_sample = len(sample_dict["mean"])
+
+        # Divide by the number of concurrent tasks of each resource
+        # and sum up the progress of worker (and facility) pairs by task
+        sample_progress_array = (
+            sample_dict["mean"] + sample_dict["sd"] * normal_array[:n_sample]
+        ) / sample_dict["divisor"]
+        pair_progress_array = np.ones(len(sample_dict["pair_task_index"]))
+        np.multiply.at(
+            pair_progress_array, sample_dict["pair_index"], sample_progress_array
+        )
+        np.multiply.at(
+            pair_progress_array,
+            sample_dict["hook_pair_index"],
+            sample_dict["hook_progress"],
+        )
+        pair_progress_array[sample_dict["disabled_pair_index"]] = 0.0
+        progress_array = sample_dict["base_progress"] + np.bincount(
+            sample_dict["pair_task_index"],
+            weights=pair_progress_array,
+            minlength=n_task,
+        )
+
+        no_error_probability_array = np.ones(n_task)
+        np.subtract.at(
+            no_error_probability_array,
+            sample_dict["quality_task_index"],
+            sample_dict["quality_mean"]
+            + sample_dict["quality_sd"] * normal_array[n_sample:],
+        )
+        np.subtract.at(
+            no_error_probability_array,
+            sample_dict["quality_hook_task_index"],
+            sample_dict["hook_quality"],
+        )
+        return progress_array, no_error_probability_array
+
+    def __initialize_task_state_counter(self):
+        """
+        Count tasks in each state, collect WORKING tasks by auto_task flag and
+        sum up their remaining work amount. They are kept up to date by the state
+        transitions of tasks in simulation and by __perform.
+        """
+        self.__task_state_count_dict = {state: 0 for state in BaseTaskState}
+        self.__working_task_set_dict = {False: set(), True: set()}
+        self.__ready_task_set = set()
+        for task in self.entity_registry.task_list:
+            self.__task_state_count_dict[task.state] += 1
+            if task.state is BaseTaskState.WORKING:
+                self.__working_task_set_dict[task.auto_task].add(task)
+            elif task.state is BaseTaskState.READY:
+                self.__ready_task_set.add(task)
+        self.__resync_working_remaining_work_amount()
+
+    def __set_task_state(self, task: BaseTask, state: BaseTaskState):
+        """
+        Set the state of a task, update the task state counter and
+        report the task to the task priority queue.
+        """
+        count_dict = self.__task_state_count_dict
+        if count_dict:
+            READY = BaseTaskState.READY
+            WORKING = BaseTaskState.WORKING
+            amount_dict = self.__working_remaining_work_amount_dict
+            count_dict[task.state] -= 1
+            count_dict[state] += 1
+            if task.state is WORKING:
+                self.__working_task_set_dict[task.auto_task].discard(task)
+                amount_dict[task.auto_task] -= task.remaining_work_amount
+                if count_dict[WORKING] == 0:
+                    # Reset the rounding errors accumulated in the totals
+                    amount_dict[False] = 0.0
+                    amount_dict[True] = 0.0
+            if state is WORKING:
+                self.__working_task_set_dict[task.auto_task].add(task)
+                amount_dict[task.auto_task] += task.remaining_work_amount
+            if task.state is READY:
+                self.__ready_task_set.discard(task)
+            if state is READY:
+                self.__ready_task_set.add(task)
+        task.state = state
+        if self.__task_priority_queue is not None:
+            self.__task_priority_queue.mark_changed((task.ID,))
+
+    def __is_all_task_finished(self) -> bool:
+        return self.__task_state_count_dict[BaseTaskState.FINISHED] == len(
+            self.entity_registry.task_list
+        )
+
+    def __get_working_remaining_work_amount(
+        self, count_auto_task_in_work_amount_limit: bool = False
+    ) -> float:
+        """
+        Get the running total of the remaining work amount of WORKING tasks.
+        It may include rounding errors of the updates in simulation.
+        """
+        amount_dict = self.__working_remaining_work_amount_dict
+        if count_auto_task_in_work_amount_limit:
+            return amount_dict[False] + amount_dict[True]
+        return amount_dict[False]
+
+    def __resync_working_remaining_work_amount(
+        self, count_auto_task_in_work_amount_limit: bool = False
+    ) -> float:
+        """
+        Recalculate the running totals of the remaining work amount of WORKING
+        tasks by math.fsum, which is correctly rounded regardless of the order
+        of tasks, and return the exact total.
+        """
+        amount_dict = self.__working_remaining_work_amount_dict
+        for auto_task, task_set in self.__working_task_set_dict.items():
+            amount_dict[auto_task] = math.fsum(
+                task.remaining_work_amount for task in task_set
+            )
+        if count_auto_task_in_work_amount_limit:
+            return math.fsum(
+                task.remaining_work_amount
+                for task_set in self.__working_task_set_dict.values()
+                for task in task_set
+            )
+        return amount_dict[False]
+
+    def __get_working_task_count(self, resource):
+        kind = "worker" if isinstance(resource, BaseWorker) else "facility"
+        count_list = self.__working_task_count_list_dict.get(kind, None)
+        index = self.entity_registry.get_index(kind, resource.ID)
+        if count_list is None or index < 0:
+            return self.__count_working_task(resource)
+        return count_list[index]
+
+    def __add_working_task_count(self, task: BaseTask, pair_set, increment: int):
+        """
+        Add increment to the working task count of the resources in pair_set,
+        which are allocated to task.
+        """
+        if not self.__working_task_count_list_dict:
+            return
+        worker_count_list = self.__working_task_count_list_dict["worker"]
+        facility_count_list = self.__working_task_count_list_dict["facility"]
+        worker_index_dict = self.entity_registry.worker_index_dict
+        facility_index_dict = self.entity_registry.facility_index_dict
+        for worker_id, facility_id in pair_set:
+            index = worker_index_dict.get(worker_id, None)
+            if index is not None:
+                worker_count_list[index] += increment
+            if task.need_facility and facility_id is not None:
+                index = facility_index_dict.get(facility_id, None)
+                if index is not None:
+                    facility_count_list[index] += increment
+
+    def __count_working_task(self, resource):
+        if isinstance(resource, BaseWorker):
+            assigned_task_id_set = {
+                t[0] for t in resource.assigned_task_facility_id_tuple_set
+            }
+        elif isinstance(resource, BaseFacility):
+            assigned_task_id_set = {
+                t[0] for t in resource.assigned_task_worker_id_tuple_set
+            }
+        else:
+            assigned_task_id_set = set()
+        return sum(
+            (
+                self.task_dict.get(task_id, None) is not None
+                and (
+                    self.task_dict[task_id].state == BaseTaskState.WORKING
+                    or self.task_dict[task_id].state
+                    == BaseTaskState.WORKING_ADDITIONALLY
                 )
+            )
+            for task_id in assigned_task_id_set
+        )
 
-    def get_work_amount_skill_progress(self, resource, task_name: str, seed=None):
+    def get_work_amount_skill_progress(
+        self,
+        resource,
+        task_name: str,
+        seed=None,
+        rng: np.random.Generator = None,
+    ):
         """
         Get the progress of work amount contributed by a resource for a task in this time step.
 
@@ -1093,16 +2459,27 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
             - ps_r(t): Progress if the resource has only this task at this time.
             - N_r(t): Number of tasks assigned to the resource at this time.
 
+        N_r(t) is counted incrementally on allocation and state transitions of tasks
+        after initialize(), so it is not updated by changing task states directly.
+
+        simulate samples the same distribution for all resources at once, and calls
+        this method for each resource only when a subclass overrides it.
+
         Args:
             resource (BaseWorker or BaseFacility): The resource whose skill progress is calculated.
             task_name (str): Name of the task.
             seed (int, optional): Random seed for reproducibility. Defaults to None.
+                This is used only when rng is None.
+            rng (numpy.random.Generator, optional): Random generator for sampling.
+                Defaults to None -> global numpy.random.
 
         Returns:
             float: Progress of work amount contributed by the resource in this time step.
         """
-        if seed is not None:
-            np.random.seed(seed=seed)
+        if rng is None:
+            if seed is not None:
+                np.random.seed(seed=seed)
+            rng = np.random
         if not resource.has_workamount_skill(task_name):
             return 0.0
         if resource.state == BaseWorkerState.ABSENCE:
@@ -1111,46 +2488,131 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         if task_name not in resource.workamount_skill_sd_map:
             skill_sd = 0
         else:
-            skill_sd = resource.workamount_skill_sd_map[task_name]
-        base_progress = np.random.normal(skill_mean, skill_sd)
-        assigned_task_id_set = set()
-        if isinstance(resource, BaseWorker):
-            assigned_task_id_set = {
-                t[0] for t in resource.assigned_task_facility_id_tuple_set
-            }
-        elif isinstance(resource, BaseFacility):
-            assigned_task_id_set = {
-                t[0] for t in resource.assigned_task_worker_id_tuple_set
-            }
-        sum_of_working_task_in_this_time = sum(
-            (
-                self.task_dict.get(task_id, None) is not None
-                and (
-                    self.task_dict[task_id].state == BaseTaskState.WORKING
-                    or self.task_dict[task_id].state
-                    == BaseTaskState.WORKING_ADDITIONALLY
+            skill_sd = resource.workamount_skill_sd_map[task_name]
+        base_progress = rng.normal(skill_mean, skill_sd)
+        sum_of_working_task_in_this_time = self.__get_working_task_count(resource)
+        return base_progress / float(sum_of_working_task_in_this_time)
+
+    def __record(self, working: bool = True):
+        if not self.__record_required:
+            if self.record_policy != RecordPolicy.NONE:
+                self.__unrecorded_step_count += 1
+        else:
+            self.__record_instance(working=working)
+        self.__add_ready_record_count(working=working)
+
+    def __add_ready_record_count(self, working: bool = True, n_step: int = 1):
+        """Count the READY records of tasks in n_step steps for FIFO rule."""
+        if (
+            self.__task_priority_queue is not None
+            and self.__task_priority_queue.priority_rule_mode
+            == TaskPriorityRuleMode.FIFO
+        ):
+            # WORKING tasks are recorded as READY in absence time.
+            ready_record_count_dict = self.__ready_record_count_dict
+            if working:
+                task_id_list = [
+                    task.ID
+                    for task in self.__ready_task_set
+                    if task.ID in ready_record_count_dict
+                ]
+            else:
+                task_id_list = list(self.__task_priority_queue.entry_dict)
+            for task_id in task_id_list:
+                ready_record_count_dict[task_id] += n_step
+            self.__task_priority_queue.mark_changed(task_id_list)
+
+    def __record_instance(self, working: bool = True):
+        if self.__recorder is None:
+            for workflow in self.workflow_set:
+                workflow.record(working)
+            for team in self.team_set:
+                team.record_assigned_task_id()
+                team.record_all_worker_state(working=working)
+            for workplace in self.workplace_set:
+                workplace.record_assigned_task_id()
+                workplace.record_placed_component_id()
+                workplace.record_all_facility_state(working=working)
+            for product in self.product_set:
+                product.record(working)
+        else:
+            self.__record_to_recorder(working=working)
+
+    def __record_to_recorder(self, working: bool = True):
+        """
+        Record as __record by appending the states and remaining work amounts
+        of all instances to the recorder as rows.
+        """
+        recorder = self.__recorder
+
+        task_list = recorder.instance_list_dict["task_state"]
+        for task in task_list:
+            task.allocated_worker_facility_id_tuple_set_record_list.append(
+                task.allocated_worker_facility_id_tuple_set
+            )
+        if working:
+            task_state_row = [task.state for task in task_list]
+        else:
+            task_state_row = [
+                (
+                    BaseTaskState.READY
+                    if task.state is BaseTaskState.WORKING
+                    else task.state
                 )
-            )
-            for task_id in assigned_task_id_set
+                for task in task_list
+            ]
+        recorder.append_row("task_state", task_state_row)
+        recorder.append_row(
+            "task_remaining_work_amount",
+            [task.remaining_work_amount for task in task_list],
         )
-        return base_progress / float(sum_of_working_task_in_this_time)
 
-    def __record(self, working: bool = True):
-        for workflow in self.workflow_set:
-            workflow.record(working)
         for team in self.team_set:
             team.record_assigned_task_id()
-            team.record_all_worker_state(working=working)
+        worker_list = recorder.instance_list_dict["worker_state"]
+        recorder.append_row(
+            "worker_state",
+            (
+                [worker.state for worker in worker_list]
+                if working
+                else [BaseWorkerState.ABSENCE] * len(worker_list)
+            ),
+        )
+
         for workplace in self.workplace_set:
             workplace.record_assigned_task_id()
             workplace.record_placed_component_id()
-            workplace.record_all_facility_state(working=working)
-        for product in self.product_set:
-            product.record(working)
+        facility_list = recorder.instance_list_dict["facility_state"]
+        recorder.append_row(
+            "facility_state",
+            (
+                [facility.state for facility in facility_list]
+                if working
+                else [BaseFacilityState.ABSENCE] * len(facility_list)
+            ),
+        )
+
+        component_list = recorder.instance_list_dict["component_state"]
+        for component in component_list:
+            component.record_placed_workplace_id()
+        if working:
+            component_state_row = [component.state for component in component_list]
+        else:
+            component_state_row = [
+                (
+                    BaseComponentState.READY
+                    if component.state == BaseComponentState.WORKING
+                    else component.state
+                )
+                for component in component_list
+            ]
+        recorder.append_row("component_state", component_state_row)
 
-    def __update(self):
+    def __update(self, error_tol: float = 1e-10):
         for workflow in self.workflow_set:
-            self.check_state_workflow(workflow, BaseTaskState.FINISHED)
+            self.check_state_workflow(
+                workflow, BaseTaskState.FINISHED, error_tol=error_tol
+            )
         for product in self.product_set:
             # product should be checked after checking workflow state
             for component in product.component_set:
@@ -1162,8 +2624,22 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
             # product should be checked after checking workflow state
             for component in product.component_set:
                 self.check_state_component(component)
-        for workflow in self.workflow_set:
-            workflow.update_pert_data(self.time)
+        if self.__is_pert_update_required():
+            for workflow in self.workflow_set:
+                changed_task_id_set = workflow.update_pert_data(
+                    self.time, mode=self.__pert_update_mode
+                )
+                if self.__task_priority_queue is not None:
+                    self.__task_priority_queue.mark_changed(changed_task_id_set)
+            self.__pert_updated_time = self.time
+            self.__task_state_changed = False
+
+    def __is_pert_update_required(self) -> bool:
+        return (
+            self.__task_state_changed
+            or self.__pert_updated_time is None
+            or self.time - self.__pert_updated_time >= self.__pert_update_time_interval
+        )
 
     def __check_removing_placed_workplace(self):
         """
@@ -1195,12 +2671,281 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
             self.remove_component_on_workplace(c, placed_workplace)
             self.set_component_on_workplace(c, None)
 
-    def __is_allocated_worker(self, worker: BaseWorker, task: BaseTask):
-        team = self.team_dict.get(worker.team_id, None)
-        if team is None:
-            return False
-        targeted_task_set = self.get_target_task_set(team.targeted_task_id_set)
-        return task in targeted_task_set
+    def __initialize_recorder(self):
+        """
+        Replace the record lists of states, remaining work amounts and costs
+        with the views of a ColumnarRecorder in COLUMNAR record mode,
+        and the record lists of states with RunLengthRecord in RLE record mode.
+        In both modes, the records of allocations and placements are replaced with
+        RunLengthRecord sharing one dictionary of interned values.
+
+        In INTERVAL and TRANSITION policies, the steps which are not recorded hold
+        the values of the last recorded step, so all record lists of LIST and RLE
+        record modes are replaced with RunLengthRecord.
+        """
+        self.__recorder = None
+        if self.record_policy in (RecordPolicy.INTERVAL, RecordPolicy.TRANSITION):
+            if self.__record_mode != RecordMode.COLUMNAR:
+                # Only allocations and placements are interned, because equal
+                # numbers and states of different types should not be shared.
+                intern_dict = {}
+                not_interned_attr_name_set = {
+                    "state_record_list",
+                    "remaining_work_amount_record_list",
+                    "cost_record_list",
+                }
+                for instance_set, attr_name_list in self.__get_record_attr_name_list():
+                    for instance, attr_name in itertools.product(
+                        instance_set, attr_name_list
+                    ):
+                        record = getattr(instance, attr_name)
+                        if not isinstance(record, RunLengthRecord):
+                            setattr(
+                                instance,
+                                attr_name,
+                                RunLengthRecord(
+                                    record,
+                                    intern_dict=(
+                                        None
+                                        if attr_name in not_interned_attr_name_set
+                                        else intern_dict
+                                    ),
+                                ),
+                            )
+                return
+        if self.__record_mode == RecordMode.LIST:
+            return
+
+        intern_dict = {}
+        for instance_set, attr_name in (
+            (self.task_set, "allocated_worker_facility_id_tuple_set_record_list"),
+            (self.worker_set, BaseWorker._assigned_record_attr_name),
+            (self.facility_set, BaseFacility._assigned_record_attr_name),
+            (self.workplace_set, "placed_component_id_set_record_list"),
+            (self.component_set, "placed_workplace_id_record_list"),
+        ):
+            for instance in instance_set:
+                record = getattr(instance, attr_name)
+                if not isinstance(record, RunLengthRecord):
+                    setattr(
+                        instance,
+                        attr_name,
+                        RunLengthRecord(record, intern_dict=intern_dict),
+                    )
+
+        if self.__record_mode == RecordMode.RLE:
+            for instance in itertools.chain(
+                self.task_set, self.component_set, self.worker_set, self.facility_set
+            ):
+                if not isinstance(instance.state_record_list, RunLengthRecord):
+                    instance.state_record_list = RunLengthRecord(
+                        instance.state_record_list
+                    )
+            return
+        recorder = ColumnarRecorder()
+
+        task_list = [
+            task for workflow in self.workflow_set for task in workflow.task_set
+        ]
+        recorder.add_record(
+            "task_state", task_list, "state_record_list", np.int8, BaseTaskState
+        )
+        recorder.add_record(
+            "task_remaining_work_amount",
+            task_list,
+            "remaining_work_amount_record_list",
+            np.float64,
+        )
+
+        component_list = [
+            component
+            for product in self.product_set
+            for component in product.component_set
+        ]
+        recorder.add_record(
+            "component_state",
+            component_list,
+            "state_record_list",
+            np.int8,
+            BaseComponentState,
+        )
+
+        team_list = list(self.team_set)
+        worker_list = [worker for team in team_list for worker in team.worker_set]
+        recorder.add_record("team_cost", team_list, "cost_record_list", np.float64)
+        recorder.add_record(
+            "worker_state", worker_list, "state_record_list", np.int8, BaseWorkerState
+        )
+        recorder.add_record("worker_cost", worker_list, "cost_record_list", np.float64)
+
+        workplace_list = list(self.workplace_set)
+        facility_list = [
+            facility
+            for workplace in workplace_list
+            for facility in workplace.facility_set
+        ]
+        recorder.add_record(
+            "workplace_cost", workplace_list, "cost_record_list", np.float64
+        )
+        recorder.add_record(
+            "facility_state",
+            facility_list,
+            "state_record_list",
+            np.int8,
+            BaseFacilityState,
+        )
+        recorder.add_record(
+            "facility_cost", facility_list, "cost_record_list", np.float64
+        )
+
+        self.__recorder = recorder
+
+    def __initialize_allocation_index(self):
+        """
+        Build the index of workers and facilities which can be allocated to each task.
+
+        A worker is eligible for a task if its team targets the task, it has work amount
+        skill for the task and it is in fixing_allocating_worker_id_set of the task.
+        A facility is eligible if it has work amount skill for the task and it is in
+        fixing_allocating_facility_id_set of the task.
+        Workers of each task are ordered by the worker priority rule of the task.
+        """
+        self.__allocation_worker_list = [
+            worker for team in self.team_set for worker in team.worker_set
+        ]
+        self.__allocation_worker_order_dict = {}
+        for i, worker in enumerate(self.__allocation_worker_list):
+            self.__allocation_worker_order_dict.setdefault(worker.ID, i)
+        self.__worker_priority_key_dict = {}
+
+        # Skill maps are usually much smaller than targeted task sets,
+        # so eligible pairs are searched from the task names of skills.
+        task_list_by_name = {}
+        for task in self.task_set:
+            task_list_by_name.setdefault(task.name, []).append(task)
+
+        self.__allocatable_worker_dict = {task.ID: [] for task in self.task_set}
+        for worker in self.__allocation_worker_list:
+            team = self.team_dict.get(worker.team_id, None)
+            if team is None:
+                continue
+            for task_name in worker.workamount_skill_mean_map:
+                if not worker.has_workamount_skill(task_name):
+                    continue
+                for task in task_list_by_name.get(task_name, ()):
+                    if task.ID in team.targeted_task_id_set and (
+                        task.fixing_allocating_worker_id_set is None
+                        or worker.ID in task.fixing_allocating_worker_id_set
+                    ):
+                        self.__allocatable_worker_dict[task.ID].append(worker)
+
+        self.__allocatable_facility_id_dict = {task.ID: set() for task in self.task_set}
+        for facility in self.facility_set:
+            for task_name in facility.workamount_skill_mean_map:
+                if not facility.has_workamount_skill(task_name):
+                    continue
+                for task in task_list_by_name.get(task_name, ()):
+                    if (
+                        task.fixing_allocating_facility_id_set is None
+                        or facility.ID in task.fixing_allocating_facility_id_set
+                    ):
+                        self.__allocatable_facility_id_dict[task.ID].add(facility.ID)
+
+        order_dict = self.__allocation_worker_order_dict
+        for task in self.task_set:
+            key_dict = self.__worker_priority_key_dict[
+                self.__get_worker_priority_key_id(task)
+            ]
+            self.__allocatable_worker_dict[task.ID].sort(
+                key=lambda worker, key_dict=key_dict: (
+                    key_dict[worker.ID],
+                    order_dict[worker.ID],
+                )
+            )
+
+    def __get_worker_priority_key_id(self, task: BaseTask):
+        """
+        Get the ID of the key of sort_worker_list for a task,
+        and prepare the key of each worker for the ID.
+        """
+        # Only HSV depends on the task name.
+        key_id = (
+            task.worker_priority_rule,
+            task.name
+            if task.worker_priority_rule == ResourcePriorityRuleMode.HSV
+            else None,
+        )
+        if key_id not in self.__worker_priority_key_dict:
+            key_function = get_worker_priority_key_function(
+                task.worker_priority_rule, name=task.name
+            )
+            self.__worker_priority_key_dict[key_id] = {
+                worker.ID: key_function(worker) if key_function is not None else 0
+                for worker in self.__allocation_worker_list
+            }
+        return key_id
+
+    def __get_free_allocatable_worker_list(
+        self,
+        task: BaseTask,
+        free_worker_id_set: set[str],
+        priority_key_id_list: list,
+    ):
+        """
+        Get free workers which can be allocated to a task in the order of the free
+        worker list sorted repeatedly by sort_worker_list in this time.
+
+        Repeated stable sorts are equal to one sort by the keys in the order of
+        their last use, so `priority_key_id_list` holds the key IDs used
+        in this time from the most recent one.
+        """
+        worker_list = [
+            worker
+            for worker in self.__allocatable_worker_dict.get(task.ID, [])
+            if worker.ID in free_worker_id_set
+        ]
+        if len(worker_list) <= 1 or (
+            len(priority_key_id_list) == 1
+            and priority_key_id_list[0] == self.__get_worker_priority_key_id(task)
+        ):
+            return worker_list
+        key_dict_list = [
+            self.__worker_priority_key_dict[key_id] for key_id in priority_key_id_list
+        ]
+        order_dict = self.__allocation_worker_order_dict
+        return sorted(
+            worker_list,
+            key=lambda worker: (
+                *(key_dict[worker.ID] for key_dict in key_dict_list),
+                order_dict[worker.ID],
+            ),
+        )
+
+    def __get_task_priority_queue(self, task_priority_rule: TaskPriorityRuleMode):
+        """
+        Get the queue of READY and WORKING tasks for the task priority rule.
+        The queue is built at the first call after initialize and kept up to date
+        by the READY and FINISHED transitions of tasks.
+        """
+        if (
+            self.__task_priority_queue is None
+            or self.__task_priority_queue.priority_rule_mode != task_priority_rule
+        ):
+            self.__ready_record_count_dict = {}
+            self.__task_priority_queue = TaskPriorityQueue(
+                task_priority_rule,
+                {task.ID: i for i, task in enumerate(self.task_set)},
+                ready_count_dict=self.__ready_record_count_dict,
+            )
+            for task in self.task_set:
+                if task.state in (BaseTaskState.READY, BaseTaskState.WORKING):
+                    self.__add_task_to_priority_queue(task)
+        return self.__task_priority_queue
+
+    def __add_task_to_priority_queue(self, task: BaseTask):
+        if self.__task_priority_queue.priority_rule_mode == TaskPriorityRuleMode.FIFO:
+            self.__ready_record_count_dict[task.ID] = count_ready_record(task)
+        self.__task_priority_queue.add(task)
 
     def __iter_workplace_and_ancestors(self, workplace: BaseWorkplace):
         cur = workplace
@@ -1218,28 +2963,18 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
     ):
 
         # 1. Get ready task and free workers and facilities
-        ready_and_working_task_list = list(
-            filter(
-                lambda task: task.state == BaseTaskState.READY
-                or task.state == BaseTaskState.WORKING,
-                self.task_set,
-            )
-        )
-
-        worker_list = list(
-            itertools.chain.from_iterable(
-                list(map(lambda team: team.worker_set, self.team_set))
-            )
-        )
+        task_priority_queue = self.__get_task_priority_queue(task_priority_rule)
 
-        free_worker_list = list(
-            filter(lambda worker: worker.state == BaseWorkerState.FREE, worker_list)
-        )
+        free_worker_id_set = {
+            worker.ID
+            for worker in self.__allocation_worker_list
+            if worker.state == BaseWorkerState.FREE
+        }
+        priority_key_id_list = []
 
         # 2. Sort ready task using TaskPriorityRule
-        ready_and_working_task_list = sort_task_list(
-            ready_and_working_task_list, task_priority_rule
-        )
+        task_priority_queue.update()
+        ready_and_working_task_list = task_priority_queue.get_task_list()
 
         # 3. Allocate ready tasks to free workers and facilities
         target_workplace_id_set = {wp.ID for wp in self.workplace_set}
@@ -1353,24 +3088,26 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                         )
 
                         # Extract only candidate facilities
+                        allocatable_facility_id_set = (
+                            self.__allocatable_facility_id_dict.get(task.ID, ())
+                        )
                         allocating_facilities = [
-                            f for f in free_facility_list if f.has_workamount_skill(task.name)
+                            f
+                            for f in free_facility_list
+                            if f.ID in allocatable_facility_id_set
                         ]
 
                         for facility in allocating_facilities:
                             # Extract only candidate workers
-                            allocating_workers = list(
-                                filter(
-                                    lambda worker, task=task, facility=facility: (
-                                        worker.has_workamount_skill(task.name)
-                                        and self.__is_allocated_worker(worker, task)
-                                        and self.can_add_resources_to_task(
-                                            task, worker=worker, facility=facility
-                                        )
-                                    ),
-                                    free_worker_list,
+                            allocating_workers = [
+                                worker
+                                for worker in self.__get_free_allocatable_worker_list(
+                                    task, free_worker_id_set, priority_key_id_list
                                 )
-                            )
+                                if self.can_add_resources_to_task(
+                                    task, worker=worker, facility=facility
+                                )
+                            ]
 
                             # Sort workers
                             allocating_workers = sort_worker_list(
@@ -1385,27 +3122,24 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                                 task.add_assigned_pair((worker.ID, facility.ID))
                                 worker.add_assigned_pair((task.ID, facility.ID))
                                 facility.add_assigned_pair((task.ID, worker.ID))
+                                if task.state == BaseTaskState.WORKING:
+                                    self.__add_working_task_count(
+                                        task, [(worker.ID, facility.ID)], 1
+                                    )
                                 allocating_workers.remove(worker)
-                                free_worker_list = [
-                                    w for w in free_worker_list if w.ID != worker.ID
-                                ]
+                                free_worker_id_set.discard(worker.ID)
                                 break
 
                 else:
                     # Worker sorting
-                    free_worker_list = sort_worker_list(
-                        free_worker_list, task.worker_priority_rule, name=task.name
-                    )
+                    key_id = self.__get_worker_priority_key_id(task)
+                    if key_id in priority_key_id_list:
+                        priority_key_id_list.remove(key_id)
+                    priority_key_id_list.insert(0, key_id)
 
                     # Extract only candidate workers
-                    allocating_workers = list(
-                        filter(
-                            lambda worker, task=task: worker.has_workamount_skill(
-                                task.name
-                            )
-                            and self.__is_allocated_worker(worker, task),
-                            free_worker_list,
-                        )
+                    allocating_workers = self.__get_free_allocatable_worker_list(
+                        task, free_worker_id_set, priority_key_id_list
                     )
 
                     # Allocate free workers to tasks
@@ -1413,9 +3147,11 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                         if self.can_add_resources_to_task(task, worker=worker):
                             task.add_assigned_pair((worker.ID, None))
                             worker.add_assigned_pair((task.ID, None))
-                            free_worker_list = [
-                                w for w in free_worker_list if w.ID != worker.ID
-                            ]
+                            if task.state == BaseTaskState.WORKING:
+                                self.__add_working_task_count(
+                                    task, [(worker.ID, None)], 1
+                                )
+                            free_worker_id_set.discard(worker.ID)
 
     def check_state_workflow(
         self,
@@ -1424,6 +3160,7 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         work_amount_limit_per_unit_time: float = 1e10,
         total_work_amount_in_working_tasks: float = None,
         count_auto_task_in_work_amount_limit: bool = False,
+        error_tol: float = 1e-10,
     ):
         """
         Check and update the state of all tasks in the given workflow for the specified state.
@@ -1447,9 +3184,13 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
             count_auto_task_in_work_amount_limit (bool, optional):
                 Whether auto tasks should be counted toward the work amount limit.
                 Defaults to False.
+            error_tol (float, optional):
+                Remaining work amount under which a WORKING task is regarded as
+                finished when state is FINISHED. Defaults to 1e-10.
         
         Returns:
-            float: Updated total work amount in WORKING tasks when state is WORKING, otherwise None.
+            float: Updated total work amount in WORKING tasks when state is WORKING and
+                work_amount_limit_per_unit_time is finite, otherwise None.
         """
         if state == BaseTaskState.READY:
             self.__check_ready_workflow(workflow)
@@ -1462,60 +3203,123 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                 count_auto_task_in_work_amount_limit=count_auto_task_in_work_amount_limit,
             )
         elif state == BaseTaskState.FINISHED:
-            self.__check_finished_workflow(workflow)
+            self.__check_finished_workflow(workflow, error_tol=error_tol)
             return None
 
-    def __check_ready_workflow(self, workflow: BaseWorkflow):
-        NONE = BaseTaskState.NONE
-        READY = BaseTaskState.READY
-        WORKING = BaseTaskState.WORKING
-        FINISHED = BaseTaskState.FINISHED
-
-        task_dict = self.task_dict
-
-        max_iter = len(workflow.task_set)
-        for _ in range(max_iter):
-            changed = False
-
-            for task in workflow.task_set:
-                if task.state is not NONE:
-                    continue
+    def __is_satisfied_for_ready(
+        self, input_task_index: int, dependency: BaseTaskDependency
+    ):
+        if input_task_index < 0:
+            return False
+        inp = self.entity_registry.task_list[input_task_index]
+        if dependency == BaseTaskDependency.FS:
+            return inp.state is BaseTaskState.FINISHED
+        if dependency == BaseTaskDependency.SS:
+            # READY synchronization: predecessor must be READY or higher
+            return inp.state in (
+                BaseTaskState.READY,
+                BaseTaskState.WORKING,
+                BaseTaskState.FINISHED,
+            )
+        return True
 
-                deps = task.input_task_id_dependency_set
-                if not deps:
-                    task.state = READY
-                    changed = True
-                    continue
+    def __initialize_ready_frontier(self):
+        """
+        Build the reverse adjacency index of task dependencies and count
+        unsatisfied dependencies of each NONE task for READY transition.
+        Tasks without unsatisfied dependencies become the READY candidates
+        of their workflow.
+        """
+        registry = self.entity_registry
+        if registry is None or any(
+            workflow.ID not in registry.workflow_task_index_list_dict
+            for workflow in self.workflow_set
+        ):
+            self.__initialize_child_instance_set_id_instance_dict()
+            registry = self.entity_registry
 
-                ready = True
-                for input_task_id, dep in deps:
-                    inp = task_dict.get(input_task_id)
-                    if inp is None:
-                        ready = False
-                        break
+        n_task = registry.get_size("task")
+        self.__output_task_dependency_list = [[] for _ in range(n_task)]
+        self.__unsatisfied_dependency_count_list = [0] * n_task
+        self.__ready_candidate_dict = {}
+        for workflow in self.workflow_set:
+            candidate_list = []
+            for i in registry.workflow_task_index_list_dict[workflow.ID]:
+                unsatisfied_dependency_count = 0
+                for j, dependency in registry.input_task_index_dependency_list[i]:
+                    if j >= 0:
+                        self.__output_task_dependency_list[j].append(
+                            (i, workflow.ID, dependency)
+                        )
+                    if not self.__is_satisfied_for_ready(j, dependency):
+                        unsatisfied_dependency_count += 1
+                self.__unsatisfied_dependency_count_list[i] = (
+                    unsatisfied_dependency_count
+                )
+                if (
+                    registry.task_list[i].state is BaseTaskState.NONE
+                    and unsatisfied_dependency_count == 0
+                ):
+                    candidate_list.append(i)
+            self.__ready_candidate_dict[workflow.ID] = candidate_list
 
-                    if dep == BaseTaskDependency.FS:
-                        if inp.state is not FINISHED:
-                            ready = False
-                            break
+    def __satisfy_output_task_dependency(
+        self, task_index: int, satisfied_dependency: BaseTaskDependency
+    ):
+        """
+        Update the unsatisfied dependency counts of the output tasks of a task
+        when dependencies of satisfied_dependency type are newly satisfied.
+        """
+        if self.__output_task_dependency_list is None or task_index < 0:
+            return
+        task_list = self.entity_registry.task_list
+        count_list = self.__unsatisfied_dependency_count_list
+        for i, workflow_id, dependency in self.__output_task_dependency_list[
+            task_index
+        ]:
+            if dependency != satisfied_dependency:
+                continue
+            count_list[i] -= 1
+            if count_list[i] == 0 and task_list[i].state is BaseTaskState.NONE:
+                self.__ready_candidate_dict[workflow_id].append(i)
 
-                    elif dep == BaseTaskDependency.SS:
-                        # READY synchronization: predecessor must be READY or higher
-                        if inp.state not in (READY, WORKING, FINISHED):
-                            ready = False
-                            break
+    def __get_workflow_task_index_list(self, workflow: BaseWorkflow):
+        """
+        Get the indices of the tasks of a workflow in the entity registry.
+        The registry is rebuilt if the workflow is added after it was built.
+        """
+        task_index_list = self.entity_registry.workflow_task_index_list_dict.get(
+            workflow.ID, None
+        )
+        if task_index_list is None:
+            self.__initialize_child_instance_set_id_instance_dict()
+            task_index_list = self.entity_registry.workflow_task_index_list_dict[
+                workflow.ID
+            ]
+        return task_index_list
 
-                    elif dep == BaseTaskDependency.SF:
-                        pass
-                    elif dep == BaseTaskDependency.FF:
-                        pass
+    def __check_ready_workflow(self, workflow: BaseWorkflow):
+        if (
+            self.__ready_candidate_dict is None
+            or workflow.ID not in self.__ready_candidate_dict
+        ):
+            self.__initialize_ready_frontier()
 
-                if ready:
-                    task.state = READY
-                    changed = True
+        NONE = BaseTaskState.NONE
+        READY = BaseTaskState.READY
 
-            if not changed:
-                break
+        task_list = self.entity_registry.task_list
+        candidate_list = self.__ready_candidate_dict[workflow.ID]
+        while candidate_list:
+            i = candidate_list.pop()
+            task = task_list[i]
+            if task.state is not NONE:
+                continue
+            self.__set_task_state(task, READY)
+            self.__task_state_changed = True
+            if self.__task_priority_queue is not None:
+                self.__add_task_to_priority_queue(task)
+            self.__satisfy_output_task_dependency(i, BaseTaskDependency.SS)
 
     def __check_working_workflow(
         self,
@@ -1538,17 +3342,31 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         worker_dict = self.worker_dict
         facility_dict = self.facility_dict
 
+        # No total work amount is needed when no finite limit applies
+        is_limited = work_amount_limit_per_unit_time < math.inf
+        # Running totals are exact only up to rounding errors, so they are
+        # recalculated when the new total is about to reach the limit.
+        limit_tol = 1e-9 * max(1.0, abs(work_amount_limit_per_unit_time))
+        is_counted = bool(self.__task_state_count_dict)
+
         # Calculate total work amount in working tasks before allocation if not provided
-        if total_work_amount_in_working_tasks is None:
-            total_work_amount_in_working_tasks = sum(
-                task.remaining_work_amount
-                for task in self.task_set
-                if task.state == BaseTaskState.WORKING
-                and (
-                    count_auto_task_in_work_amount_limit
-                    or not task.auto_task
+        if is_limited and total_work_amount_in_working_tasks is None:
+            if is_counted:
+                total_work_amount_in_working_tasks = (
+                    self.__resync_working_remaining_work_amount(
+                        count_auto_task_in_work_amount_limit
+                    )
+                )
+            else:
+                total_work_amount_in_working_tasks = math.fsum(
+                    task.remaining_work_amount
+                    for task in self.task_set
+                    if task.state == BaseTaskState.WORKING
+                    and (
+                        count_auto_task_in_work_amount_limit
+                        or not task.auto_task
+                    )
                 )
-            )
 
         for task in workflow.task_set:
             s = task.state
@@ -1556,16 +3374,33 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
             if s is READY and (
                 task.auto_task or task.allocated_worker_facility_id_tuple_set
             ):
-                apply_limit = (
+                apply_limit = is_limited and (
                     count_auto_task_in_work_amount_limit or not task.auto_task
                 )
-                if (not apply_limit) or (
-                    total_work_amount_in_working_tasks + task.remaining_work_amount
-                    <= work_amount_limit_per_unit_time
-                ):
-                    task.state = WORKING
+                if apply_limit:
+                    new_total = (
+                        total_work_amount_in_working_tasks + task.remaining_work_amount
+                    )
+                    if is_counted and (
+                        abs(new_total - work_amount_limit_per_unit_time) <= limit_tol
+                    ):
+                        total_work_amount_in_working_tasks = (
+                            self.__resync_working_remaining_work_amount(
+                                count_auto_task_in_work_amount_limit
+                            )
+                        )
+                        new_total = (
+                            total_work_amount_in_working_tasks
+                            + task.remaining_work_amount
+                        )
+                if (not apply_limit) or new_total <= work_amount_limit_per_unit_time:
+                    self.__set_task_state(task, WORKING)
+                    self.__task_state_changed = True
+                    self.__add_working_task_count(
+                        task, task.allocated_worker_facility_id_tuple_set, 1
+                    )
                     if apply_limit:
-                        total_work_amount_in_working_tasks += task.remaining_work_amount
+                        total_work_amount_in_working_tasks = new_total
                     for (
                         worker_id,
                         facility_id,
@@ -1608,17 +3443,25 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         worker_dict = self.worker_dict
         facility_dict = self.facility_dict
 
-        for task in workflow.task_set:
+        task_index_list = self.__get_workflow_task_index_list(workflow)
+        task_list = self.entity_registry.task_list
+        input_task_index_dependency_list = (
+            self.entity_registry.input_task_index_dependency_list
+        )
+
+        for i in task_index_list:
+            task = task_list[i]
             if not (
                 task.state is WORKING and task.remaining_work_amount < 0.0 + error_tol
             ):
                 continue
 
             finished_ok = True
-            for input_task_id, dep in task.input_task_id_dependency_set:
-                inp = task_dict.get(input_task_id)
-                if inp is None:
+            for j, dep in input_task_index_dependency_list[i]:
+                if j < 0:
                     finished_ok = False
+                    break
+                inp = task_list[j]
                 if dep == BaseTaskDependency.SF:
                     if inp.state not in (BaseTaskState.WORKING, BaseTaskState.FINISHED):
                         finished_ok = False
@@ -1631,8 +3474,18 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
             if not finished_ok:
                 continue
 
-            task.state = FINISHED
+            self.__set_task_state(task, FINISHED)
             task.remaining_work_amount = 0.0
+            self.__task_state_changed = True
+            self.__task_finish_step_dict.setdefault(
+                task.ID, len(self.cost_record_list)
+            )
+            if self.__task_priority_queue is not None:
+                self.__task_priority_queue.discard(task)
+            self.__add_working_task_count(
+                task, task.allocated_worker_facility_id_tuple_set, -1
+            )
+            self.__satisfy_output_task_dependency(i, BaseTaskDependency.FS)
 
             for worker_id, facility_id in task.allocated_worker_facility_id_tuple_set:
                 w = worker_dict.get(worker_id)
@@ -2351,45 +4204,69 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                 print_all_log_in_chronological_order(self.print_log, n, backward)
 
     def write_simple_json(
-        self, file_path: str, encoding: str = "utf-8", indent: int = 4
+        self,
+        file_path: str,
+        encoding: str = "utf-8",
+        indent: int = 4,
+        compact: bool = False,
     ):
         """
         Create a JSON file of this project.
 
+        Each product, workflow, team and workplace is exported and written one by one,
+        so that the memory for writing is bounded by the largest one of them.
+
+        Infinite values of `est`, `eft`, `lst` and `lft` of tasks and
+        `max_space_size` of workplaces are written as null, so that the file is
+        strict JSON. Older versions wrote them as Infinity, which read_simple_json
+        still accepts, but other readers of the files should read null as infinity.
+
         Args:
             file_path (str): File path for saving this project data.
             encoding (str, optional): Encoding for the JSON file. Defaults to "utf-8".
             indent (int, optional): Indentation level for JSON formatting. Defaults to 4.
+            compact (bool, optional): Whether to write without indentation and spaces
+                after separators. `indent` is ignored if True. Defaults to False.
 
         Returns:
             None
         """
-        dict_data = {"pDESy": []}
-        dict_data["pDESy"].append(
-            {
-                "type": self.__class__.__name__,
-                "name": self.name,
-                "ID": self.ID,
-                "init_datetime": self.init_datetime.strftime("%Y-%m-%d %H:%M:%S"),
-                "unit_timedelta": str(self.unit_timedelta.total_seconds()),
-                "absence_time_list": self.absence_time_list,
-                "perform_auto_task_while_absence_time": self.perform_auto_task_while_absence_time,
-                "time": self.time,
-                "cost_record_list": self.cost_record_list,
-                "simulation_mode": int(self.simulation_mode),
-                "status": int(self.status),
-            }
+        project_json = {
+            "type": self.__class__.__name__,
+            "name": self.name,
+            "ID": self.ID,
+            "init_datetime": self.init_datetime.strftime("%Y-%m-%d %H:%M:%S"),
+            "unit_timedelta": str(self.unit_timedelta.total_seconds()),
+            "absence_time_list": self.absence_time_list,
+            "perform_auto_task_while_absence_time": self.perform_auto_task_while_absence_time,
+            "time": self.time,
+            "cost_record_list": self.cost_record_list,
+            "simulation_mode": int(self.simulation_mode),
+            "status": int(self.status),
+            "record_policy": int(self.record_policy),
+            "record_interval": self.record_interval,
+            "task_finish_step_dict": self.__task_finish_step_dict,
+        }
+        node_iterable = itertools.chain(
+            [project_json],
+            (
+                node.export_dict_json_data()
+                for node_set in (
+                    self.product_set,
+                    self.workflow_set,
+                    self.team_set,
+                    self.workplace_set,
+                )
+                for node in node_set
+            ),
         )
-        for product in self.product_set:
-            dict_data["pDESy"].append(product.export_dict_json_data())
-        for workflow in self.workflow_set:
-            dict_data["pDESy"].append(workflow.export_dict_json_data())
-        for team in self.team_set:
-            dict_data["pDESy"].append(team.export_dict_json_data())
-        for workplace in self.workplace_set:
-            dict_data["pDESy"].append(workplace.export_dict_json_data())
         with open(file_path, "w", encoding=encoding) as f:
-            json.dump(dict_data, f, indent=indent)
+            write_json_node_stream(
+                f,
+                node_iterable,
+                indent=None if compact else indent,
+                separators=(",", ":") if compact else None,
+            )
 
     def read_simple_json(self, file_path: str, encoding: str = "utf-8"):
         """
@@ -2402,10 +4279,12 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         Returns:
             None
         """
-        pdes_json = open(file_path, "r", encoding=encoding)
-        json_data = json.load(pdes_json)
-        data = json_data["pDESy"]
-        project_json = list(filter(lambda node: node["type"] == "BaseProject", data))[0]
+        with open(file_path, "r", encoding=encoding) as pdes_json:
+            json_data = load_json(pdes_json)
+        node_json_list_dict = {}
+        for node in json_data["pDESy"]:
+            node_json_list_dict.setdefault(node["type"], []).append(node)
+        project_json = node_json_list_dict["BaseProject"][0]
         self.name = project_json["name"]
         self.ID = project_json["ID"]
         self.init_datetime = datetime.datetime.strptime(
@@ -2420,129 +4299,141 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
         ]
         self.time = project_json["time"]
         self.cost_record_list = project_json["cost_record_list"]
+        self.__task_finish_step_dict = dict(
+            project_json.get("task_finish_step_dict", {})
+        )
         self.simulation_mode = SimulationMode(project_json["simulation_mode"])
         self.status = BaseProjectStatus(project_json["status"])
+        self.record_policy = RecordPolicy(
+            project_json.get("record_policy", RecordPolicy.FULL)
+        )
+        self.record_interval = project_json.get("record_interval", 1)
         # 1. read all node and attr only considering ID info
         # product
-        product_json_list = list(
-            filter(lambda node: node["type"] == "BaseProduct", data)
-        )
-        for product_json in product_json_list:
+        for product_json in node_json_list_dict.get("BaseProduct", []):
             product = BaseProduct(component_set=set())
             product.read_json_data(product_json)
             self.product_set.add(product)
         # workflow
-        workflow_json_list = list(
-            filter(lambda node: node["type"] == "BaseWorkflow", data)
-        )
-        for workflow_json in workflow_json_list:
+        for workflow_json in node_json_list_dict.get("BaseWorkflow", []):
             workflow = BaseWorkflow(task_set=set())
             workflow.read_json_data(workflow_json)
             self.workflow_set.add(workflow)
-
         # team
-        team_json_list = list(filter(lambda node: node["type"] == "BaseTeam", data))
-        for team_json in team_json_list:
+        for team_json in node_json_list_dict.get("BaseTeam", []):
             team = BaseTeam(worker_set=set())
             team.read_json_data(team_json)
             self.team_set.add(team)
-
         # workplace
-        workplace_json_list = list(
-            filter(lambda node: node["type"] == "BaseWorkplace", data)
-        )
-        for workplace_json in workplace_json_list:
+        for workplace_json in node_json_list_dict.get("BaseWorkplace", []):
             workplace = BaseWorkplace(facility_set=set())
             workplace.read_json_data(workplace_json)
             self.workplace_set.add(workplace)
 
-        all_component_set = self.get_all_component_set()
-        all_task_set = self.get_all_task_set()
-        # 2. update ID info to instance info
+        # 2. update ID info to instance info by the ID -> instance dictionaries
+        self.__initialize_child_instance_set_id_instance_dict()
+        all_component_id_set = self.component_dict.keys()
+        all_task_id_set = self.task_dict.keys()
+        all_team_id_set = self.team_dict.keys()
+        all_workplace_id_set = self.workplace_dict.keys()
         # 2-1. component
-        all_component_id_set = {component.ID for component in all_component_set}
-        all_task_id_set = {task.ID for task in all_task_set}
-        all_team_id_set = {team.ID for team in self.team_set}
-        all_workplace_id_set = {workplace.ID for workplace in self.workplace_set}
-        for c in all_component_set:
+        for c in self.component_set:
             c.child_component_id_set &= all_component_id_set
             c.targeted_task_id_set &= all_task_id_set
-            c.placed_workplace_id = (
-                [
-                    workplace.ID
-                    for workplace in self.workplace_set
-                    if workplace.ID == c.placed_workplace_id
-                ]
-                if c.placed_workplace_id is not None
-                else None
-            )
+            if c.placed_workplace_id not in all_workplace_id_set:
+                c.placed_workplace_id = None
         # 2-2. task
-        for t in all_task_set:
+        for t in self.task_set:
             t.input_task_id_dependency_set = {
-                (
-                    [task for task in all_task_set if task.ID == ID][0].ID,
-                    BaseTaskDependency(dependency_number),
-                )
+                (ID, BaseTaskDependency(dependency_number))
                 for (ID, dependency_number) in t.input_task_id_dependency_set
+                if ID in all_task_id_set
             }
             t.allocated_team_id_set &= all_team_id_set
             t.allocated_workplace_id_set &= all_workplace_id_set
-            t.target_component_id = (
-                [
-                    component.ID
-                    for component in all_component_set
-                    if component.ID == t.target_component_id
-                ][0]
-                if t.target_component_id is not None
-                else None
-            )
-
+            if t.target_component_id not in all_component_id_set:
+                t.target_component_id = None
             t.allocated_worker_facility_id_tuple_set = {
-                (w_id, f_id)
-                for (w_id, f_id) in t.allocated_worker_facility_id_tuple_set
-                if (w_id, f_id) in t.allocated_worker_facility_id_tuple_set
+                (w_id, f_id) for (w_id, f_id) in t.allocated_worker_facility_id_tuple_set
             }
-
         # 2-3. team
         for x in self.team_set:
             x.targeted_task_id_set &= all_task_id_set
-            x.parent_team_id = (
-                [team.ID for team in self.team_set if team.ID == x.parent_team_id][0]
-                if x.parent_team_id is not None
-                else None
-            )
+            if x.parent_team_id not in all_team_id_set:
+                x.parent_team_id = None
             for w in x.worker_set:
-                w.assigned_task_facility_id_tuple_set = {
-                    task.ID
-                    for task in all_task_set
-                    if task.ID in w.assigned_task_facility_id_tuple_set
-                }
-
+                w.assigned_task_facility_id_tuple_set = frozenset(
+                    (task_id, facility_id)
+                    for (task_id, facility_id) in w.assigned_task_facility_id_tuple_set
+                    if task_id in all_task_id_set
+                )
         # 2-4. workplace
         for x in self.workplace_set:
             x.targeted_task_id_set &= all_task_id_set
-            x.parent_workplace_id = (
-                [
-                    workplace.ID
-                    for workplace in self.workplace_set
-                    if workplace.ID == x.parent_workplace_id
-                ][0]
-                if x.parent_workplace_id is not None
-                else None
-            )
+            if x.parent_workplace_id not in all_workplace_id_set:
+                x.parent_workplace_id = None
             x.placed_component_id_set = {
-                component.ID
-                for component in all_component_set
-                if component.ID in x.placed_component_id_set
+                component_id
+                for component_id in x.placed_component_id_set
+                if component_id in all_component_id_set
             }
             for f in x.facility_set:
-                f.assigned_task_worker_id_tuple_set = {
-                    task.ID
-                    for task in all_task_set
-                    if task.ID in f.assigned_task_worker_id_tuple_set
-                }
+                f.assigned_task_worker_id_tuple_set = frozenset(
+                    (task_id, worker_id)
+                    for (task_id, worker_id) in f.assigned_task_worker_id_tuple_set
+                    if task_id in all_task_id_set
+                )
+
+        self.__initialize_child_instance_set_id_instance_dict()
+
+    def write_simulation_result(self, dir_path: str):
+        """
+        Write the simulation result of this project into a directory of NumPy arrays.
 
+        The states, remaining work amounts, costs, allocations and placements of all
+        instances are stored as arrays whose columns are the instances in the order
+        of the entity registry, with `header.json` including the summary of this
+        project and the IDs of instances. Each array is a `.npy` file, which can be
+        memory-mapped by `numpy.load`.
+
+        Args:
+            dir_path (str): Directory of the simulation result.
+        """
+        self.__initialize_child_instance_set_id_instance_dict()
+        write_simulation_result(
+            self, dir_path, task_finish_step_dict=self.__task_finish_step_dict
+        )
+
+    def read_simulation_result(self, dir_path: str, mmap_mode: str = None):
+        """
+        Read a simulation result written by BaseProject.write_simulation_result().
+
+        This project should have the instances with the same IDs as the simulated
+        project, e.g. the one read from its JSON file by read_simple_json.
+        Record lists and states of instances are replaced with the ones of the result.
+
+        If `mmap_mode` is given, the records are memory-mapped and only the records
+        accessed by e.g. get_worker_set_by_state or create_gantt_plotly are decoded,
+        which keeps the memory usage small for the results of long simulations.
+
+        Args:
+            dir_path (str): Directory of the simulation result.
+            mmap_mode (str, optional): Memory-map mode of numpy.load (e.g. "r").
+                Defaults to None -> all records are decoded into lists.
+
+        Raises:
+            ValueError: If the result does not match the instances of this project.
+        """
         self.__initialize_child_instance_set_id_instance_dict()
+        header = read_simulation_result(self, dir_path, mmap_mode=mmap_mode)
+        project_header = header["project"]
+        self.simulation_mode = SimulationMode(project_header["simulation_mode"])
+        self.status = BaseProjectStatus(project_header["status"])
+        self.record_policy = RecordPolicy(project_header["record_policy"])
+        self.record_interval = project_header["record_interval"]
+        self.__task_finish_step_dict = dict(
+            project_header.get("task_finish_step_dict", {})
+        )
 
     def get_all_worker_set(self):
         """
@@ -2589,7 +4480,7 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
             UserWarning,
         )
         with open(file_path, "r", encoding=encoding) as pdes_json:
-            json_data = json.load(pdes_json)
+            json_data = load_json(pdes_json)
             data = json_data["pDESy"]
             project_json = list(
                 filter(lambda node: node["type"] == "BaseProject", data)
@@ -2617,7 +4508,9 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                 )[0]
                 c.state = BaseComponentState(c_json["state"])
                 c.state_record_list.extend(
-                    [BaseComponentState(num) for num in c_json["state_record_list"]]
+                    get_state_record_list(
+                        c_json["state_record_list"], BaseComponentState
+                    )
                 )
                 c.placed_workplace_id = c_json["placed_workplace_id"]
                 c.placed_workplace_id_record_list_list.extend(
@@ -2635,14 +4528,14 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                         self.get_all_task_set(),
                     )
                 )[0]
-                task.est = j["est"]
-                task.eft = j["eft"]
-                task.lst = j["lst"]
-                task.lft = j["lft"]
+                task.est = decode_json_float(j["est"])
+                task.eft = decode_json_float(j["eft"])
+                task.lst = decode_json_float(j["lst"])
+                task.lft = decode_json_float(j["lft"])
                 task.remaining_work_amount = j["remaining_work_amount"]
                 task.state = BaseTaskState(j["state"])
                 task.state_record_list.extend(
-                    [BaseTaskState(num) for num in j["state_record_list"]],
+                    get_state_record_list(j["state_record_list"], BaseTaskState),
                 )
                 task.allocated_worker_facility_id_tuple_set = j[
                     "allocated_worker_facility_id_tuple_set"
@@ -2674,7 +4567,7 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                     )[0]
                     worker.state = BaseWorkerState(j["state"])
                     worker.state_record_list.extend(
-                        [BaseWorkerState(num) for num in j["state_record_list"]],
+                        get_state_record_list(j["state_record_list"], BaseWorkerState),
                     )
                     worker.cost_record_list.extend(j["cost_record_list"])
                     worker.assigned_task_facility_id_tuple_set = set(
@@ -2710,7 +4603,7 @@ class BaseProject(CollectionMermaidDiagramMixin, object, metaclass=ABCMeta):
                     )[0]
                     facility.state = BaseWorkerState(j["state"])
                     facility.state_record_list.extend(
-                        [BaseWorkerState(num) for num in j["state_record_list"]],
+                        get_state_record_list(j["state_record_list"], BaseWorkerState),
                     )
                     facility.cost_record_list.extend(j["cost_record_list"])
                     facility.assigned_task_worker_id_tuple_set = set(
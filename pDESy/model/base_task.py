@@ -11,6 +11,7 @@ import warnings
 from enum import IntEnum
 from typing import TYPE_CHECKING
 
+from pDESy.model.json_utils import encode_json_float
 from pDESy.model.mermaid_utils import (
     SingleNodeMermaidDiagramMixin,
     build_gantt_mermaid_steps_lines,
@@ -22,6 +23,7 @@ from pDESy.model.pdesy_utils import (
     SingleNodeCommonMixin,
     SingleNodeLogJsonMixin,
 )
+from pDESy.model.record_utils import get_record_value_list, get_state_record_list
 
 from .base_priority_rule import ResourcePriorityRuleMode, WorkplacePriorityRuleMode
 
@@ -77,6 +79,49 @@ class BaseTask(
     metaclass=abc.ABCMeta,
 ):
     _assigned_pairs_attr_name = "allocated_worker_facility_id_tuple_set"
+    _absence_state_record_attr_name = "state_record_list"
+    _absence_aux_record_attr_names = (
+        "remaining_work_amount_record_list",
+        "allocated_worker_facility_id_tuple_set_record_list",
+    )
+    _absence_initial_state_value = BaseTaskState.NONE
+    _absence_state_working_value = BaseTaskState.WORKING
+    _absence_state_ready_value = BaseTaskState.READY
+    _absence_state_finished_value = BaseTaskState.FINISHED
+    _absence_state_none_value = BaseTaskState.NONE
+    __slots__ = (
+        "ID",
+        "actual_work_amount",
+        "additional_task_flag",
+        "additional_work_amount",
+        "allocated_team_id_set",
+        "allocated_worker_facility_id_tuple_set",
+        "allocated_worker_facility_id_tuple_set_record_list",
+        "allocated_workplace_id_set",
+        "auto_task",
+        "default_progress",
+        "default_work_amount",
+        "due_time",
+        "eft",
+        "est",
+        "facility_priority_rule",
+        "fixing_allocating_facility_id_set",
+        "fixing_allocating_worker_id_set",
+        "input_task_id_dependency_set",
+        "lft",
+        "lst",
+        "name",
+        "need_facility",
+        "parent_workflow_id",
+        "remaining_work_amount",
+        "remaining_work_amount_record_list",
+        "state",
+        "state_record_list",
+        "target_component_id",
+        "work_amount_progress_of_unit_step_time",
+        "worker_priority_rule",
+        "workplace_priority_rule",
+    )
     """BaseTask.
 
     BaseTask class for expressing target workflow. This class will be used as a template.
@@ -240,16 +285,6 @@ class BaseTask(
         self.allocated_worker_facility_id_tuple_set_record_list = (
             allocated_worker_facility_id_tuple_set_record_list or []
         )
-        self._absence_state_record_attr_name = "state_record_list"
-        self._absence_aux_record_attr_names = [
-            "remaining_work_amount_record_list",
-            "allocated_worker_facility_id_tuple_set_record_list",
-        ]
-        self._absence_initial_state_value = BaseTaskState.NONE
-        self._absence_state_working_value = BaseTaskState.WORKING
-        self._absence_state_ready_value = BaseTaskState.READY
-        self._absence_state_finished_value = BaseTaskState.FINISHED
-        self._absence_state_none_value = BaseTaskState.NONE
         # --
         # Advanced parameter for customized simulation
         self.additional_work_amount = additional_work_amount or 0.0
@@ -297,16 +332,16 @@ class BaseTask(
                 if self.fixing_allocating_facility_id_set is not None
                 else None
             ),
-            "est": float(self.est),
-            "eft": float(self.eft),
-            "lst": float(self.lst),
-            "lft": float(self.lft),
+            "est": encode_json_float(self.est),
+            "eft": encode_json_float(self.eft),
+            "lst": encode_json_float(self.lst),
+            "lft": encode_json_float(self.lft),
             "remaining_work_amount": float(self.remaining_work_amount),
-            "remaining_work_amount_record_list": [
-                float(rwa) for rwa in self.remaining_work_amount_record_list
-            ],
+            "remaining_work_amount_record_list": get_record_value_list(
+                self.remaining_work_amount_record_list
+            ),
             "state": int(self.state),
-            "state_record_list": [int(state) for state in self.state_record_list],
+            "state_record_list": get_record_value_list(self.state_record_list),
             "allocated_worker_facility_id_tuple_set": [
                 [worker_id, facility_id]
                 for (
@@ -315,13 +350,7 @@ class BaseTask(
                 ) in self.allocated_worker_facility_id_tuple_set
             ],
             "allocated_worker_facility_id_tuple_set_record_list": [
-                [
-                    [worker_id, facility_id]
-                    for (
-                        worker_id,
-                        facility_id,
-                    ) in allocated_worker_facility_id_tuple_set
-                ]
+                list(allocated_worker_facility_id_tuple_set)
                 for allocated_worker_facility_id_tuple_set in self.allocated_worker_facility_id_tuple_set_record_list
             ],
         }
@@ -361,7 +390,7 @@ class BaseTask(
             ("state", BaseTaskState),
             (
                 "state_record_list",
-                lambda values: [BaseTaskState(num) for num in values],
+                lambda values: get_state_record_list(values, BaseTaskState),
             ),
             (
                 "allocated_worker_facility_id_tuple_set",
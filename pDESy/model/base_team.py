@@ -18,6 +18,7 @@ from .mermaid_utils import (
     print_mermaid_diagram as print_mermaid_diagram_lines,
 )
 from .pdesy_utils import CollectionCommonMixin, CollectionLogJsonMixin
+from .record_utils import get_record_value_list, get_state_record_list
 
 
 class BaseTeam(
@@ -303,7 +304,7 @@ class BaseTeam(
             "parent_team_id": (
                 self.parent_team_id if self.parent_team_id is not None else None
             ),
-            "cost_record_list": self.cost_record_list,
+            "cost_record_list": get_record_value_list(self.cost_record_list),
         }
 
     def _read_json_extra_fields(self, json_data: dict) -> None:
@@ -320,9 +321,9 @@ class BaseTeam(
                 facility_skill_map=w["facility_skill_map"],
                 absence_time_list=w["absence_time_list"],
                 state=BaseWorkerState(w["state"]),
-                state_record_list=[
-                    BaseWorkerState(state_num) for state_num in w["state_record_list"]
-                ],
+                state_record_list=get_state_record_list(
+                    w["state_record_list"], BaseWorkerState
+                ),
                 cost_record_list=w["cost_record_list"],
                 assigned_task_facility_id_tuple_set=set(
                     w["assigned_task_facility_id_tuple_set"]
@@ -18,6 +18,7 @@ from pDESy.model.pdesy_utils import (
     SingleNodeLogJsonMixin,
     WorkerFacilityCommonMixin,
 )
+from pDESy.model.record_utils import get_record_value_list, get_state_record_list
 
 
 class BaseWorkerState(IntEnum):
@@ -48,6 +49,26 @@ class BaseWorker(
     _state_working_value = BaseWorkerState.WORKING
     _state_absence_value = BaseWorkerState.ABSENCE
     _assigned_record_attr_name = "assigned_task_facility_id_tuple_set_record_list"
+    _assigned_pairs_attr_name = "assigned_task_facility_id_tuple_set"
+    __slots__ = (
+        "ID",
+        "absence_time_list",
+        "assigned_task_facility_id_tuple_set",
+        "assigned_task_facility_id_tuple_set_record_list",
+        "cost_per_time",
+        "cost_record_list",
+        "facility_skill_map",
+        "main_workplace_id",
+        "name",
+        "quality_skill_mean_map",
+        "quality_skill_sd_map",
+        "solo_working",
+        "state",
+        "state_record_list",
+        "team_id",
+        "workamount_skill_mean_map",
+        "workamount_skill_sd_map",
+    )
     """BaseWorker.
 
     BaseWorker class for expressing a worker. This class will be used as a template.
@@ -126,7 +147,6 @@ class BaseWorker(
         self.assigned_task_facility_id_tuple_set_record_list = (
             assigned_task_facility_id_tuple_set_record_list or []
         )
-        self._assigned_pairs_attr_name = "assigned_task_facility_id_tuple_set"
         self.facility_skill_map = facility_skill_map or {}
         # --
         # Advanced parameter for customized simulation
@@ -169,19 +189,29 @@ class BaseWorker(
                 return True
         return False
 
-    def get_quality_skill_point(self, task_name: str, seed: int = None):
+    def get_quality_skill_point(
+        self, task_name: str, seed: int = None, rng: np.random.Generator = None
+    ):
         """
         Get point of quality by this worker's contribution in this time.
 
+        BaseProject.simulate samples the same distribution for all workers at once,
+        and calls this method for each worker only when a subclass overrides it.
+
         Args:
             task_name (str): Task name.
             seed (int, optional): Random seed for reproducibility. Defaults to None.
+                This is used only when rng is None.
+            rng (numpy.random.Generator, optional): Random generator for sampling.
+                Defaults to None -> global numpy.random.
 
         Returns:
             float: Point of quality by this worker's contribution in this time.
         """
-        if seed is not None:
-            np.random.seed(seed=seed)
+        if rng is None:
+            if seed is not None:
+                np.random.seed(seed=seed)
+            rng = np.random
         if not self.has_quality_skill(task_name):
             return 0.0
         skill_mean = self.quality_skill_mean_map[task_name]
@@ -190,7 +220,7 @@ class BaseWorker(
             skill_sd = 0
         else:
             skill_sd = self.quality_skill_sd_map[task_name]
-        base_quality = np.random.normal(skill_mean, skill_sd)
+        base_quality = rng.normal(skill_mean, skill_sd)
         return base_quality  # / float(sum_of_working_task_in_this_time)
 
     def _get_log_extra_fields(self, target_step_time: int) -> list:
@@ -217,8 +247,8 @@ class BaseWorker(
             "facility_skill_map": self.facility_skill_map,
             "absence_time_list": self.absence_time_list,
             "state": int(self.state),
-            "state_record_list": [int(state) for state in self.state_record_list],
-            "cost_record_list": self.cost_record_list,
+            "state_record_list": get_record_value_list(self.state_record_list),
+            "cost_record_list": get_record_value_list(self.cost_record_list),
             "assigned_task_facility_id_tuple_set": assigned_current,
             "assigned_task_facility_id_tuple_set_record_list": assigned_history,
         }
@@ -235,7 +265,7 @@ class BaseWorker(
             ("state", BaseWorkerState),
             (
                 "state_record_list",
-                lambda values: [BaseWorkerState(state_num) for state_num in values],
+                lambda values: get_state_record_list(values, BaseWorkerState),
             ),
             "cost_record_list",
             (
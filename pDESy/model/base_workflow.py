@@ -9,6 +9,10 @@ import uuid
 import warnings
 
 from collections import deque
+from enum import IntEnum
+from heapq import heappop, heappush
+
+import numpy as np
 
 
 from pDESy.model.base_priority_rule import (
@@ -18,12 +22,31 @@ from pDESy.model.base_priority_rule import (
 
 from .base_task import BaseTask, BaseTaskDependency, BaseTaskState
 from .base_subproject_task import BaseSubProjectTask
+from .json_utils import decode_json_float
 from .mermaid_utils import (
     CollectionMermaidDiagramMixin,
     convert_steps_to_datetime_gantt_mermaid,
     print_mermaid_diagram as print_mermaid_diagram_lines,
 )
 from .pdesy_utils import CollectionCommonMixin, CollectionLogJsonMixin
+from .pert_utils import calculate_pert_data, compile_pert_graph
+from .record_utils import get_state_record_list
+
+
+class PertUpdateMode(IntEnum):
+    """PertUpdateMode.
+
+    Enum for representing how BaseWorkflow.update_pert_data recomputes PERT data.
+
+    Attributes:
+        FULL (int): Recompute all tasks from scratch.
+        INCREMENTAL (int): Propagate only from tasks whose remaining work amount changed.
+        NUMPY (int): Recompute all tasks level by level over a compiled task graph.
+    """
+
+    FULL = 0
+    INCREMENTAL = 1
+    NUMPY = 2
 
 
 class BaseWorkflow(
@@ -75,9 +98,13 @@ class BaseWorkflow(
         )
         # cache
         self._topology_cache = None
+        self._pert_cache = None
+        self._pert_graph_cache = None
 
     def __invalidate_graph_cache(self):
         self._topology_cache = None
+        self._pert_cache = None
+        self._pert_graph_cache = None
 
     def __str__(self):
         """Return the name list of BaseTask.
@@ -129,6 +156,7 @@ class BaseWorkflow(
             raise TypeError(f"task must be BaseTask, but got {type(task)}")
         self.task_set.add(task)
         task.parent_workflow_id = self.ID
+        self.__invalidate_graph_cache()
 
     def update_task_set(self, task_set: set[BaseTask]):
         """
@@ -304,18 +332,18 @@ class BaseWorkflow(
                             else None
                         ),
                         # Basic variables
-                        est=j["est"],
-                        eft=j["eft"],
-                        lst=j["lst"],
-                        lft=j["lft"],
+                        est=decode_json_float(j["est"]),
+                        eft=decode_json_float(j["eft"]),
+                        lst=decode_json_float(j["lst"]),
+                        lft=decode_json_float(j["lft"]),
                         remaining_work_amount=j["remaining_work_amount"],
                         remaining_work_amount_record_list=j[
                             "remaining_work_amount_record_list"
                         ],
                         state=BaseTaskState(j["state"]),
-                        state_record_list=[
-                            BaseTaskState(num) for num in j["state_record_list"]
-                        ],
+                        state_record_list=get_state_record_list(
+                            j["state_record_list"], BaseTaskState
+                        ),
                         allocated_worker_facility_id_tuple_set=j[
                             "allocated_worker_facility_id_tuple_set"
                         ],
@@ -354,18 +382,18 @@ class BaseWorkflow(
                             j["fixing_allocating_facility_id_set"]
                         ),
                         # Basic variables
-                        est=j["est"],
-                        eft=j["eft"],
-                        lst=j["lst"],
-                        lft=j["lft"],
+                        est=decode_json_float(j["est"]),
+                        eft=decode_json_float(j["eft"]),
+                        lst=decode_json_float(j["lst"]),
+                        lft=decode_json_float(j["lft"]),
                         remaining_work_amount=j["remaining_work_amount"],
                         remaining_work_amount_record_list=j[
                             "remaining_work_amount_record_list"
                         ],
                         state=BaseTaskState(j["state"]),
-                        state_record_list=[
-                            BaseTaskState(num) for num in j["state_record_list"]
-                        ],
+                        state_record_list=get_state_record_list(
+                            j["state_record_list"], BaseTaskState
+                        ),
                         allocated_worker_facility_id_tuple_set=j[
                             "allocated_worker_facility_id_tuple_set"
                         ],
@@ -417,6 +445,7 @@ class BaseWorkflow(
         """
         super().initialize(state_info=state_info, log_info=log_info)
         if state_info:
+            self.__invalidate_graph_cache()
             self.critical_path_length = 0.0
             self.update_pert_data(0)
 
@@ -461,16 +490,267 @@ class BaseWorkflow(
                 state_append(READY if s is WORKING else s)
                 remain_append(task.remaining_work_amount)
 
-    def update_pert_data(self, time: int):
+    def update_pert_data(
+        self, time: int, mode: PertUpdateMode = PertUpdateMode.FULL
+    ) -> set[str]:
         """
         Update PERT data (est, eft, lst, lft) of each BaseTask in task_set.
 
+        In INCREMENTAL mode, est/eft are kept relative to `time` and lst/lft are kept
+        relative to `critical_path_length` between calls. Only the tasks whose
+        remaining work amount changed since the previous call, and the tasks reached
+        from them through the dependencies, are recomputed. The results are equal to
+        the ones of FULL mode except for rounding errors of floating point numbers.
+
+        In NUMPY mode, the task graph is compiled into integer arrays once, and
+        all tasks of each level of the graph are calculated at once by NumPy.
+        This is suitable for large workflows whose graph is wide rather than deep.
+        The results are equal to the ones of FULL mode except for rounding errors.
+
         Args:
             time (int): Simulation time.
+            mode (PertUpdateMode, optional):
+                Calculation mode of PERT data. Defaults to PertUpdateMode.FULL.
+
+        Returns:
+            set[str]: IDs of tasks whose PERT data changed.
         """
+        previous_pert_data_dict = {
+            task.ID: (task.est, task.eft, task.lst, task.lft) for task in self.task_set
+        }
+        if mode == PertUpdateMode.INCREMENTAL and len(self.task_set) > 0:
+            self.__update_pert_data_incrementally(time)
+        elif mode == PertUpdateMode.NUMPY and len(self.task_set) > 0:
+            self.__update_pert_data_by_numpy(time)
+        else:
+            sorted_tasks, input_id_to_output_tasks = self.__topological_sort()
+            self.__set_est_eft_data(time, sorted_tasks, input_id_to_output_tasks)
+            self.__set_lst_lft_critical_path_data(
+                sorted_tasks, input_id_to_output_tasks
+            )
+        return {
+            task.ID
+            for task in self.task_set
+            if (task.est, task.eft, task.lst, task.lft)
+            != previous_pert_data_dict[task.ID]
+        }
+
+    def __get_pert_task_list(self) -> list[BaseTask]:
+        sorted_tasks, _ = self.__topological_sort()
+        # Tasks which are not sorted (e.g. waiting for tasks of other workflows)
+        # only receive values as in __set_est_eft_data and
+        # __set_lst_lft_critical_path_data.
+        sorted_task_id_set = {task.ID for task in sorted_tasks}
+        return sorted_tasks + [
+            task for task in self.task_set if task.ID not in sorted_task_id_set
+        ]
+
+    def __update_pert_data_by_numpy(self, time: int):
+        if self._pert_graph_cache is None:
+            sorted_tasks, _ = self.__topological_sort()
+            task_list = self.__get_pert_task_list()
+            self._pert_graph_cache = (
+                task_list,
+                compile_pert_graph(task_list, len(sorted_tasks)),
+            )
+        task_list, graph = self._pert_graph_cache
+
+        remaining_work_amount = np.array(
+            [task.remaining_work_amount for task in task_list], dtype=np.float64
+        )
+        est, eft, lst, lft, self.critical_path_length = calculate_pert_data(
+            graph, remaining_work_amount, time
+        )
+        for task, task_est, task_eft, task_lst, task_lft in zip(
+            task_list, est.tolist(), eft.tolist(), lst.tolist(), lft.tolist()
+        ):
+            task.est = task_est
+            task.eft = task_eft
+            task.lst = task_lst
+            task.lft = task_lft
+
+    def __get_pert_cache(self) -> dict:
+        if self._pert_cache is not None:
+            return self._pert_cache
+
         sorted_tasks, input_id_to_output_tasks = self.__topological_sort()
-        self.__set_est_eft_data(time, sorted_tasks, input_id_to_output_tasks)
-        self.__set_lst_lft_critical_path_data(sorted_tasks, input_id_to_output_tasks)
+        task_list = self.__get_pert_task_list()
+        index = {task.ID: i for i, task in enumerate(task_list)}
+        n = len(task_list)
+        n_sorted = len(sorted_tasks)
+
+        # Forward pass: the predecessors of each task are kept in the order in which
+        # __set_est_eft_data pushes them, so that FF and SF are folded equally.
+        pred_list = [[] for _ in range(n)]
+        output_list = [[] for _ in range(n)]
+        for i, task in enumerate(sorted_tasks):
+            for next_task, dependency in input_id_to_output_tasks.get(task.ID, []):
+                pred_list[index[next_task.ID]].append((i, dependency))
+                output_list[i].append(index[next_task.ID])
+        # Backward pass
+        succ_list = [[] for _ in range(n)]
+        input_list = [[] for _ in range(n)]
+        has_output = [False] * n
+        for k, task in enumerate(task_list):
+            for input_task_id, dependency in task.input_task_id_dependency_set:
+                j = index.get(input_task_id)
+                if j is None:
+                    continue
+                has_output[j] = True
+                if k < n_sorted:
+                    succ_list[j].append((k, dependency))
+                    input_list[k].append(j)
+
+        self._pert_cache = {
+            "task_list": task_list,
+            "pred_list": pred_list,
+            "output_list": output_list,
+            "succ_list": succ_list,
+            "input_list": input_list,
+            "is_head": [
+                len(task.input_task_id_dependency_set) == 0 for task in task_list
+            ],
+            "is_sink": [not flag for flag in has_output],
+            "sink_index_list": [i for i in range(n) if not has_output[i]],
+            "remaining_work_amount": [None] * n,
+            "est": [0.0] * n,
+            "eft": [0.0] * n,
+            "lst": [0.0] * n,
+            "lft": [0.0] * n,
+            "clamped_index_set": set(),
+            "time": None,
+        }
+        return self._pert_cache
+
+    def __update_pert_data_incrementally(self, time: int):
+        cache = self.__get_pert_cache()
+        task_list = cache["task_list"]
+        remaining_list = cache["remaining_work_amount"]
+
+        changed_index_list = [
+            i
+            for i, task in enumerate(task_list)
+            if task.remaining_work_amount != remaining_list[i]
+        ]
+        for i in changed_index_list:
+            remaining_list[i] = task_list[i].remaining_work_amount
+
+        forward_index_set = set(changed_index_list)
+        if cache["time"] is None or time < cache["time"]:
+            forward_index_set = set(range(len(task_list)))
+        elif time != cache["time"]:
+            # The lower bound 0 of FF/SF is -time in relative values,
+            # which only relaxes as time goes on.
+            forward_index_set.update(cache["clamped_index_set"])
+        cache["time"] = time
+
+        self.__propagate_relative_est_eft(cache, forward_index_set, time)
+        self.__propagate_relative_lst_lft(cache, set(changed_index_list))
+
+        est_list, eft_list = cache["est"], cache["eft"]
+        lst_list, lft_list = cache["lst"], cache["lft"]
+        self.critical_path_length = time + max(
+            eft_list[i] for i in cache["sink_index_list"]
+        )
+        critical_path_length = self.critical_path_length
+        for i, task in enumerate(task_list):
+            task.est = time + est_list[i]
+            task.eft = time + eft_list[i]
+            task.lst = critical_path_length + lst_list[i]
+            task.lft = critical_path_length + lft_list[i]
+
+    def __propagate_relative_est_eft(self, cache: dict, index_set: set, time: int):
+        FS = BaseTaskDependency.FS
+        SS = BaseTaskDependency.SS
+        FF = BaseTaskDependency.FF
+        SF = BaseTaskDependency.SF
+        pred_list, output_list = cache["pred_list"], cache["output_list"]
+        is_head = cache["is_head"]
+        remaining_list = cache["remaining_work_amount"]
+        est_list, eft_list = cache["est"], cache["eft"]
+        clamped_index_set = cache["clamped_index_set"]
+        lower_bound = -time
+
+        heap = list(index_set)
+        heap.sort()
+        while heap:
+            i = heappop(heap)
+            while heap and heap[0] == i:
+                heappop(heap)
+            remaining = remaining_list[i]
+            est = 0.0
+            eft = remaining if is_head[i] else 0.0
+            clamped = False
+            for j, dependency in pred_list[i]:
+                if dependency == FS:
+                    candidate_est = eft_list[j]
+                elif dependency == SS:
+                    candidate_est = est_list[j]
+                elif dependency == FF or dependency == SF:
+                    eft_candidate = max(
+                        eft, eft_list[j] if dependency == FF else est_list[j]
+                    )
+                    candidate_est = eft_candidate - remaining
+                    if candidate_est < lower_bound:
+                        candidate_est = lower_bound
+                        clamped = True
+                else:
+                    candidate_est = eft_list[j]
+                est = max(est, candidate_est)
+                eft = max(eft, candidate_est + remaining)
+            if clamped:
+                clamped_index_set.add(i)
+            else:
+                clamped_index_set.discard(i)
+            if est != est_list[i] or eft != eft_list[i]:
+                est_list[i] = est
+                eft_list[i] = eft
+                for k in output_list[i]:
+                    heappush(heap, k)
+
+    def __propagate_relative_lst_lft(self, cache: dict, index_set: set):
+        SS = BaseTaskDependency.SS
+        FF = BaseTaskDependency.FF
+        SF = BaseTaskDependency.SF
+        succ_list, input_list = cache["succ_list"], cache["input_list"]
+        is_sink = cache["is_sink"]
+        remaining_list = cache["remaining_work_amount"]
+        lst_list, lft_list = cache["lst"], cache["lft"]
+
+        # Tasks are popped in reverse topological order.
+        heap = [-i for i in index_set]
+        heap.sort()
+        while heap:
+            i = -heappop(heap)
+            while heap and heap[0] == -i:
+                heappop(heap)
+            remaining = remaining_list[i]
+            if is_sink[i]:
+                lft = 0.0
+                lst = -remaining
+            else:
+                lft = float("inf")
+                lst = float("inf")
+            for k, dependency in succ_list[i]:
+                if dependency == SS:
+                    candidate_lst = lst_list[k]
+                    candidate_lft = candidate_lst + remaining
+                elif dependency == FF:
+                    candidate_lst = lst_list[k]
+                    candidate_lft = min(lft_list[k], candidate_lst + remaining)
+                elif dependency == SF:
+                    candidate_lst = min(lft_list[k], lst_list[k])
+                    candidate_lft = candidate_lst + remaining
+                else:  # FS and fallback
+                    candidate_lft = lst_list[k]
+                    candidate_lst = candidate_lft - remaining
+                lst = min(lst, candidate_lst)
+                lft = min(lft, candidate_lft)
+            if lst != lst_list[i] or lft != lft_list[i]:
+                lst_list[i] = lst
+                lft_list[i] = lft
+                for j in input_list[i]:
+                    heappush(heap, -j)
 
     def __get_topology(self):
         if self._topology_cache is not None:
@@ -666,6 +946,7 @@ class BaseWorkflow(
         Note:
             This method is developed only for backward simulation.
         """
+        self.__invalidate_graph_cache()
         task_id_map = {task.ID: task for task in self.task_set}
         output_task_map = {task: set() for task in self.task_set}
         for task in self.task_set:
@@ -674,14 +955,7 @@ class BaseWorkflow(
                 if input_task is not None:
                     output_task_map[input_task].add((task.ID, dependency))
         for task in self.task_set:
-            task.dummy_output_task_id_dependency_set = task.input_task_id_dependency_set
-            task.dummy_input_task_id_dependency_set = output_task_map[task]
-        for task in self.task_set:
-            task.input_task_id_dependency_set = task.dummy_input_task_id_dependency_set
-            del (
-                task.dummy_input_task_id_dependency_set,
-                task.dummy_output_task_id_dependency_set,
-            )
+            task.input_task_id_dependency_set = output_task_map[task]
 
     def plot_simple_gantt(
         self,
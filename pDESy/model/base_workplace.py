@@ -14,12 +14,14 @@ import numpy as np
 from pDESy.model.base_task import BaseTask
 
 from .base_facility import BaseFacility, BaseFacilityState
+from .json_utils import decode_json_float, encode_json_float
 from .mermaid_utils import (
     CollectionMermaidDiagramMixin,
     convert_steps_to_datetime_gantt_mermaid,
     print_mermaid_diagram as print_mermaid_diagram_lines,
 )
 from .pdesy_utils import CollectionCommonMixin, CollectionLogJsonMixin
+from .record_utils import get_record_value_list, get_state_record_list
 
 
 class BaseWorkplace(
@@ -363,9 +365,9 @@ class BaseWorkplace(
                 if self.parent_workplace_id is not None
                 else None
             ),
-            "max_space_size": self.max_space_size,
+            "max_space_size": encode_json_float(self.max_space_size),
             "input_workplace_id_set": list(self.input_workplace_id_set),
-            "cost_record_list": self.cost_record_list,
+            "cost_record_list": get_record_value_list(self.cost_record_list),
             "placed_component_id_set": list(self.placed_component_id_set),
             "placed_component_id_set_record_list": [
                 list(record) for record in self.placed_component_id_set_record_list
@@ -385,9 +387,9 @@ class BaseWorkplace(
                 workamount_skill_sd_map=w["workamount_skill_sd_map"],
                 absence_time_list=w["absence_time_list"],
                 state=BaseFacilityState(w["state"]),
-                state_record_list=[
-                    BaseFacilityState(state_num) for state_num in w["state_record_list"]
-                ],
+                state_record_list=get_state_record_list(
+                    w["state_record_list"], BaseFacilityState
+                ),
                 cost_record_list=w["cost_record_list"],
                 assigned_task_worker_id_tuple_set=set(
                     w["assigned_task_worker_id_tuple_set"]
@@ -399,7 +401,7 @@ class BaseWorkplace(
             self.facility_set.add(facility)
         self.targeted_task_id_set = set(json_data["targeted_task_id_set"])
         self.parent_workplace_id = json_data["parent_workplace_id"]
-        self.max_space_size = json_data["max_space_size"]
+        self.max_space_size = decode_json_float(json_data["max_space_size"])
         self.input_workplace_id_set = json_data["input_workplace_id_set"]
         self.cost_record_list = json_data["cost_record_list"]
         self.placed_component_id_set = json_data["placed_component_id_set"]
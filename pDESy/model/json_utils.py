@@ -0,0 +1,166 @@
+"""Utility functions for encoding and decoding JSON files of pDESy."""
+
+import json
+import math
+from collections.abc import Sequence
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKEND_LIST = ("json", "orjson")
+
+_json_backend = "orjson" if orjson is not None else "json"
+
+
+def get_json_backend() -> str:
+    """
+    Get the name of the JSON library used for reading and writing JSON files.
+
+    Returns:
+        str: "orjson" if it is installed and selected, otherwise "json".
+    """
+    return _json_backend
+
+
+def set_json_backend(name: str) -> None:
+    """
+    Select the JSON library used for reading and writing JSON files.
+
+    Args:
+        name (str): One of JSON_BACKEND_LIST.
+
+    Raises:
+        ValueError: If the library is unknown or not installed.
+    """
+    global _json_backend
+    if name not in JSON_BACKEND_LIST:
+        raise ValueError(f"JSON backend should be one of {JSON_BACKEND_LIST}")
+    if name == "orjson" and orjson is None:
+        raise ValueError("orjson is not installed")
+    _json_backend = name
+
+
+def json_default(obj):
+    """
+    Convert objects which are not supported by JSON encoders.
+
+    IntEnum states and tuples are encoded natively as integers and arrays,
+    so this function handles only sets, record lists other than list
+    (ColumnarRecord and RunLengthRecord) and NumPy values.
+
+    Args:
+        obj (Any): Object to encode.
+
+    Returns:
+        list or int or float: JSON-serializable value.
+
+    Raises:
+        TypeError: If `obj` cannot be encoded.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    if isinstance(obj, Sequence) and not isinstance(obj, (str, bytes)):
+        return list(obj)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def encode_json_float(value: float) -> float | None:
+    """
+    Encode a float which can be infinite, e.g. the latest finish time of a task.
+
+    Infinity and NaN are not valid JSON and are rejected by orjson,
+    so they are encoded as None (null). Older versions wrote them as Infinity,
+    so this changes the data of the files written by write_simple_json.
+
+    Args:
+        value (float): Value to encode.
+
+    Returns:
+        float | None: `value`, or None if it is not finite.
+    """
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def decode_json_float(value: float | None) -> float:
+    """
+    Decode a float encoded by encode_json_float.
+
+    Args:
+        value (float | None): Encoded value.
+
+    Returns:
+        float: `value`, or infinity if it is None.
+    """
+    return math.inf if value is None else value
+
+
+def get_orjson_encode_function(
+    indent: int | str | None = None, separators: tuple[str, str] | None = None
+):
+    """
+    Get the function which encodes data into a JSON string as `json.dumps` by orjson.
+
+    orjson writes only compact JSON and JSON indented by 2 spaces,
+    so the json module should be used for the other formats.
+
+    Args:
+        indent (int | str | None, optional): Indent of `json.dumps`. Defaults to None.
+        separators (tuple[str, str] | None, optional): Separators of `json.dumps`.
+            Defaults to None.
+
+    Returns:
+        Callable[[Any], str] | None: Function encoding data into a JSON string,
+            or None if orjson is not selected or does not support the format.
+    """
+    if _json_backend != "orjson":
+        return None
+    separators = tuple(separators) if separators is not None else None
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if indent == 2 and separators in (None, (",", ": ")):
+        option |= orjson.OPT_INDENT_2
+    elif indent is not None or separators != (",", ":"):
+        return None
+    return lambda obj: orjson.dumps(obj, default=json_default, option=option).decode(
+        "utf-8"
+    )
+
+
+def loads_json(data: str | bytes):
+    """
+    Decode JSON data by the selected JSON library.
+
+    orjson does not accept NaN and Infinity, which are written in the files
+    created by older versions, so such data is decoded by the json module.
+
+    Args:
+        data (str | bytes): JSON data.
+
+    Returns:
+        Any: Decoded data.
+    """
+    if _json_backend == "orjson":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_json(fp):
+    """
+    Read and decode a JSON file by the selected JSON library.
+
+    Args:
+        fp (TextIO): File object to read.
+
+    Returns:
+        Any: Decoded data.
+    """
+    return loads_json(fp.read())
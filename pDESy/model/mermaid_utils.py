@@ -6,6 +6,8 @@ import datetime
 class SingleNodeMermaidDiagramMixin:
     """Mixin for building Mermaid diagram lines."""
 
+    __slots__ = ()
+
     def _get_mermaid_label(self, print_extra_info: bool = False, **kwargs) -> str:
         raise NotImplementedError
 
@@ -0,0 +1,148 @@
+"""Utility functions for running simulation replications in parallel."""
+
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+_worker_project = None
+_worker_task_id_list = None
+
+
+def _initialize_worker(project_bytes: bytes, task_id_list: list[str]) -> None:
+    """Deserialize the project once per worker process."""
+    global _worker_project, _worker_task_id_list
+    _worker_project = pickle.loads(project_bytes)
+    _worker_task_id_list = task_id_list
+
+
+def _run_replication(job: tuple[int, int | None, dict]) -> dict:
+    """Run one replication on the project of this worker process."""
+    run_index, seed, simulate_kwargs = job
+    project = _worker_project
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore", message="Time Over!", category=UserWarning
+        )
+        project.simulate(rng=np.random.default_rng(seed), **simulate_kwargs)
+    task_list = [project.task_dict[task_id] for task_id in _worker_task_id_list]
+    return {
+        "run_index": run_index,
+        "seed": seed,
+        "status": int(project.status),
+        "makespan": float(project.time),
+        "total_cost": float(sum(project.cost_record_list)),
+        "task_finish_time": project.get_task_finish_time_list(task_list),
+    }
+
+
+def get_replication_seed_list(n_runs: int, seed: int | None = None) -> list:
+    """
+    Get independent seeds of replications derived from one seed.
+
+    Args:
+        n_runs (int): Number of replications.
+        seed (int, optional): Root seed. Defaults to None -> replications are not seeded,
+            i.e. each replication uses fresh entropy.
+
+    Returns:
+        list: Seed of each replication.
+    """
+    if seed is None:
+        return [None] * n_runs
+    return [
+        int(child.generate_state(1)[0])
+        for child in np.random.SeedSequence(seed).spawn(n_runs)
+    ]
+
+
+def iter_parallel_simulation(
+    project,
+    n_runs: int | None = None,
+    seed: int | None = None,
+    simulate_kwargs_list: list[dict] | None = None,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+    **simulate_kwargs,
+):
+    """
+    Run simulation replications of a project in a process pool.
+
+    The project is serialized once and deserialized once per worker process.
+    Each replication runs on the copy of the worker with its own
+    numpy.random.Generator, and only a summary of each replication is sent back.
+    The arguments are checked when this function is called, and the replications
+    run while the returned iterator is consumed.
+
+    Args:
+        project (BaseProject): Target project.
+        n_runs (int, optional):
+            Number of seeded replications with the same simulation settings.
+            Defaults to None -> len(simulate_kwargs_list).
+        seed (int, optional):
+            Root seed of replications. Defaults to None.
+        simulate_kwargs_list (list[dict], optional):
+            Keyword arguments of BaseProject.simulate for each parameter variant.
+            Defaults to None.
+        max_workers (int, optional):
+            Maximum number of worker processes. Defaults to None -> number of CPUs.
+        chunksize (int, optional):
+            Number of replications sent to a worker at once. Defaults to 1.
+        **simulate_kwargs:
+            Keyword arguments of BaseProject.simulate common to all replications.
+
+    Returns:
+        Iterator[dict]: Summary of each replication in the order of replications with keys
+            "run_index", "seed", "status", "makespan", "total_cost" and "task_finish_time".
+            "task_finish_time" is ordered as
+            [task for workflow in project.workflow_set for task in workflow.task_set].
+
+    Raises:
+        ValueError: If neither n_runs nor simulate_kwargs_list is given,
+            n_runs does not match the length of simulate_kwargs_list,
+            or rng is given in simulate_kwargs or simulate_kwargs_list.
+    """
+    if simulate_kwargs_list is None:
+        if n_runs is None:
+            raise ValueError("n_runs or simulate_kwargs_list should be given")
+        simulate_kwargs_list = [{}] * n_runs
+    elif n_runs is None:
+        n_runs = len(simulate_kwargs_list)
+    elif n_runs != len(simulate_kwargs_list):
+        raise ValueError("n_runs should be equal to len(simulate_kwargs_list)")
+    if "rng" in simulate_kwargs or any(
+        "rng" in variant_kwargs for variant_kwargs in simulate_kwargs_list
+    ):
+        raise ValueError(
+            "rng cannot be given because each replication uses its own "
+            "random generator derived from seed"
+        )
+
+    task_id_list = [
+        task.ID for workflow in project.workflow_set for task in workflow.task_set
+    ]
+    seed_list = get_replication_seed_list(n_runs, seed)
+    job_list = [
+        (run_index, seed_list[run_index], {**simulate_kwargs, **variant_kwargs})
+        for run_index, variant_kwargs in enumerate(simulate_kwargs_list)
+    ]
+    return _iter_replication_result(
+        project, task_id_list, job_list, max_workers, chunksize
+    )
+
+
+def _iter_replication_result(
+    project,
+    task_id_list: list[str],
+    job_list: list[tuple],
+    max_workers: int | None,
+    chunksize: int,
+):
+    """Run the replications in a process pool and yield their summaries in order."""
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_initialize_worker,
+        initargs=(pickle.dumps(project), task_id_list),
+    ) as executor:
+        yield from executor.map(_run_replication, job_list, chunksize=chunksize)
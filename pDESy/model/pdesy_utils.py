@@ -1,5 +1,10 @@
 """Utility functions for core pDESy logic."""
 
+import json
+
+from .json_utils import get_orjson_encode_function, json_default
+from .record_utils import iter_record_runs
+
 
 def build_time_lists_from_state_record(
     state_record_list,
@@ -8,30 +13,19 @@ def build_time_lists_from_state_record(
     buckets: list[str] | None = None,
     include_empty: bool = False,
 ) -> dict[str, list[tuple[int, int]]]:
-    """Build time lists from state records using a state-to-bucket mapping."""
+    """Build time lists from state records using a state-to-bucket mapping.
+
+    Run-length encoded and columnar records are consumed by their runs.
+    """
     if buckets is None:
         buckets = sorted({bucket for bucket in state_to_bucket.values() if bucket})
     time_lists = {bucket: [] for bucket in buckets}
-    previous_state = None
-    from_time = -1
-    time = -1
-    for time, state in enumerate(state_record_list):
-        if state != previous_state:
-            if from_time == -1:
-                from_time = time
-            else:
-                bucket = state_to_bucket.get(previous_state)
-                if bucket:
-                    time_lists[bucket].append(
-                        (from_time, (time - 1) - from_time + finish_margin)
-                    )
-                from_time = time
-            previous_state = state
-
-    if from_time > -1:
-        bucket = state_to_bucket.get(previous_state)
+    for from_time, to_time, state in iter_record_runs(state_record_list):
+        bucket = state_to_bucket.get(state)
         if bucket:
-            time_lists[bucket].append((from_time, time - from_time + finish_margin))
+            time_lists[bucket].append(
+                (from_time, (to_time - 1) - from_time + finish_margin)
+            )
 
     if include_empty:
         for bucket in buckets:
@@ -63,6 +57,8 @@ def print_basic_log_fields(*fields) -> None:
 class SingleNodeLogJsonMixin:
     """Mixin for log printing and JSON export/import (single node)."""
 
+    __slots__ = ()
+
     def _get_log_extra_fields(self, target_step_time: int) -> list:
         return []
 
@@ -168,6 +164,67 @@ def build_json_base_dict(instance, **extra) -> dict:
     return data
 
 
+def write_json_node_stream(
+    fp,
+    node_iterable,
+    root_key: str = "pDESy",
+    indent: int | str | None = None,
+    separators: tuple[str, str] | None = None,
+) -> None:
+    """
+    Write `{root_key: [node, ...]}` to a file as `json.dump`, encoding one node at a time.
+
+    Nodes are taken from `node_iterable` lazily, so that only one node is kept in
+    memory while writing. The output is the same as `json.dump` of the whole data
+    with the same `indent` and `separators`. Sets and records in the nodes are
+    encoded by `json_default`. If orjson is selected and supports the format
+    (see `get_orjson_encode_function`), nodes are encoded by orjson, whose output
+    is the same data although some numbers and non-ASCII characters are written
+    in different forms.
+
+    Args:
+        fp (TextIO): File object to write.
+        node_iterable (Iterable[dict]): JSON data of each node.
+        root_key (str, optional): Key of the node list. Defaults to "pDESy".
+        indent (int | str | None, optional): Indent of `json.dump`. Defaults to None.
+        separators (tuple[str, str] | None, optional): Separators of `json.dump`.
+            Defaults to None.
+    """
+    encoder = json.JSONEncoder(
+        indent=indent, separators=separators, default=json_default
+    )
+    item_separator = encoder.item_separator
+    key_separator = encoder.key_separator
+    # orjson is used if it is selected and supports the format.
+    encode = get_orjson_encode_function(indent=indent, separators=separators)
+    if indent is None:
+        fp.write("{" + json.dumps(root_key) + key_separator + "[")
+        for i, node in enumerate(node_iterable):
+            if i > 0:
+                fp.write(item_separator)
+            # encode() uses the C encoder of the json module without indent,
+            # while iterencode() always falls back to the Python encoder.
+            fp.write(encoder.encode(node) if encode is None else encode(node))
+        fp.write("]}")
+        return
+
+    indent_str = " " * indent if isinstance(indent, int) else indent
+    root_newline = "\n" + indent_str
+    node_newline = root_newline + indent_str
+    fp.write("{" + root_newline + json.dumps(root_key) + key_separator + "[")
+    empty = True
+    for node in node_iterable:
+        fp.write(("" if empty else item_separator) + node_newline)
+        empty = False
+        # JSON strings have no raw newlines, so each newline is an indentation.
+        if encode is not None:
+            fp.write(encode(node).replace("\n", node_newline))
+            continue
+        for chunk in encoder.iterencode(node):
+            fp.write(chunk.replace("\n", node_newline))
+    fp.write(("]" if empty else root_newline + "]") + "\n}")
+
+
 def read_json_basic_fields(instance, json_data: dict) -> None:
     """Populate common fields from JSON data."""
     instance.name = json_data["name"]
@@ -177,6 +234,8 @@ def read_json_basic_fields(instance, json_data: dict) -> None:
 class AssignedPairsMixin:
     """Mixin for managing assigned pairs as an immutable set."""
 
+    __slots__ = ()
+
     _assigned_pairs_attr_name: str = ""
 
     def _get_assigned_pairs(self):
@@ -219,6 +278,8 @@ class AssignedPairsMixin:
 class WorkerFacilityCommonMixin:
     """Mixin for shared worker/facility behavior."""
 
+    __slots__ = ()
+
     _state_record_attr_name: str = "state_record_list"
     _cost_record_attr_name: str = "cost_record_list"
     _assigned_record_attr_name: str = ""
@@ -342,8 +403,10 @@ class WorkerFacilityCommonMixin:
 class ComponentTaskCommonMixin:
     """Mixin for component/task shared behavior."""
 
+    __slots__ = ()
+
     _absence_state_record_attr_name: str = ""
-    _absence_aux_record_attr_names: list[str] = []
+    _absence_aux_record_attr_names: tuple[str, ...] = ()
     _absence_initial_state_value = None
     _absence_state_working_value = None
     _absence_state_ready_value = None
@@ -418,6 +481,8 @@ class ComponentTaskCommonMixin:
 class SingleNodeCommonMixin:
     """Mixin for single-node shared behavior."""
 
+    __slots__ = ()
+
     def _get_reverse_log_lists(self) -> list[list]:
         return []
 
@@ -0,0 +1,214 @@
+"""Utility functions for calculating PERT data over a compiled task graph."""
+
+import numpy as np
+
+from .base_task import BaseTaskDependency
+
+
+def _get_level_array(
+    n: int, row_array: np.ndarray, column_array: np.ndarray, reverse: bool = False
+) -> np.ndarray:
+    """Get the longest path length from the nodes which have no edges to each node."""
+    level = np.zeros(n, dtype=np.int64)
+    column_list_of_row = [[] for _ in range(n)]
+    for row, column in zip(row_array.tolist(), column_array.tolist()):
+        column_list_of_row[row].append(column)
+    # Columns of a row always come before the row in the node order
+    # (after the row in reverse order).
+    for row in range(n - 1, -1, -1) if reverse else range(n):
+        if column_list_of_row[row]:
+            level[row] = 1 + max(level[column] for column in column_list_of_row[row])
+    return level
+
+
+def _compile_csr(
+    n: int,
+    row_array: np.ndarray,
+    column_array: np.ndarray,
+    dependency_array: np.ndarray,
+    reverse: bool = False,
+) -> dict:
+    """Compile edges into CSR arrays whose rows are ordered by level."""
+    level = _get_level_array(n, row_array, column_array, reverse=reverse)
+    order = np.lexsort((row_array, level[row_array]))
+    row_array = row_array[order]
+    column_array = column_array[order]
+    dependency_array = dependency_array[order]
+
+    row_node, row_start, row_count = np.unique(
+        row_array, return_index=True, return_counts=True
+    )
+    # np.unique sorts by node, so restore the level order of rows.
+    row_order = np.argsort(row_start, kind="stable")
+    row_node = row_node[row_order]
+    indptr = np.zeros(len(row_node) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(row_count[row_order])
+
+    row_level = level[row_node]
+    level_row_ptr = [
+        0,
+        *(np.flatnonzero(np.diff(row_level)) + 1).tolist(),
+        len(row_node),
+    ]
+    return {
+        "row_node": row_node,
+        "indptr": indptr,
+        "indices": column_array,
+        "edge_row_node": row_array,
+        "dependency": dependency_array,
+        "level_range_list": [
+            (level_row_ptr[i], level_row_ptr[i + 1])
+            for i in range(len(level_row_ptr) - 1)
+            if level_row_ptr[i] < level_row_ptr[i + 1]
+        ],
+    }
+
+
+def compile_pert_graph(task_list: list, n_sorted: int) -> dict:
+    """
+    Compile the dependencies of tasks into arrays for calculating PERT data.
+
+    The forward graph has a row for each task which has input tasks, and the backward
+    graph has a row for each task which has output tasks. Both are stored in CSR format
+    whose rows are ordered by the level of the longest path, and the dependency type
+    of each edge is kept as an integer array aligned with the column indices.
+
+    Args:
+        task_list (list[BaseTask]):
+            Tasks of a workflow. The first `n_sorted` tasks should be in topological order.
+        n_sorted (int):
+            Number of tasks which are sorted topologically. The other tasks are the ones
+            waiting for tasks outside of the workflow, and they do not propagate PERT data
+            as BaseWorkflow.update_pert_data in FULL mode.
+
+    Returns:
+        dict: Compiled task graph.
+    """
+    n = len(task_list)
+    index = {task.ID: i for i, task in enumerate(task_list)}
+    input_list, output_list, dependency_list = [], [], []
+    for i, task in enumerate(task_list):
+        for input_task_id, dependency in task.input_task_id_dependency_set:
+            j = index.get(input_task_id)
+            if j is not None:
+                input_list.append(j)
+                output_list.append(i)
+                dependency_list.append(int(dependency))
+    input_array = np.array(input_list, dtype=np.int64)
+    output_array = np.array(output_list, dtype=np.int64)
+    dependency_array = np.array(dependency_list, dtype=np.int8)
+
+    is_sink = np.ones(n, dtype=bool)
+    is_sink[input_array] = False
+
+    forward = input_array < n_sorted
+    backward = output_array < n_sorted
+    return {
+        "is_head": np.array(
+            [len(task.input_task_id_dependency_set) == 0 for task in task_list],
+            dtype=bool,
+        ),
+        "is_sink": is_sink,
+        "forward": _compile_csr(
+            n,
+            output_array[forward],
+            input_array[forward],
+            dependency_array[forward],
+        ),
+        "backward": _compile_csr(
+            n,
+            input_array[backward],
+            output_array[backward],
+            dependency_array[backward],
+            reverse=True,
+        ),
+    }
+
+
+def calculate_pert_data(
+    graph: dict, remaining_work_amount: np.ndarray, time: int
+) -> tuple:
+    """
+    Calculate PERT data over a compiled task graph.
+
+    Each level of the graph is calculated at once, and the candidates of each task
+    are reduced by `np.maximum.reduceat` or `np.minimum.reduceat`.
+
+    Args:
+        graph (dict): Compiled task graph by `compile_pert_graph`.
+        remaining_work_amount (numpy.ndarray): Remaining work amount of each task.
+        time (int): Simulation time.
+
+    Returns:
+        tuple: est, eft, lst, lft (numpy.ndarray) of each task and critical path length.
+    """
+    FS = int(BaseTaskDependency.FS)
+    SS = int(BaseTaskDependency.SS)
+    FF = int(BaseTaskDependency.FF)
+    SF = int(BaseTaskDependency.SF)
+    n = len(remaining_work_amount)
+
+    # Forward pass
+    est = np.full(n, float(time))
+    eft = np.full(n, float(time))
+    is_head = graph["is_head"]
+    eft[is_head] += remaining_work_amount[is_head]
+
+    forward = graph["forward"]
+    row_node, indptr = forward["row_node"], forward["indptr"]
+    for r0, r1 in forward["level_range_list"]:
+        e0, e1 = indptr[r0], indptr[r1]
+        src = forward["indices"][e0:e1]
+        dependency = forward["dependency"][e0:e1]
+        start = (dependency == SS) | (dependency == SF)
+        bounded = (dependency == FF) | (dependency == SF)
+        candidate_est = np.where(start, est[src], eft[src])
+        candidate_est = np.where(
+            bounded,
+            np.maximum(
+                candidate_est
+                - remaining_work_amount[forward["edge_row_node"][e0:e1]],
+                0.0,
+            ),
+            candidate_est,
+        )
+        node = row_node[r0:r1]
+        max_candidate_est = np.maximum.reduceat(candidate_est, indptr[r0:r1] - e0)
+        est[node] = np.maximum(est[node], max_candidate_est)
+        eft[node] = np.maximum(
+            eft[node], max_candidate_est + remaining_work_amount[node]
+        )
+
+    # Backward pass
+    is_sink = graph["is_sink"]
+    critical_path_length = float(eft[is_sink].max())
+    lft = np.full(n, np.inf)
+    lst = np.full(n, np.inf)
+    lft[is_sink] = critical_path_length
+    lst[is_sink] = critical_path_length - remaining_work_amount[is_sink]
+
+    backward = graph["backward"]
+    row_node, indptr = backward["row_node"], backward["indptr"]
+    for r0, r1 in backward["level_range_list"]:
+        e0, e1 = indptr[r0], indptr[r1]
+        dst = backward["indices"][e0:e1]
+        dependency = backward["dependency"][e0:e1]
+        remaining = remaining_work_amount[backward["edge_row_node"][e0:e1]]
+        dst_lst = lst[dst]
+        dst_lft = lft[dst]
+        candidate_lst = np.where(
+            dependency == SF, np.minimum(dst_lft, dst_lst), dst_lst
+        )
+        candidate_lft = candidate_lst + remaining
+        candidate_lft = np.where(
+            dependency == FF, np.minimum(dst_lft, candidate_lft), candidate_lft
+        )
+        is_fs = dependency == FS
+        candidate_lst = np.where(is_fs, dst_lst - remaining, candidate_lst)
+        candidate_lft = np.where(is_fs, dst_lst, candidate_lft)
+        node = row_node[r0:r1]
+        offset = indptr[r0:r1] - e0
+        lst[node] = np.minimum.reduceat(candidate_lst, offset)
+        lft[node] = np.minimum.reduceat(candidate_lft, offset)
+
+    return est, eft, lst, lft, critical_path_length
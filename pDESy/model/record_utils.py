@@ -0,0 +1,716 @@
+"""Utility classes for recording simulation logs into NumPy buffers."""
+
+from bisect import bisect_right
+from collections.abc import MutableSequence
+from enum import IntEnum
+
+import numpy as np
+
+
+class RecordMode(IntEnum):
+    """RecordMode.
+
+    Storage of the logs recorded in each step of simulation.
+
+    Attributes:
+        LIST (int): Append Python objects to the record lists of each instance.
+        COLUMNAR (int): Write the states, remaining work amounts and costs of all
+            instances of each type as one row of preallocated NumPy buffers.
+        RLE (int): Store the states of each instance as runs of the same state
+            by RunLengthRecord. Remaining work amounts and costs are appended
+            to lists as LIST mode.
+
+    In COLUMNAR and RLE modes, the records of allocations and placements are
+    RunLengthRecord whose values are interned, so that they store only the changes.
+    """
+
+    LIST = 0
+    COLUMNAR = 1
+    RLE = 2
+
+
+class RecordPolicy(IntEnum):
+    """RecordPolicy.
+
+    Steps in which the logs of instances are recorded in simulation.
+    The logs of the steps which are not recorded hold the values of the last
+    recorded step, so that each record list still has one value per step.
+    The cost record list of the project is recorded in every step by all policies.
+    In INTERVAL and TRANSITION policies, the record lists of instances are
+    RunLengthRecord except in COLUMNAR record mode, so that the steps which are not
+    recorded only extend the runs of the recorded values.
+
+    Attributes:
+        FULL (int): Record every step.
+        INTERVAL (int): Record every `record_interval` steps.
+        TRANSITION (int): Record only the steps in which any state, allocation or
+            placement of instances changed. Remaining work amounts of tasks are held
+            between these steps.
+        NONE (int): Record no logs of instances. Only the time, the status and
+            the cost record list of the project are kept as summary.
+    """
+
+    FULL = 0
+    INTERVAL = 1
+    TRANSITION = 2
+    NONE = 3
+
+
+class ColumnarBuffer:
+    """ColumnarBuffer.
+
+    Preallocated two-dimensional (time x instance) buffer which grows geometrically.
+
+    Args:
+        n_column (int): Number of instances.
+        dtype (numpy.dtype): Data type of records.
+        initial_capacity (int, optional): Number of rows allocated first. Defaults to 256.
+    """
+
+    def __init__(self, n_column: int, dtype, initial_capacity: int = 256):
+        """Initialize a buffer without rows."""
+        self.array = np.zeros((max(initial_capacity, 1), n_column), dtype=dtype)
+        self.length = 0
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "ColumnarBuffer":
+        """
+        Create a buffer whose rows are an existing array without copying it.
+
+        The array can be a read-only memory-mapped array, because appending rows
+        to the buffer allocates a new array.
+
+        Args:
+            array (numpy.ndarray): Records whose shape is (number of steps, number of instances).
+
+        Returns:
+            ColumnarBuffer: Buffer of the records.
+        """
+        buffer = cls.__new__(cls)
+        buffer.array = array
+        buffer.length = len(array)
+        return buffer
+
+    def __reserve(self, n_row: int) -> None:
+        capacity = len(self.array)
+        if self.length + n_row <= capacity:
+            return
+        while self.length + n_row > capacity:
+            capacity *= 2
+        array = np.zeros((capacity, self.array.shape[1]), dtype=self.array.dtype)
+        array[: self.length] = self.array[: self.length]
+        self.array = array
+
+    def append_row(self, row) -> None:
+        """
+        Append the records of all instances in one step.
+
+        Args:
+            row (list): Record of each instance.
+        """
+        if self.length == len(self.array):
+            self.__reserve(1)
+        # np.fromiter converts enum members faster than the assignment of a list.
+        self.array[self.length] = np.fromiter(
+            row, dtype=self.array.dtype, count=self.array.shape[1]
+        )
+        self.length += 1
+
+    def extend_rows(self, rows: np.ndarray) -> None:
+        """
+        Append the records of all instances in several steps.
+
+        Args:
+            rows (numpy.ndarray): Records whose shape is (number of steps, number of instances).
+        """
+        self.__reserve(len(rows))
+        self.array[self.length : self.length + len(rows)] = rows
+        self.length += len(rows)
+
+    def repeat_last_row(self, n_row: int) -> None:
+        """
+        Append the last row several times.
+
+        Args:
+            n_row (int): Number of appended rows.
+        """
+        if n_row <= 0 or self.length == 0:
+            return
+        self.__reserve(n_row)
+        self.array[self.length : self.length + n_row] = self.array[self.length - 1]
+        self.length += n_row
+
+    def get_column(self, column: int) -> np.ndarray:
+        """
+        Get the recorded values of one instance.
+
+        Args:
+            column (int): Index of the instance.
+
+        Returns:
+            numpy.ndarray: View of the recorded values.
+        """
+        return self.array[: self.length, column]
+
+
+class ColumnarRecord(MutableSequence):
+    """ColumnarRecord.
+
+    Lazy list view of the records of one instance in a ColumnarBuffer.
+
+    Values are decoded only when they are read. The first modification of this view
+    (e.g. by `remove_absence_time_list` or `insert_absence_time_list`) copies the records
+    into a Python list, and this view works as the list after that.
+
+    Args:
+        buffer (ColumnarBuffer): Buffer of the records.
+        column (int): Index of the instance in `buffer`.
+        value_type (type[IntEnum], optional): Enum type of recorded states.
+            Defaults to None -> values are returned as Python numbers.
+        value_dict (dict, optional): Mapping from recorded integers to values, which is
+            used instead of `value_type` (e.g. for IDs). Defaults to None.
+    """
+
+    def __init__(
+        self,
+        buffer: ColumnarBuffer,
+        column: int,
+        value_type=None,
+        value_dict: dict | None = None,
+    ):
+        """Initialize a view of one column of `buffer`."""
+        self._buffer = buffer
+        self._column = column
+        if value_dict is None and value_type is not None:
+            value_dict = {int(value): value for value in value_type}
+        self._value_dict = value_dict
+        self._reversed = False
+        self._list = None
+
+    def _get_values(self) -> np.ndarray:
+        values = self._buffer.get_column(self._column)
+        return values[::-1] if self._reversed else values
+
+    def _decode(self, values: np.ndarray) -> list:
+        if self._value_dict is None:
+            return values.tolist()
+        value_dict = self._value_dict
+        return [value_dict[value] for value in values.tolist()]
+
+    def _materialize(self) -> list:
+        if self._list is None:
+            self._list = self._decode(self._get_values())
+            self._buffer = None
+        return self._list
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Get the records as a NumPy array without decoding them.
+
+        Returns:
+            numpy.ndarray: Recorded values. States are returned as their integer values.
+        """
+        if self._list is not None:
+            return np.array(self._list)
+        return self._get_values()
+
+    def set_last_values(self, value_list: list) -> None:
+        """
+        Overwrite the last records without copying the records into a list.
+
+        Args:
+            value_list (list): New values of the last `len(value_list)` records.
+        """
+        n = len(value_list)
+        if n == 0:
+            return
+        if self._list is not None or self._reversed:
+            self._materialize()[-n:] = self._decode(np.asarray(value_list))
+            return
+        buffer = self._buffer
+        buffer.array[buffer.length - n : buffer.length, self._column] = value_list
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        if self._list is not None:
+            return len(self._list)
+        return self._buffer.length
+
+    def __getitem__(self, index):
+        """Return the decoded record(s) at `index`."""
+        if self._list is not None:
+            return self._list[index]
+        values = self._get_values()[index]
+        if isinstance(index, slice):
+            return self._decode(values)
+        value = values.item()
+        return value if self._value_dict is None else self._value_dict[value]
+
+    def __setitem__(self, index, value) -> None:
+        """Set the record(s) at `index`."""
+        self._materialize()[index] = value
+
+    def __delitem__(self, index) -> None:
+        """Delete the record(s) at `index`."""
+        del self._materialize()[index]
+
+    def insert(self, index: int, value) -> None:
+        """Insert a record before `index`."""
+        self._materialize().insert(index, value)
+
+    def reverse(self) -> None:
+        """Reverse the records in place."""
+        if self._list is not None:
+            self._list.reverse()
+        else:
+            self._reversed = not self._reversed
+
+    def __iter__(self):
+        """Iterate over the decoded records."""
+        if self._list is not None:
+            return iter(self._list)
+        return iter(self._decode(self._get_values()))
+
+    def index(self, value, start: int = 0, stop: int | None = None) -> int:
+        """
+        Return the first index of `value`.
+
+        Raises:
+            ValueError: If `value` is not recorded.
+        """
+        if self._list is not None:
+            if stop is None:
+                return self._list.index(value, start)
+            return self._list.index(value, start, stop)
+        values = self._get_values()
+        start, stop, _ = slice(start, stop).indices(len(values))
+        values = values[start:stop]
+        if self._value_dict is None or isinstance(value, int):
+            index_array = np.flatnonzero(values == value)
+        else:
+            code_list = [
+                code
+                for code in np.unique(values).tolist()
+                if self._value_dict[code] == value
+            ]
+            index_array = np.flatnonzero(np.isin(values, code_list))
+        if len(index_array) == 0:
+            raise ValueError(f"{value} is not in record")
+        return start + int(index_array[0])
+
+    def iter_runs(self):
+        """
+        Iterate over the runs of the same record.
+
+        Yields:
+            tuple: Start step, stop step (exclusive) and record of each run.
+        """
+        if self._list is not None:
+            yield from iter_record_runs(self._list)
+            return
+        values = self._get_values()
+        if len(values) == 0:
+            return
+        boundary_list = (np.flatnonzero(values[1:] != values[:-1]) + 1).tolist()
+        start_list = [0, *boundary_list]
+        stop_list = [*boundary_list, len(values)]
+        yield from zip(start_list, stop_list, self._decode(values[start_list]))
+
+    def __eq__(self, other) -> bool:
+        """Compare the records with a list or another record."""
+        if isinstance(other, (list, ColumnarRecord, RunLengthRecord)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Return the representation of the records as a list."""
+        return repr(list(self))
+
+
+class RunLengthRecord(MutableSequence):
+    """RunLengthRecord.
+
+    Record list which stores only the start step and the value of each run of
+    the same value, so that its memory is bounded by the number of transitions.
+    It supports `len`, indexing, slicing and modification as a list.
+
+    If `intern_dict` is given, sets are recorded as frozensets, and the value of each
+    run is shared with the equal values in `intern_dict`. The same `intern_dict` can
+    be shared by several records, e.g. all allocation records of a project.
+
+    Args:
+        iterable (Iterable, optional): Initial records. Defaults to ().
+        intern_dict (dict, optional): Dictionary of interned values. Defaults to None.
+    """
+
+    def __init__(self, iterable=(), intern_dict: dict | None = None):
+        """Initialize a record with the runs of `iterable`."""
+        self._start_list = []
+        self._value_list = []
+        self._length = 0
+        self._intern_dict = intern_dict
+        for value in iterable:
+            self.append(value)
+
+    @staticmethod
+    def _is_same(value, other) -> bool:
+        return value is other or (type(value) is type(other) and value == other)
+
+    def _freeze(self, value):
+        if self._intern_dict is not None and isinstance(value, set):
+            return frozenset(value)
+        return value
+
+    def _intern(self, value):
+        if self._intern_dict is None:
+            return value
+        try:
+            return self._intern_dict.setdefault(value, value)
+        except TypeError:
+            # Unhashable values are recorded without interning.
+            return value
+
+    def _get_run_index(self, index: int) -> int:
+        return bisect_right(self._start_list, index) - 1
+
+    def _get_run_stop(self, run_index: int) -> int:
+        if run_index + 1 < len(self._start_list):
+            return self._start_list[run_index + 1]
+        return self._length
+
+    def _shift_start(self, run_index: int, offset: int) -> None:
+        """Shift the start steps of runs from `run_index`."""
+        start_list = self._start_list
+        for i in range(run_index, len(start_list)):
+            start_list[i] += offset
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("record index out of range")
+        return index
+
+    def _reset(self, record_list: list) -> None:
+        self._start_list = []
+        self._value_list = []
+        self._length = 0
+        for value in record_list:
+            self.append(value)
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return self._length
+
+    def __getitem__(self, index):
+        """Return the record(s) at `index`."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        return self._value_list[self._get_run_index(self._normalize_index(index))]
+
+    def __setitem__(self, index, value) -> None:
+        """Set the record(s) at `index`."""
+        record_list = list(self)
+        record_list[index] = value
+        self._reset(record_list)
+
+    def __delitem__(self, index) -> None:
+        """Delete the record(s) at `index`."""
+        if isinstance(index, slice):
+            record_list = list(self)
+            del record_list[index]
+            self._reset(record_list)
+            return
+        run_index = self._get_run_index(self._normalize_index(index))
+        run_length = self._get_run_stop(run_index) - self._start_list[run_index]
+        self._length -= 1
+        if run_length > 1:
+            self._shift_start(run_index + 1, -1)
+            return
+        # The run becomes empty, so it is removed and its neighbors may be merged.
+        del self._start_list[run_index]
+        del self._value_list[run_index]
+        self._shift_start(run_index, -1)
+        if 0 < run_index < len(self._start_list) and self._is_same(
+            self._value_list[run_index - 1], self._value_list[run_index]
+        ):
+            del self._start_list[run_index]
+            del self._value_list[run_index]
+
+    def insert(self, index: int, value) -> None:
+        """Insert a record before `index`."""
+        value = self._freeze(value)
+        if index < 0:
+            index = max(index + self._length, 0)
+        if index >= self._length:
+            self.append(value)
+            return
+        run_index = self._get_run_index(index)
+        start = self._start_list[run_index]
+        if self._is_same(self._value_list[run_index], value):
+            self._shift_start(run_index + 1, 1)
+        elif index == start and (
+            run_index > 0 and self._is_same(self._value_list[run_index - 1], value)
+        ):
+            self._shift_start(run_index, 1)
+        elif index == start:
+            self._shift_start(run_index, 1)
+            self._start_list.insert(run_index, index)
+            self._value_list.insert(run_index, self._intern(value))
+        else:
+            # Split the run into the runs before and after the inserted record.
+            self._shift_start(run_index + 1, 1)
+            self._start_list[run_index + 1 : run_index + 1] = [index, index + 1]
+            self._value_list[run_index + 1 : run_index + 1] = [
+                self._intern(value),
+                self._value_list[run_index],
+            ]
+        self._length += 1
+
+    def append(self, value) -> None:
+        """Append a record."""
+        value = self._freeze(value)
+        if not self._value_list or not self._is_same(self._value_list[-1], value):
+            self._start_list.append(self._length)
+            self._value_list.append(self._intern(value))
+        self._length += 1
+
+    def repeat_last(self, n: int) -> None:
+        """Append the last record `n` times."""
+        if self._length > 0 and n > 0:
+            self._length += n
+
+    def reverse(self) -> None:
+        """Reverse the records in place."""
+        run_list = list(self.iter_runs())
+        self._start_list = [self._length - stop for _, stop, _ in reversed(run_list)]
+        self._value_list = [value for _, _, value in reversed(run_list)]
+
+    def __iter__(self):
+        """Iterate over the records."""
+        for start, stop, value in self.iter_runs():
+            for _ in range(stop - start):
+                yield value
+
+    def iter_runs(self):
+        """
+        Iterate over the runs of the same record.
+
+        Yields:
+            tuple: Start step, stop step (exclusive) and record of each run.
+        """
+        stop_list = [*self._start_list[1:], self._length]
+        yield from zip(self._start_list, stop_list, self._value_list)
+
+    def index(self, value, start: int = 0, stop: int | None = None) -> int:
+        """
+        Return the first index of `value`.
+
+        Raises:
+            ValueError: If `value` is not recorded.
+        """
+        start, stop, _ = slice(start, stop).indices(self._length)
+        for run_start, run_stop, run_value in self.iter_runs():
+            if run_value == value and run_start < stop and start < run_stop:
+                return max(run_start, start)
+        raise ValueError(f"{value} is not in record")
+
+    def count(self, value) -> int:
+        """Return the number of occurrences of `value`."""
+        return sum(
+            stop - start
+            for start, stop, run_value in self.iter_runs()
+            if run_value == value
+        )
+
+    def __eq__(self, other) -> bool:
+        """Compare the records with a list or another record."""
+        if isinstance(other, (list, ColumnarRecord, RunLengthRecord)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Return the representation of the records as a list."""
+        return repr(list(self))
+
+
+class ColumnarRecorder:
+    """ColumnarRecorder.
+
+    Recorder of the logs of instances into a ColumnarBuffer for each record name.
+    Each recorded attribute of the instances is replaced by a ColumnarRecord view,
+    so that the logs can be read as the record lists of the instances.
+
+    Args:
+        initial_capacity (int, optional): Number of rows allocated first. Defaults to 256.
+    """
+
+    def __init__(self, initial_capacity: int = 256):
+        """Initialize a recorder without records."""
+        self.initial_capacity = initial_capacity
+        self.buffer_dict = {}
+        self.instance_list_dict = {}
+
+    def add_record(
+        self,
+        name: str,
+        instance_list: list,
+        attr_name: str,
+        dtype,
+        value_type=None,
+    ) -> None:
+        """
+        Add a record of an attribute of instances.
+
+        The existing records of the instances are copied into the new buffer.
+
+        Args:
+            name (str): Name of this record.
+            instance_list (list): Target instances.
+            attr_name (str): Attribute name of the record list of each instance.
+            dtype (numpy.dtype): Data type of records.
+            value_type (type[IntEnum], optional): Enum type of recorded states. Defaults to None.
+
+        Raises:
+            ValueError: If the lengths of the existing records of instances are different.
+        """
+        buffer = ColumnarBuffer(len(instance_list), dtype, self.initial_capacity)
+        record_list = [getattr(instance, attr_name) for instance in instance_list]
+        if len({len(record) for record in record_list}) > 1:
+            raise ValueError(
+                f"Lengths of {attr_name} of instances should be the same for {name}"
+            )
+        if len(record_list) > 0 and len(record_list[0]) > 0:
+            buffer.extend_rows(
+                np.array(
+                    [
+                        (
+                            record.to_numpy()
+                            if isinstance(record, ColumnarRecord)
+                            else np.array(record, dtype=dtype)
+                        )
+                        for record in record_list
+                    ],
+                    dtype=dtype,
+                ).T
+            )
+        for column, instance in enumerate(instance_list):
+            setattr(
+                instance,
+                attr_name,
+                ColumnarRecord(buffer, column, value_type=value_type),
+            )
+        self.buffer_dict[name] = buffer
+        self.instance_list_dict[name] = instance_list
+
+    def append_row(self, name: str, row: list) -> None:
+        """
+        Append the records of all instances of a record in one step.
+
+        Args:
+            name (str): Name of the record.
+            row (list): Record of each instance in the order of `add_record`.
+        """
+        self.buffer_dict[name].append_row(row)
+
+    def repeat_last_row(self, n_row: int) -> None:
+        """
+        Append the last row of all records several times.
+
+        Args:
+            n_row (int): Number of appended rows.
+        """
+        for buffer in self.buffer_dict.values():
+            buffer.repeat_last_row(n_row)
+
+
+def iter_record_runs(record_list):
+    """
+    Iterate over the runs of the same record in a record list.
+
+    ColumnarRecord and RunLengthRecord are iterated without expanding them.
+
+    Args:
+        record_list (list | ColumnarRecord | RunLengthRecord): Target record list.
+
+    Yields:
+        tuple: Start step, stop step (exclusive) and record of each run.
+    """
+    if isinstance(record_list, (ColumnarRecord, RunLengthRecord)):
+        yield from record_list.iter_runs()
+        return
+    start = 0
+    for step in range(1, len(record_list) + 1):
+        if step == len(record_list) or record_list[step] != record_list[start]:
+            yield start, step, record_list[start]
+            start = step
+
+
+def get_record_value_list(record_list) -> list:
+    """
+    Get the values of a record list of states or numbers as a list.
+
+    The values of ColumnarRecord are returned as Python numbers without decoding
+    them into states, and the ones of list are copied without converting each value.
+    Both of them can be encoded by JSON encoders directly.
+
+    Args:
+        record_list (list | ColumnarRecord | RunLengthRecord): Target record list.
+
+    Returns:
+        list: Values of the records.
+    """
+    if isinstance(record_list, ColumnarRecord):
+        return record_list.to_numpy().tolist()
+    return list(record_list)
+
+
+def get_state_record_list(value_list, state_type) -> list:
+    """
+    Convert the values of states read from a JSON file into a record list.
+
+    Args:
+        value_list (list[int]): Values of states.
+        state_type (type[IntEnum]): Enum type of states.
+
+    Returns:
+        list: Record list of states.
+    """
+    state_dict = {int(state): state for state in state_type}
+    return list(map(state_dict.__getitem__, value_list))
+
+
+def set_last_records(record_list, value_list: list) -> None:
+    """
+    Overwrite the last records of a record list.
+
+    Args:
+        record_list (list | ColumnarRecord | RunLengthRecord): Target record list.
+        value_list (list): New values of the last `len(value_list)` records.
+    """
+    n = len(value_list)
+    if n == 0:
+        return
+    if isinstance(record_list, ColumnarRecord):
+        record_list.set_last_values(value_list)
+    elif isinstance(record_list, list):
+        record_list[-n:] = value_list
+    else:
+        del record_list[-n:]
+        record_list.extend(value_list)
+
+
+def repeat_last_record(record_list, n: int) -> None:
+    """
+    Append the last record of a record list `n` times.
+
+    Args:
+        record_list (list | RunLengthRecord): Target record list.
+        n (int): Number of appended records.
+    """
+    if n <= 0 or len(record_list) == 0:
+        return
+    if isinstance(record_list, RunLengthRecord):
+        record_list.repeat_last(n)
+    else:
+        record_list.extend([record_list[-1]] * n)
@@ -0,0 +1,131 @@
+"""Utility class for indexing the instances of a project by dense integers."""
+
+
+class EntityRegistry:
+    """EntityRegistry.
+
+    Registry which assigns dense integer indices to the workflows, tasks, components,
+    teams, workers, workplaces and facilities of a project. The simulation engine
+    keeps its internal state in lists and arrays by these indices, while instances
+    and JSON files keep their string IDs.
+
+    Instances are indexed in the order of their workflows, products, teams and
+    workplaces, as the records of ColumnarRecorder. An instance which belongs to
+    several collections gets only the index of its first appearance.
+
+    Args:
+        workflow_list (list[BaseWorkflow], optional): Workflows. Defaults to None -> [].
+        product_list (list[BaseProduct], optional): Products. Defaults to None -> [].
+        team_list (list[BaseTeam], optional): Teams. Defaults to None -> [].
+        workplace_list (list[BaseWorkplace], optional): Workplaces. Defaults to None -> [].
+    """
+
+    KIND_LIST = (
+        "workflow",
+        "task",
+        "component",
+        "team",
+        "worker",
+        "workplace",
+        "facility",
+    )
+
+    def __init__(
+        self,
+        workflow_list: list = None,
+        product_list: list = None,
+        team_list: list = None,
+        workplace_list: list = None,
+    ):
+        """Assign indices to all instances of the collections."""
+        workflow_list = workflow_list if workflow_list is not None else []
+        product_list = product_list if product_list is not None else []
+        team_list = team_list if team_list is not None else []
+        workplace_list = workplace_list if workplace_list is not None else []
+
+        self.workflow_list, self.workflow_index_dict = [], {}
+        self.task_list, self.task_index_dict = [], {}
+        self.workflow_task_index_list_dict = {}
+        for workflow in workflow_list:
+            self.__register(self.workflow_list, self.workflow_index_dict, workflow)
+            self.workflow_task_index_list_dict[workflow.ID] = [
+                self.__register(self.task_list, self.task_index_dict, task)
+                for task in workflow.task_set
+            ]
+
+        self.component_list, self.component_index_dict = [], {}
+        for product in product_list:
+            for component in product.component_set:
+                self.__register(
+                    self.component_list, self.component_index_dict, component
+                )
+
+        self.team_list, self.team_index_dict = [], {}
+        self.worker_list, self.worker_index_dict = [], {}
+        for team in team_list:
+            self.__register(self.team_list, self.team_index_dict, team)
+            for worker in team.worker_set:
+                self.__register(self.worker_list, self.worker_index_dict, worker)
+
+        self.workplace_list, self.workplace_index_dict = [], {}
+        self.facility_list, self.facility_index_dict = [], {}
+        for workplace in workplace_list:
+            self.__register(self.workplace_list, self.workplace_index_dict, workplace)
+            for facility in workplace.facility_set:
+                self.__register(self.facility_list, self.facility_index_dict, facility)
+
+        # Input tasks of each task as (index, dependency). -1 means an unknown task.
+        self.input_task_index_dependency_list = [
+            tuple(
+                (self.task_index_dict.get(input_task_id, -1), dependency)
+                for input_task_id, dependency in task.input_task_id_dependency_set
+            )
+            for task in self.task_list
+        ]
+
+    @staticmethod
+    def __register(instance_list: list, index_dict: dict, instance) -> int:
+        index = index_dict.get(instance.ID, None)
+        if index is None:
+            index = len(instance_list)
+            index_dict[instance.ID] = index
+            instance_list.append(instance)
+        return index
+
+    def get_size(self, kind: str) -> int:
+        """
+        Get the number of registered instances of a kind.
+
+        Args:
+            kind (str): One of KIND_LIST.
+
+        Returns:
+            int: Number of instances.
+        """
+        return len(getattr(self, f"{kind}_list"))
+
+    def get_index(self, kind: str, ID: str, default: int = -1) -> int:
+        """
+        Get the index of an instance.
+
+        Args:
+            kind (str): One of KIND_LIST.
+            ID (str): ID of the instance.
+            default (int, optional): Value for unknown IDs. Defaults to -1.
+
+        Returns:
+            int: Index of the instance.
+        """
+        return getattr(self, f"{kind}_index_dict").get(ID, default)
+
+    def get_id_list(self, kind: str) -> list[str]:
+        """
+        Get the IDs of instances in the order of their indices.
+
+        Args:
+            kind (str): One of KIND_LIST.
+
+        Returns:
+            list[str]: IDs of instances.
+        """
+        return [instance.ID for instance in getattr(self, f"{kind}_list")]
@@ -0,0 +1,429 @@
+"""Utility functions for binary files of simulation results."""
+
+import json
+import os
+
+import numpy as np
+
+from .base_component import BaseComponentState
+from .base_facility import BaseFacility, BaseFacilityState
+from .base_task import BaseTaskState
+from .base_worker import BaseWorker, BaseWorkerState
+from .record_utils import ColumnarBuffer, ColumnarRecord
+
+RESULT_FORMAT_VERSION = 1
+RESULT_HEADER_FILE_NAME = "header.json"
+
+# Name, kind of instances in EntityRegistry, attribute name, value type and
+# whether the attribute is a record list.
+# Value types are:
+#   IntEnum type -> int8 array of states
+#   float -> float64 array
+#   str -> int32 array of the indices of the IDs of the kind (-1 for None)
+#   tuple[str, ...] -> int32 array of the codes of sets of the tuples of the IDs
+#       of the kinds (IDs themselves for one kind) and the table of the codes
+RESULT_SPEC_LIST = [
+    ("task_state", "task", "state", BaseTaskState, False),
+    ("task_remaining_work_amount", "task", "remaining_work_amount", float, False),
+    ("task_state_record", "task", "state_record_list", BaseTaskState, True),
+    (
+        "task_remaining_work_amount_record",
+        "task",
+        "remaining_work_amount_record_list",
+        float,
+        True,
+    ),
+    (
+        "task_allocation_record",
+        "task",
+        "allocated_worker_facility_id_tuple_set_record_list",
+        ("worker", "facility"),
+        True,
+    ),
+    ("component_state", "component", "state", BaseComponentState, False),
+    (
+        "component_state_record",
+        "component",
+        "state_record_list",
+        BaseComponentState,
+        True,
+    ),
+    (
+        "component_placement_record",
+        "component",
+        "placed_workplace_id_record_list",
+        "workplace",
+        True,
+    ),
+    ("team_cost_record", "team", "cost_record_list", float, True),
+    ("worker_state", "worker", "state", BaseWorkerState, False),
+    ("worker_state_record", "worker", "state_record_list", BaseWorkerState, True),
+    ("worker_cost_record", "worker", "cost_record_list", float, True),
+    (
+        "worker_assignment_record",
+        "worker",
+        BaseWorker._assigned_record_attr_name,
+        ("task", "facility"),
+        True,
+    ),
+    ("workplace_cost_record", "workplace", "cost_record_list", float, True),
+    (
+        "workplace_placement_record",
+        "workplace",
+        "placed_component_id_set_record_list",
+        ("component",),
+        True,
+    ),
+    ("facility_state", "facility", "state", BaseFacilityState, False),
+    (
+        "facility_state_record",
+        "facility",
+        "state_record_list",
+        BaseFacilityState,
+        True,
+    ),
+    ("facility_cost_record", "facility", "cost_record_list", float, True),
+    (
+        "facility_assignment_record",
+        "facility",
+        BaseFacility._assigned_record_attr_name,
+        ("task", "worker"),
+        True,
+    ),
+]
+
+
+def _get_dtype(value_type):
+    if value_type is float:
+        return np.float64
+    if isinstance(value_type, (str, tuple)):
+        return np.int32
+    return np.int8
+
+
+def _to_numpy(record_list, dtype) -> np.ndarray:
+    if hasattr(record_list, "to_numpy"):
+        return np.asarray(record_list.to_numpy(), dtype=dtype)
+    return np.array(list(record_list), dtype=dtype)
+
+
+def _encode_table(record_list_list: list, index_dict_list: list) -> dict:
+    """
+    Encode records of sets into codes of a table of distinct sets.
+
+    Each set is stored as rows of the indices of the IDs in its tuples, so that
+    the rows of code `c` are `value[value_indptr[c]:value_indptr[c + 1]]`.
+    """
+    code_dict = {}
+    row_list_list = []
+    code_array = np.zeros(
+        (len(record_list_list[0]) if record_list_list else 0, len(record_list_list)),
+        dtype=np.int32,
+    )
+    for column, record_list in enumerate(record_list_list):
+        for step, value in enumerate(record_list):
+            key = frozenset(value)
+            code = code_dict.get(key, None)
+            if code is None:
+                code = len(row_list_list)
+                code_dict[key] = code
+                row_list_list.append(
+                    sorted(
+                        tuple(
+                            index_dict.get(ID, -1)
+                            for index_dict, ID in zip(
+                                index_dict_list,
+                                element if len(index_dict_list) > 1 else (element,),
+                            )
+                        )
+                        for element in key
+                    )
+                )
+            code_array[step, column] = code
+    value_indptr = np.zeros(len(row_list_list) + 1, dtype=np.int64)
+    value_indptr[1:] = np.cumsum([len(row_list) for row_list in row_list_list])
+    value = np.array(
+        [row for row_list in row_list_list for row in row_list], dtype=np.int32
+    ).reshape(-1, len(index_dict_list))
+    return {"": code_array, "_value_indptr": value_indptr, "_value": value}
+
+
+def decode_table_value(
+    value_indptr: np.ndarray, value: np.ndarray, code: int, id_list_list: list
+) -> frozenset:
+    """
+    Decode a set in the table of a record of sets.
+
+    Args:
+        value_indptr (numpy.ndarray): Start of the rows of each code.
+        value (numpy.ndarray): Rows of the indices of IDs.
+        code (int): Code of the set.
+        id_list_list (list[list[str]]): IDs of the kind of each column of `value`.
+
+    Returns:
+        frozenset: Set of the tuples of IDs, or the IDs for one kind. -1 is decoded as None.
+    """
+    row_array = value[value_indptr[code] : value_indptr[code + 1]].tolist()
+    element_list = [
+        tuple(
+            id_list[index] if index >= 0 else None
+            for id_list, index in zip(id_list_list, row)
+        )
+        for row in row_array
+    ]
+    if len(id_list_list) == 1:
+        return frozenset(element[0] for element in element_list)
+    return frozenset(element_list)
+
+
+def read_result_header(dir_path: str) -> dict:
+    """
+    Read the header of a simulation result directory.
+
+    Args:
+        dir_path (str): Directory of the simulation result.
+
+    Returns:
+        dict: Header of the simulation result.
+
+    Raises:
+        ValueError: If the format version of the result is not supported.
+    """
+    with open(
+        os.path.join(dir_path, RESULT_HEADER_FILE_NAME), "r", encoding="utf-8"
+    ) as f:
+        header = json.load(f)
+    if header.get("format_version") != RESULT_FORMAT_VERSION:
+        raise ValueError("simulation result is not supported by this version of pDESy")
+    return header
+
+
+def read_result_array(dir_path: str, name: str, mmap_mode: str | None = None):
+    """
+    Read an array of a simulation result directory.
+
+    Args:
+        dir_path (str): Directory of the simulation result.
+        name (str): Name of the array.
+        mmap_mode (str, optional): Memory-map mode of numpy.load. Defaults to None.
+
+    Returns:
+        numpy.ndarray: Array of the simulation result.
+    """
+    return np.load(os.path.join(dir_path, f"{name}.npy"), mmap_mode=mmap_mode)
+
+
+def write_simulation_result(
+    project, dir_path: str, task_finish_step_dict: dict | None = None
+) -> None:
+    """
+    Write the simulation result of a project into a directory of NumPy arrays.
+
+    The directory has `header.json` including the summary of the project and the IDs
+    of instances in the order of the entity registry, and one `.npy` file for each
+    array, which can be memory-mapped by `numpy.load`. The columns of the arrays
+    are the instances in the order of the IDs in the header.
+
+    Args:
+        project (BaseProject): Simulated project.
+        dir_path (str): Directory of the simulation result.
+        task_finish_step_dict (dict[str, int], optional): Step in which each task
+            became FINISHED, which is stored in the header. Defaults to None.
+
+    Raises:
+        ValueError: If the lengths of the records of instances of a kind are different.
+    """
+    registry = project.entity_registry
+    os.makedirs(dir_path, exist_ok=True)
+    array_dict = {"project_cost_record": np.array(project.cost_record_list, dtype=float)}
+    for name, kind, attr_name, value_type, is_record in RESULT_SPEC_LIST:
+        instance_list = getattr(registry, f"{kind}_list")
+        if not is_record:
+            array_dict[name] = _to_numpy(
+                [getattr(instance, attr_name) for instance in instance_list],
+                _get_dtype(value_type),
+            )
+            continue
+        record_list_list = [getattr(instance, attr_name) for instance in instance_list]
+        if len({len(record_list) for record_list in record_list_list}) > 1:
+            raise ValueError(
+                f"Lengths of {attr_name} of instances should be the same for {name}"
+            )
+        n_step = len(record_list_list[0]) if record_list_list else 0
+        if isinstance(value_type, tuple):
+            for suffix, array in _encode_table(
+                record_list_list,
+                [getattr(registry, f"{kind}_index_dict") for kind in value_type],
+            ).items():
+                array_dict[name + suffix] = array
+            continue
+        if isinstance(value_type, str):
+            index_dict = getattr(registry, f"{value_type}_index_dict")
+            record_list_list = [
+                [index_dict.get(ID, -1) for ID in record_list]
+                for record_list in record_list_list
+            ]
+        array = np.zeros((n_step, len(instance_list)), dtype=_get_dtype(value_type))
+        for column, record_list in enumerate(record_list_list):
+            array[:, column] = _to_numpy(record_list, array.dtype)
+        array_dict[name] = array
+
+    for name, array in array_dict.items():
+        np.save(os.path.join(dir_path, f"{name}.npy"), array)
+    header = {
+        "format_version": RESULT_FORMAT_VERSION,
+        "project": {
+            "name": project.name,
+            "ID": project.ID,
+            "init_datetime": project.init_datetime.strftime("%Y-%m-%d %H:%M:%S"),
+            "unit_timedelta": str(project.unit_timedelta.total_seconds()),
+            "time": project.time,
+            "simulation_mode": int(project.simulation_mode),
+            "status": int(project.status),
+            "record_policy": int(project.record_policy),
+            "record_interval": project.record_interval,
+            "task_finish_step_dict": dict(task_finish_step_dict or {}),
+        },
+        "id_list_dict": {
+            kind: registry.get_id_list(kind) for kind in registry.KIND_LIST
+        },
+        "array_name_list": list(array_dict.keys()),
+    }
+    with open(
+        os.path.join(dir_path, RESULT_HEADER_FILE_NAME), "w", encoding="utf-8"
+    ) as f:
+        json.dump(header, f, indent=4)
+
+
+class _TableValueDict(dict):
+    """Cache of the sets of a table which are decoded when they are looked up."""
+
+    def __init__(self, table: tuple, id_list_list: list):
+        super().__init__()
+        self.table = table
+        self.id_list_list = id_list_list
+
+    def __missing__(self, code: int) -> frozenset:
+        value = decode_table_value(*self.table, code, self.id_list_list)
+        self[code] = value
+        return value
+
+
+def get_result_value_dict(
+    value_type, id_list_dict: dict, table: tuple | None = None
+) -> dict | None:
+    """
+    Get the mapping from the encoded values of a result array to the values.
+
+    Args:
+        value_type: Value type in RESULT_SPEC_LIST.
+        id_list_dict (dict): IDs of instances of each kind in the header.
+        table (tuple, optional): value_indptr and value arrays of a record of sets.
+            Defaults to None.
+
+    Returns:
+        dict or None: Mapping of the values, whose sets are decoded when they are
+            looked up first. None for float values.
+    """
+    if value_type is float:
+        return None
+    if isinstance(value_type, str):
+        return {-1: None, **dict(enumerate(id_list_dict[value_type]))}
+    if isinstance(value_type, tuple):
+        return _TableValueDict(table, [id_list_dict[kind] for kind in value_type])
+    return {int(value): value for value in value_type}
+
+
+def get_result_instance_list(project, id_list_dict: dict) -> dict:
+    """
+    Get the instances of a project in the order of the IDs of a result.
+
+    Args:
+        project (BaseProject): Target project.
+        id_list_dict (dict): IDs of instances of each kind in the header.
+
+    Returns:
+        dict: Instances of each kind.
+
+    Raises:
+        ValueError: If the IDs do not match the instances of the project.
+    """
+    registry = project.entity_registry
+    instance_list_dict = {}
+    for kind, ID_list in id_list_dict.items():
+        index_dict = getattr(registry, f"{kind}_index_dict")
+        if len(ID_list) != len(index_dict) or any(
+            ID not in index_dict for ID in ID_list
+        ):
+            raise ValueError(
+                f"simulation result does not match the {kind}s of this project"
+            )
+        instance_list = getattr(registry, f"{kind}_list")
+        instance_list_dict[kind] = [instance_list[index_dict[ID]] for ID in ID_list]
+    return instance_list_dict
+
+
+def read_simulation_result(
+    project, dir_path: str, mmap_mode: str | None = None
+) -> dict:
+    """
+    Read a simulation result written by `write_simulation_result` into a project.
+
+    The project should have the instances with the same IDs as the simulated project,
+    e.g. the one read from the JSON file of the simulated project.
+    Record lists of instances are replaced with the ones of the result.
+
+    If `mmap_mode` is given, the arrays are memory-mapped and record lists are
+    replaced with ColumnarRecord views of them. The records of an instance are read
+    from the file and decoded only when they are accessed, and copied into a list
+    when they are modified. The files should not be changed while the views are used.
+
+    Args:
+        project (BaseProject): Target project.
+        dir_path (str): Directory of the simulation result.
+        mmap_mode (str, optional): Memory-map mode of numpy.load (e.g. "r").
+            Defaults to None -> all records are decoded into lists.
+
+    Returns:
+        dict: Header of the simulation result.
+
+    Raises:
+        ValueError: If the result does not match the instances of the project.
+    """
+    header = read_result_header(dir_path)
+    id_list_dict = header["id_list_dict"]
+    instance_list_dict = get_result_instance_list(project, id_list_dict)
+
+    for name, kind, attr_name, value_type, is_record in RESULT_SPEC_LIST:
+        instance_list = instance_list_dict[kind]
+        table = None
+        if isinstance(value_type, tuple):
+            table = (
+                read_result_array(dir_path, f"{name}_value_indptr", mmap_mode),
+                read_result_array(dir_path, f"{name}_value", mmap_mode),
+            )
+        value_dict = get_result_value_dict(value_type, id_list_dict, table)
+        if not is_record:
+            value_list = read_result_array(dir_path, name).tolist()
+            for instance, value in zip(instance_list, value_list):
+                if value_dict is not None:
+                    value = value_dict[value]
+                setattr(instance, attr_name, value)
+            continue
+        buffer = ColumnarBuffer.from_array(
+            read_result_array(dir_path, name, mmap_mode)
+        )
+        for column, instance in enumerate(instance_list):
+            record_list = ColumnarRecord(buffer, column, value_dict=value_dict)
+            setattr(
+                instance,
+                attr_name,
+                record_list if mmap_mode is not None else list(record_list),
+            )
+
+    project_header = header["project"]
+    project.time = project_header["time"]
+    project.cost_record_list = read_result_array(
+        dir_path, "project_cost_record"
+    ).tolist()
+    return header
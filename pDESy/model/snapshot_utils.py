@@ -0,0 +1,82 @@
+"""Utility functions for encoding snapshots of simulation state."""
+
+import pickle
+
+import numpy as np
+
+SNAPSHOT_VERSION = 1
+
+
+def encode_value_list(value_list, value_type=None):
+    """
+    Encode values of instances or steps into a compact form.
+
+    Args:
+        value_list (Iterable): Values to encode.
+        value_type (type, optional): IntEnum type, float or bool for encoding values
+            into a NumPy array. Defaults to None -> list of Python objects.
+
+    Returns:
+        numpy.ndarray or list: Encoded values.
+    """
+    if value_type is None:
+        return list(value_list)
+    if value_type is float:
+        return np.array(list(value_list), dtype=np.float64)
+    if value_type is bool:
+        return np.array(list(value_list), dtype=bool)
+    return np.array([int(value) for value in value_list], dtype=np.int8)
+
+
+def decode_value_list(encoded, value_type=None) -> list:
+    """
+    Decode values encoded by `encode_value_list`.
+
+    Args:
+        encoded (numpy.ndarray or list): Encoded values.
+        value_type (type, optional): Type given to `encode_value_list`. Defaults to None.
+
+    Returns:
+        list: Decoded values.
+    """
+    if value_type is None:
+        return list(encoded)
+    if value_type is float or value_type is bool:
+        return encoded.tolist()
+    return [value_type(value) for value in encoded.tolist()]
+
+
+def dump_snapshot(data: dict) -> bytes:
+    """
+    Serialize snapshot data into bytes.
+
+    Args:
+        data (dict): Snapshot data.
+
+    Returns:
+        bytes: Serialized snapshot.
+    """
+    return pickle.dumps(
+        {"version": SNAPSHOT_VERSION, **data}, protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def load_snapshot(snapshot: bytes) -> dict:
+    """
+    Deserialize bytes created by `dump_snapshot`.
+
+    Snapshots are unpickled, so only load snapshots from trusted sources.
+
+    Args:
+        snapshot (bytes): Serialized snapshot.
+
+    Returns:
+        dict: Snapshot data.
+
+    Raises:
+        ValueError: If the version of the snapshot is not supported.
+    """
+    data = pickle.loads(snapshot)
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        raise ValueError("snapshot is not supported by this version of pDESy")
+    return data
@@ -306,7 +306,7 @@ def create_data_for_cost_history_plotly(
         for time in range(len(team.cost_record_list))
     ]
     for worker in team.worker_set:
-        data.append(go.Bar(name=worker.name, x=x, y=worker.cost_record_list))
+        data.append(go.Bar(name=worker.name, x=x, y=list(worker.cost_record_list)))
     return data
 
 
@@ -289,7 +289,7 @@ def create_data_for_cost_history_plotly(
         for time in range(len(workplace.cost_record_list))
     ]
     for facility in workplace.facility_set:
-        data.append(go.Bar(name=facility.name, x=x, y=facility.cost_record_list))
+        data.append(go.Bar(name=facility.name, x=x, y=list(facility.cost_record_list)))
     return data
 
 
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Fixtures shared by the tests of pDESy.model."""
+
+import datetime
+
+import pytest
+
+from pDESy.model.base_component import BaseComponent
+from pDESy.model.base_facility import BaseFacility
+from pDESy.model.base_priority_rule import ResourcePriorityRuleMode
+from pDESy.model.base_product import BaseProduct
+from pDESy.model.base_project import BaseProject
+from pDESy.model.base_task import BaseTask
+from pDESy.model.base_team import BaseTeam
+from pDESy.model.base_worker import BaseWorker
+from pDESy.model.base_workflow import BaseWorkflow
+from pDESy.model.base_workplace import BaseWorkplace
+
+
+@pytest.fixture(name="dummy_project")
+def fixture_dummy_project():
+    """Fixture for a dummy BaseProject.
+
+    Returns:
+        BaseProject: A dummy project instance with components, tasks, teams, workers, and workplaces.
+    """
+    project = BaseProject(
+        init_datetime=datetime.datetime(2020, 4, 1, 8, 0, 0),
+        unit_timedelta=datetime.timedelta(minutes=1),
+    )
+
+    # BaseComponents in BaseProduct
+    c3 = BaseComponent("c3")
+    c1 = BaseComponent("c1")
+    c2 = BaseComponent("c2")
+    c3.update_child_component_set({c1, c2})
+    project.add_product(BaseProduct(component_set={c1, c2, c3}))
+
+    # BaseTasks in BaseWorkflow
+    task1_1 = BaseTask("task1_1", need_facility=True)
+    task1_2 = BaseTask("task1_2", worker_priority_rule=ResourcePriorityRuleMode.HSV)
+    task2_1 = BaseTask("task2_1")
+    task3 = BaseTask("task3", due_time=30)
+    task3.add_input_task(task1_2)
+    task3.add_input_task(task2_1)
+    task1_2.add_input_task(task1_1)
+    task0 = BaseTask("auto", auto_task=True, due_time=20)
+    project.add_workflow(
+        BaseWorkflow(task_set={task1_1, task1_2, task2_1, task3, task0})
+    )
+
+    c1.update_targeted_task_set({task1_1, task1_2})
+    c2.add_targeted_task(task2_1)
+    c3.add_targeted_task(task3)
+
+    # Facilities in workplace
+    f1 = BaseFacility("f1")
+    f1.workamount_skill_mean_map = {
+        task1_1.name: 1.0,
+    }
+
+    # Workplace
+    workplace = BaseWorkplace("workplace", facility_set={f1})
+    workplace.update_targeted_task_set({task1_1, task1_2, task2_1, task3})
+    project.add_workplace(workplace)
+
+    # BaseTeam
+    team = BaseTeam("team")
+    team.update_targeted_task_set({task1_1, task1_2, task2_1, task3})
+    project.add_team(team)
+
+    # BaseWorkers in each BaseTeam
+    w1 = BaseWorker("w1", team_id=team.ID, cost_per_time=10.0)
+    w1.workamount_skill_mean_map = {
+        task1_1.name: 1.0,
+        task1_2.name: 1.0,
+        task2_1.name: 0.0,
+        task3.name: 1.0,
+    }
+    w1.facility_skill_map = {f1.name: 1.0}
+    team.add_worker(w1)
+
+    w2 = BaseWorker("w2", team_id=team.ID, cost_per_time=6.0)
+    w2.workamount_skill_mean_map = {
+        task1_1.name: 1.0,
+        task1_2.name: 0.0,
+        task2_1.name: 1.0,
+        task3.name: 1.0,
+    }
+    w2.facility_skill_map = {f1.name: 1.0}
+    team.add_worker(w2)
+
+    return project
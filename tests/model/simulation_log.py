@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Helpers to compare the simulation logs of BaseProject in tests."""
+
+
+def get_simulation_log(project):
+    """Get all simulation logs of a project for comparison.
+
+    Args:
+        project (BaseProject): The simulated project.
+
+    Returns:
+        list: Time, cost records and exported data of all products, workflows, teams and workplaces.
+    """
+    log = [project.time, project.status, project.cost_record_list]
+    for node_set in (
+        project.product_set,
+        project.workflow_set,
+        project.team_set,
+        project.workplace_set,
+    ):
+        for node in node_set:
+            log.append(node.export_dict_json_data())
+    return log
+
+
+def get_simulation_record(project):
+    """Get all record lists of a project for comparison.
+
+    Records of sets are compared as sets because their export order may differ.
+
+    Args:
+        project (BaseProject): The simulated project.
+
+    Returns:
+        dict: Record lists of each instance keyed by ID and attribute name.
+    """
+    record_dict = {"time": project.time, "cost": list(project.cost_record_list)}
+    for instance in [
+        *project.get_all_task_set(),
+        *project.get_all_component_set(),
+        *project.team_set,
+        *project.get_all_worker_set(),
+        *project.workplace_set,
+        *project.get_all_facility_set(),
+    ]:
+        for attr_name in dir(instance):
+            if attr_name.endswith("_record_list"):
+                record_dict[(instance.ID, attr_name)] = list(
+                    getattr(instance, attr_name)
+                )
+    return record_dict
+
+
+def assert_same_simulation_log(
+    project, kwargs_list, get_log=get_simulation_log, **simulate_kwargs
+):
+    """Assert that simulations with each option produce the same logs.
+
+    Args:
+        project (BaseProject): The project to simulate.
+        kwargs_list (list[dict]): Options of simulate compared with the base simulation.
+        get_log (Callable[[BaseProject], object], optional): Function to get the logs.
+            Defaults to get_simulation_log.
+        **simulate_kwargs: Options of simulate common to all simulations.
+
+    Returns:
+        object: Logs of the base simulation.
+    """
+    project.simulate(**simulate_kwargs)
+    expected_log = get_log(project)
+    for kwargs in kwargs_list:
+        project.simulate(**simulate_kwargs, **kwargs)
+        assert get_log(project) == expected_log
+    return expected_log
@@ -5,6 +5,8 @@
 This module contains unit tests for the priority rule mechanisms in pDESy.
 """
 
+import pytest
+
 import pDESy.model.base_priority_rule as pr
 from pDESy.model.base_facility import BaseFacility
 from pDESy.model.base_priority_rule import (
@@ -140,6 +142,36 @@ def test_sort_task_list_fifo():
     assert task_list[2].name == "t1"
 
 
+def test_task_priority_queue():
+    """Test that TaskPriorityQueue keeps the order of sort_task_list."""
+    task_list = [
+        BaseTask(f"t{i}", default_work_amount=w, est=e, lst=l)
+        for i, (w, e, l) in enumerate([(3, 0, 5), (1, 2, 2), (3, 1, 6), (2, 0, 0)])
+    ]
+    order_dict = {task.ID: i for i, task in enumerate(task_list)}
+    for mode in TaskPriorityRuleMode:
+        queue = pr.TaskPriorityQueue(mode, order_dict)
+        for task in reversed(task_list):
+            queue.add(task)
+        assert len(queue) == 4
+        assert queue.get_task_list() == pr.sort_task_list(task_list, mode)
+
+        task_list[3].remaining_work_amount = 0.5
+        task_list[3].state_record_list = [BaseTaskState.READY]
+        task_list[1].est = 3
+        queue.mark_changed([task_list[3].ID, task_list[1].ID])
+        queue.update()
+        assert queue.get_task_list() == pr.sort_task_list(task_list, mode)
+
+        queue.discard(task_list[0])
+        assert task_list[0] not in queue
+        assert queue.get_task_list() == pr.sort_task_list(task_list[1:], mode)
+
+        task_list[3].remaining_work_amount = 2
+        task_list[3].state_record_list = []
+        task_list[1].est = 2
+
+
 def test_sort_worker_list_mw():
     """Test sorting worker list by MW rule."""
     r0 = BaseWorker("r0", main_workplace_id="w0")
@@ -266,6 +298,26 @@ def test_sort_worker_list_hsv():
     assert r_list[2].name == "r0"
 
 
+def test_get_worker_priority_key_function():
+    """Test that sorting by the key function is equal to sort_worker_list."""
+    r0 = BaseWorker("r0", cost_per_time=2.0, main_workplace_id="w0")
+    r0.workamount_skill_mean_map = {"a": 1.0, "b": 1.0}
+    r1 = BaseWorker("r1", cost_per_time=1.0)
+    r1.workamount_skill_mean_map = {"a": 2.0}
+    r2 = BaseWorker("r2", cost_per_time=1.0, main_workplace_id="w2")
+    r2.workamount_skill_mean_map = {"a": 0.5, "b": 2.0}
+    r_list = [r0, r1, r2]
+    for mode in ResourcePriorityRuleMode:
+        key_function = pr.get_worker_priority_key_function(
+            mode, name="a", workplace_id="w2"
+        )
+        assert sorted(r_list, key=key_function) == pr.sort_worker_list(
+            r_list, mode, name="a", workplace_id="w2"
+        )
+    with pytest.raises(ValueError):
+        pr.get_worker_priority_key_function(ResourcePriorityRuleMode.HSV)
+
+
 def test_sort_workplace_list_fss():
     """Test sorting workplace list by FSS rule."""
     wp4 = BaseWorkplace("wp4", max_space_size=4.0)
@@ -7,7 +7,10 @@ This module contains unit tests for the BaseProject class and related functional
 
 import datetime
 import os
+import warnings
+from contextlib import nullcontext
 
+import numpy as np
 import pytest
 
 from pDESy.model.base_component import BaseComponent
@@ -23,84 +26,11 @@ from pDESy.model.base_subproject_task import BaseSubProjectTask
 from pDESy.model.base_task import BaseTask, BaseTaskDependency, BaseTaskState
 from pDESy.model.base_team import BaseTeam
 from pDESy.model.base_worker import BaseWorker
-from pDESy.model.base_workflow import BaseWorkflow
+from pDESy.model.base_workflow import BaseWorkflow, PertUpdateMode
 from pDESy.model.base_workplace import BaseWorkplace
+from pDESy.model.record_utils import RecordMode, RecordPolicy
 
-
-@pytest.fixture(name="dummy_project")
-def fixture_dummy_project():
-    """Fixture for a dummy BaseProject.
-
-    Returns:
-        BaseProject: A dummy project instance with components, tasks, teams, workers, and workplaces.
-    """
-    project = BaseProject(
-        init_datetime=datetime.datetime(2020, 4, 1, 8, 0, 0),
-        unit_timedelta=datetime.timedelta(minutes=1),
-    )
-
-    # BaseComponents in BaseProduct
-    c3 = BaseComponent("c3")
-    c1 = BaseComponent("c1")
-    c2 = BaseComponent("c2")
-    c3.update_child_component_set({c1, c2})
-    project.add_product(BaseProduct(component_set={c1, c2, c3}))
-
-    # BaseTasks in BaseWorkflow
-    task1_1 = BaseTask("task1_1", need_facility=True)
-    task1_2 = BaseTask("task1_2", worker_priority_rule=ResourcePriorityRuleMode.HSV)
-    task2_1 = BaseTask("task2_1")
-    task3 = BaseTask("task3", due_time=30)
-    task3.add_input_task(task1_2)
-    task3.add_input_task(task2_1)
-    task1_2.add_input_task(task1_1)
-    task0 = BaseTask("auto", auto_task=True, due_time=20)
-    project.add_workflow(
-        BaseWorkflow(task_set={task1_1, task1_2, task2_1, task3, task0})
-    )
-
-    c1.update_targeted_task_set({task1_1, task1_2})
-    c2.add_targeted_task(task2_1)
-    c3.add_targeted_task(task3)
-
-    # Facilities in workplace
-    f1 = BaseFacility("f1")
-    f1.workamount_skill_mean_map = {
-        task1_1.name: 1.0,
-    }
-
-    # Workplace
-    workplace = BaseWorkplace("workplace", facility_set={f1})
-    workplace.update_targeted_task_set({task1_1, task1_2, task2_1, task3})
-    project.add_workplace(workplace)
-
-    # BaseTeam
-    team = BaseTeam("team")
-    team.update_targeted_task_set({task1_1, task1_2, task2_1, task3})
-    project.add_team(team)
-
-    # BaseWorkers in each BaseTeam
-    w1 = BaseWorker("w1", team_id=team.ID, cost_per_time=10.0)
-    w1.workamount_skill_mean_map = {
-        task1_1.name: 1.0,
-        task1_2.name: 1.0,
-        task2_1.name: 0.0,
-        task3.name: 1.0,
-    }
-    w1.facility_skill_map = {f1.name: 1.0}
-    team.add_worker(w1)
-
-    w2 = BaseWorker("w2", team_id=team.ID, cost_per_time=6.0)
-    w2.workamount_skill_mean_map = {
-        task1_1.name: 1.0,
-        task1_2.name: 0.0,
-        task2_1.name: 1.0,
-        task3.name: 1.0,
-    }
-    w2.facility_skill_map = {f1.name: 1.0}
-    team.add_worker(w2)
-
-    return project
+from .simulation_log import assert_same_simulation_log, get_simulation_log
 
 
 @pytest.fixture(name="dummy_project_multiple")
@@ -437,8 +367,6 @@ def test_str():
     print(BaseProject())
 
 
-
-
 def test_simulate(dummy_project, dummy_project_multiple):
     """Test simulation of BaseProject and BaseProject with multiple products.
 
@@ -1613,6 +1541,45 @@ def test_workload_limit_excludes_auto_task():
     assert normal_task.state == BaseTaskState.WORKING
     assert total_work_amount_in_working_tasks == normal_task.remaining_work_amount + auto_task.remaining_work_amount
 
+
+def test_workload_limit_on_boundary():
+    """A READY task should start when the total work amount equals the limit exactly."""
+    project = BaseProject()
+    workflow = project.create_workflow("workflow")
+    task_a = workflow.create_task("a", default_work_amount=1.0)
+    task_c = workflow.create_task("c", default_work_amount=1.0)
+    task_d = workflow.create_task("d", default_work_amount=0.5)
+    task_b = workflow.create_task("b", default_work_amount=3.0)
+    task_b.add_input_task(task_d)
+    team = project.create_team("team")
+    team.update_targeted_task_set({task_a, task_b, task_c, task_d})
+    for name, skill_map in (
+        ("wa", {"a": 0.1}),
+        ("wc", {"c": 0.03}),
+        ("wd", {"d": 1.0, "b": 1.0}),
+    ):
+        worker = team.create_worker(name)
+        worker.workamount_skill_mean_map = skill_map
+
+    project.simulate(max_time=100)
+    remaining_a_list = list(task_a.remaining_work_amount_record_list)
+    remaining_c_list = list(task_c.remaining_work_amount_record_list)
+    for start_time in range(3, 9):
+        # Work amounts of a and c after the previous step plus the one of b
+        work_amount_limit = (
+            remaining_a_list[start_time - 1]
+            + remaining_c_list[start_time - 1]
+            + task_b.default_work_amount
+        )
+        project.simulate(
+            max_time=100, work_amount_limit_per_unit_time=work_amount_limit
+        )
+        assert (
+            list(task_b.state_record_list).index(BaseTaskState.WORKING)
+            == start_time
+        )
+
+
 def test_backward_simulate_auto_task():
     """Test backward simulation with auto tasks."""
     project = BaseProject()
@@ -1624,3 +1591,352 @@ def test_backward_simulate_auto_task():
         count_auto_task_in_work_amount_limit=True
     )
     assert project.time == 5
+
+
+def test_simulate_next_event_time_advance(dummy_project, dummy_simple_project):
+    """Test that next event time advance produces the same logs as step-by-step advance.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+        dummy_simple_project (BaseProject): The dummy simple project fixture.
+    """
+    for task in dummy_project.task_set:
+        task.default_work_amount = 30.0
+    worker = next(iter(next(iter(dummy_project.team_set)).worker_set))
+    worker.absence_time_list = list(range(40, 55))
+    for kwargs in [{}, {"absence_time_list": list(range(10, 20))}]:
+        assert_same_simulation_log(
+            dummy_project, [{"next_event_time_advance": True}], max_time=1000, **kwargs
+        )
+
+    for kwargs in [
+        {},
+        {"absence_time_list": [1, 3, 5, 7, 9]},
+        {
+            "absence_time_list": [1, 3, 5, 7, 9],
+            "perform_auto_task_while_absence_time": True,
+        },
+        {"max_time": 4},
+    ]:
+        with pytest.warns(UserWarning) if "max_time" in kwargs else nullcontext():
+            assert_same_simulation_log(
+                dummy_simple_project, [{"next_event_time_advance": True}], **kwargs
+            )
+
+
+def test_simulate_next_event_time_advance_record_and_rng(dummy_project):
+    """Test next event time advance with record options, random skills and error_tol.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+    """
+    for task in dummy_project.get_all_task_set():
+        task.default_work_amount = 30.2
+    worker = next(iter(next(iter(dummy_project.team_set)).worker_set))
+    worker.absence_time_list = list(range(40, 55))
+    kwargs = {"max_time": 1000, "absence_time_list": list(range(10, 20))}
+
+    for record_mode in RecordMode:
+        for record_policy in RecordPolicy:
+            assert_same_simulation_log(
+                dummy_project,
+                [{"next_event_time_advance": True}],
+                record_mode=record_mode,
+                record_policy=record_policy,
+                record_interval=3,
+                **kwargs,
+            )
+
+    # Remaining work amounts less than error_tol are regarded as finished.
+    dummy_project.simulate(**kwargs)
+    expected_time = dummy_project.time
+    expected_log = assert_same_simulation_log(
+        dummy_project, [{"next_event_time_advance": True}], error_tol=0.5, **kwargs
+    )
+    assert expected_log[0] < expected_time
+
+    # The random number stream is the same as the one of step-by-step advance.
+    for sd in [0.0, 0.2]:
+        for team in dummy_project.team_set:
+            for worker in team.worker_set:
+                for task_name in worker.workamount_skill_mean_map:
+                    worker.workamount_skill_sd_map[task_name] = sd
+        dummy_project.simulate(rng=np.random.default_rng(1), **kwargs)
+        expected_log = get_simulation_log(dummy_project)
+        expected_random = dummy_project.rng.random()
+        dummy_project.simulate(
+            rng=np.random.default_rng(1), next_event_time_advance=True, **kwargs
+        )
+        assert get_simulation_log(dummy_project) == expected_log
+        assert dummy_project.rng.random() == expected_random
+
+
+def test_simulate_with_overridden_skill_methods():
+    """Test that simulate calls overridden methods of skill progress and quality."""
+
+    class DoubleProgressProject(BaseProject):
+        def get_work_amount_skill_progress(
+            self, resource, task_name, seed=None, rng=None
+        ):
+            return 2.0 * super().get_work_amount_skill_progress(
+                resource, task_name, seed=seed, rng=rng
+            )
+
+    class CountingWorker(BaseWorker):
+        quality_call_count = 0
+
+        def get_quality_skill_point(self, task_name, seed=None, rng=None):
+            CountingWorker.quality_call_count += 1
+            return 0.0
+
+    for project_class, worker_class, expected_time in [
+        (BaseProject, BaseWorker, 10),
+        (DoubleProgressProject, BaseWorker, 5),
+        (BaseProject, CountingWorker, 10),
+    ]:
+        project = project_class()
+        workflow = project.create_workflow("workflow")
+        task = workflow.create_task("task", default_work_amount=10)
+        team = project.create_team("team")
+        team.add_targeted_task(task)
+        worker = worker_class("worker", team_id=team.ID)
+        worker.workamount_skill_mean_map = {"task": 1.0}
+        team.add_worker(worker)
+        for next_event_time_advance in [False, True]:
+            CountingWorker.quality_call_count = 0
+            project.simulate(next_event_time_advance=next_event_time_advance)
+            assert project.time == expected_time
+            assert task.state == BaseTaskState.FINISHED
+            if worker_class is CountingWorker:
+                assert CountingWorker.quality_call_count == expected_time
+
+
+def test_simulate_monte_carlo(dummy_project):
+    """Test Monte Carlo simulation of BaseProject.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+    """
+    result = dummy_project.simulate_monte_carlo(3)
+    assert list(result["makespan"]) == [25.0, 25.0, 25.0]
+    assert list(result["status"]) == [BaseProjectStatus.FINISHED_SUCCESS] * 3
+    assert result["total_cost"][0] == sum(dummy_project.cost_record_list)
+    assert result["task_finish_time"].shape == (3, len(dummy_project.task_set))
+    task_finish_time_list = dummy_project.get_task_finish_time_list(
+        [dummy_project.task_dict[task_id] for task_id in result["task_id_list"]]
+    )
+    assert list(result["task_finish_time"][-1]) == task_finish_time_list
+    assert max(task_finish_time_list) == 25.0
+
+    for worker in dummy_project.get_all_worker_set():
+        worker.workamount_skill_sd_map = {
+            name: 0.3 for name in worker.workamount_skill_mean_map
+        }
+    result_1 = dummy_project.simulate_monte_carlo(5, seed=32)
+    result_2 = dummy_project.simulate_monte_carlo(5, seed=32)
+    assert list(result_1["makespan"]) == list(result_2["makespan"])
+    assert list(result_1["total_cost"]) == list(result_2["total_cost"])
+
+    # The summary does not depend on the logs of instances.
+    result_3 = dummy_project.simulate_monte_carlo(
+        5, seed=32, record_policy=RecordPolicy.NONE
+    )
+    for key in ["status", "makespan", "total_cost", "task_finish_time"]:
+        assert np.array_equal(result_1[key], result_3[key], equal_nan=True)
+
+    with warnings.catch_warnings(record=True) as warning_list:
+        warnings.simplefilter("always")
+        result = dummy_project.simulate_monte_carlo(2, max_time=5)
+        warnings.warn("other warning", UserWarning)
+    assert [str(warning.message) for warning in warning_list] == ["other warning"]
+    assert list(result["status"]) == [BaseProjectStatus.FINISHED_FAILURE] * 2
+    assert np.isnan(result["task_finish_time"]).any()
+
+    with pytest.raises(ValueError):
+        dummy_project.simulate_monte_carlo(0)
+
+
+def test_simulate_rng(dummy_project):
+    """Test simulation with a random generator.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+    """
+    for worker in dummy_project.get_all_worker_set():
+        worker.workamount_skill_sd_map = {
+            name: 0.3 for name in worker.workamount_skill_mean_map
+        }
+        worker.quality_skill_mean_map = {"task1_1": 0.1}
+        worker.quality_skill_sd_map = {"task1_1": 0.05}
+    dummy_project.simulate(rng=np.random.default_rng(32))
+    expected_log = get_simulation_log(dummy_project)
+    component_error_list = [c.error for c in dummy_project.component_set]
+
+    np.random.seed(1)
+    dummy_project.simulate(rng=np.random.default_rng(32))
+    assert get_simulation_log(dummy_project) == expected_log
+    assert [c.error for c in dummy_project.component_set] == component_error_list
+
+    dummy_project.simulate(rng=np.random.default_rng(32), next_event_time_advance=True)
+    assert get_simulation_log(dummy_project) == expected_log
+
+    worker = next(iter(dummy_project.get_all_worker_set()))
+    rng_1 = np.random.default_rng(1)
+    rng_2 = np.random.default_rng(1)
+    assert worker.get_quality_skill_point("task1_1", rng=rng_1) == rng_2.normal(
+        0.1, 0.05
+    )
+
+
+def test_get_work_amount_skill_progress(project_for_workload_limit):
+    """Test that the number of concurrent working tasks is kept during simulation.
+
+    Args:
+        project_for_workload_limit (BaseProject): The dummy project to check workload limit fixture.
+    """
+    project = project_for_workload_limit
+    for max_time in range(1, 10):
+        with pytest.warns(UserWarning):
+            project.simulate(max_time=max_time, work_amount_limit_per_unit_time=20)
+        for resource in project.worker_set | project.facility_set:
+            pair_set = (
+                resource.assigned_task_facility_id_tuple_set
+                if isinstance(resource, BaseWorker)
+                else resource.assigned_task_worker_id_tuple_set
+            )
+            working_task_list = [
+                project.task_dict[task_id]
+                for task_id, _ in pair_set
+                if project.task_dict[task_id].state == BaseTaskState.WORKING
+            ]
+            for task in working_task_list:
+                assert project.get_work_amount_skill_progress(
+                    resource, task.name
+                ) == pytest.approx(
+                    resource.workamount_skill_mean_map.get(task.name, 0.0)
+                    / len(working_task_list)
+                )
+
+
+def test_check_ready_across_workflows():
+    """Test READY transition of tasks depending on tasks in other workflows."""
+    project = BaseProject()
+    workflow_1 = project.create_workflow("workflow_1")
+    workflow_2 = project.create_workflow("workflow_2")
+    task_a = workflow_1.create_task("a", auto_task=True, default_work_amount=2.0)
+    task_b = workflow_2.create_task("b", auto_task=True, default_work_amount=1.0)
+    task_c = workflow_1.create_task("c", auto_task=True, default_work_amount=1.0)
+    task_d = workflow_2.create_task("d", auto_task=True, default_work_amount=1.0)
+    task_b.add_input_task(task_a)
+    task_c.add_input_task(task_b, BaseTaskDependency.SS)
+    task_d.add_input_task(task_c, BaseTaskDependency.SS)
+    task_d.add_input_task(task_a)
+
+    project.initialize()
+    assert task_a.state == BaseTaskState.READY
+    assert [task_b.state, task_c.state, task_d.state] == [BaseTaskState.NONE] * 3
+
+    project.simulate(max_time=100)
+    assert project.status == BaseProjectStatus.FINISHED_SUCCESS
+    assert task_b.state_record_list[:2] == [BaseTaskState.NONE] * 2
+    ready_time = {
+        task.name: task.state_record_list.index(BaseTaskState.WORKING)
+        for task in (task_a, task_b, task_c, task_d)
+    }
+    assert ready_time["a"] < ready_time["b"] <= ready_time["c"] <= ready_time["d"]
+
+
+def test_simulate_pert_update(dummy_project):
+    """Test the options of PERT data update in simulation.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+    """
+    assert_same_simulation_log(
+        dummy_project,
+        [
+            {"pert_update_mode": mode}
+            for mode in [PertUpdateMode.INCREMENTAL, PertUpdateMode.NUMPY]
+        ],
+        max_time=100,
+    )
+
+    dummy_project.simulate(max_time=100, pert_update_interval=5)
+    assert dummy_project.status == BaseProjectStatus.FINISHED_SUCCESS
+
+    with pytest.raises(ValueError):
+        dummy_project.simulate(pert_update_interval=0)
+
+
+def test_simulate_fixing_allocating_worker(dummy_simple_project):
+    """Test that only fixed workers are allocated to a task in simulation.
+
+    Args:
+        dummy_simple_project (BaseProject): The dummy simple project fixture.
+    """
+    task1 = next(
+        task for task in dummy_simple_project.get_all_task_set() if task.name == "task1"
+    )
+    worker_dict = {
+        next(iter(worker.workamount_skill_mean_map)): worker
+        for worker in dummy_simple_project.get_all_worker_set()
+    }
+    task1.fixing_allocating_worker_id_set = {worker_dict["task1"].ID}
+    dummy_simple_project.simulate()
+    assert dummy_simple_project.time == 6.0
+
+    task1.fixing_allocating_worker_id_set = {worker_dict["task3"].ID}
+    with pytest.warns(UserWarning):
+        dummy_simple_project.simulate(max_time=20)
+    assert task1.state == BaseTaskState.READY
+
+
+def test_entity_registry(dummy_project):
+    """Test that the entity registry assigns dense indices to all instances.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+    """
+    dummy_project.initialize()
+    registry = dummy_project.entity_registry
+    for kind, instance_set in (
+        ("task", dummy_project.get_all_task_set()),
+        ("component", dummy_project.get_all_component_set()),
+        ("worker", dummy_project.get_all_worker_set()),
+        ("facility", dummy_project.get_all_facility_set()),
+        ("workplace", dummy_project.workplace_set),
+    ):
+        assert registry.get_size(kind) == len(instance_set)
+        ID_list = registry.get_id_list(kind)
+        assert set(ID_list) == {instance.ID for instance in instance_set}
+        for index, ID in enumerate(ID_list):
+            assert registry.get_index(kind, ID) == index
+    assert registry.get_index("task", "unknown") == -1
+
+    for i, task in enumerate(registry.task_list):
+        assert {
+            (registry.task_list[j].ID, dependency)
+            for j, dependency in registry.input_task_index_dependency_list[i]
+        } == set(task.input_task_id_dependency_set)
+    for workflow in dummy_project.workflow_set:
+        assert {
+            registry.task_list[i]
+            for i in registry.workflow_task_index_list_dict[workflow.ID]
+        } == workflow.task_set
+
+
+def test_simulate_finished_by_default_progress():
+    """Test that tasks finished at initialization are counted as finished."""
+    project = BaseProject()
+    workflow = project.create_workflow("workflow")
+    task_1 = workflow.create_task("task_1", auto_task=True, default_progress=1.0)
+    task_2 = workflow.create_task("task_2", auto_task=True, default_work_amount=2.0)
+    task_2.add_input_task(task_1)
+    project.simulate(max_time=10)
+    assert project.status == BaseProjectStatus.FINISHED_SUCCESS
+    assert project.time == 2
+
+    task_2.default_progress = 1.0
+    project.simulate(max_time=10)
+    assert project.status == BaseProjectStatus.FINISHED_SUCCESS
+    assert project.time == 0
@@ -12,7 +12,7 @@ import pytest
 
 from pDESy.model.base_task import BaseTask, BaseTaskDependency, BaseTaskState
 from pDESy.model.base_worker import BaseWorker
-from pDESy.model.base_workflow import BaseWorkflow
+from pDESy.model.base_workflow import BaseWorkflow, PertUpdateMode
 
 
 @pytest.fixture(name="dummy_workflow")
@@ -462,6 +462,75 @@ def test_update_pert_data(ss_workflow, ff_workflow, sf_workflow):
     assert (task3.lst, task3.lft) == (10, 20)
 
 
+def test_update_pert_data_mode(ss_workflow, ff_workflow, sf_workflow):
+    """Test that PERT update in each mode is equal to full PERT update.
+
+    Args:
+        ss_workflow (BaseWorkflow): Workflow with SS dependency.
+        ff_workflow (BaseWorkflow): Workflow with FF dependency.
+        sf_workflow (BaseWorkflow): Workflow with SF dependency.
+    """
+    for mode in [PertUpdateMode.INCREMENTAL, PertUpdateMode.NUMPY]:
+        for workflow in [ss_workflow, ff_workflow, sf_workflow]:
+            task1 = next(task for task in workflow.task_set if task.name == "task1")
+            task2 = next(task for task in workflow.task_set if task.name == "task2")
+            for time, remaining_work_amount_list in enumerate(
+                [(10, 10), (8, 10), (8, 10), (3, 7), (0, 2), (0, 0)]
+            ):
+                task1.remaining_work_amount = remaining_work_amount_list[0]
+                task2.remaining_work_amount = remaining_work_amount_list[1]
+                workflow.update_pert_data(time, mode=mode)
+                result = [
+                    (task.name, task.est, task.eft, task.lst, task.lft)
+                    for task in workflow.task_set
+                ]
+                critical_path_length = workflow.critical_path_length
+                workflow.update_pert_data(time)
+                assert result == [
+                    (task.name, task.est, task.eft, task.lst, task.lft)
+                    for task in workflow.task_set
+                ]
+                assert critical_path_length == workflow.critical_path_length
+
+        # Topology cache is updated after reversing dependencies
+        ss_workflow.reverse_dependencies()
+        ss_workflow.update_pert_data(0, mode=mode)
+        result = [
+            (task.name, task.est, task.eft, task.lst, task.lft)
+            for task in ss_workflow.task_set
+        ]
+        ss_workflow.update_pert_data(0)
+        assert result == [
+            (task.name, task.est, task.eft, task.lst, task.lft)
+            for task in ss_workflow.task_set
+        ]
+        ss_workflow.reverse_dependencies()
+
+
+def test_update_pert_data_changed_task_id_set(ss_workflow):
+    """Test that update_pert_data returns IDs of tasks whose PERT data changed.
+
+    Args:
+        ss_workflow (BaseWorkflow): Workflow with SS dependency.
+    """
+    for mode in PertUpdateMode:
+        ss_workflow.update_pert_data(0, mode=mode)
+        assert ss_workflow.update_pert_data(0, mode=mode) == set()
+        previous_pert_data_dict = {
+            task.ID: (task.est, task.eft, task.lst, task.lft)
+            for task in ss_workflow.task_set
+        }
+        task1 = next(task for task in ss_workflow.task_set if task.name == "task1")
+        task1.remaining_work_amount -= 1
+        changed_task_id_set = ss_workflow.update_pert_data(1, mode=mode)
+        assert task1.ID in changed_task_id_set
+        assert changed_task_id_set == {
+            task.ID
+            for task in ss_workflow.task_set
+            if (task.est, task.eft, task.lst, task.lft)
+            != previous_pert_data_dict[task.ID]
+        }
+        task1.remaining_work_amount += 1
 
 
 def test_remove_insert_absence_time_list():
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for json_utils.
+
+This module contains unit tests for writing and reading JSON files of BaseProject.
+"""
+
+import json
+
+import pytest
+
+from pDESy.model.base_project import BaseProject
+from pDESy.model.json_utils import (
+    JSON_BACKEND_LIST,
+    get_json_backend,
+    loads_json,
+    set_json_backend,
+)
+from pDESy.model.record_utils import RecordMode
+
+from .simulation_log import get_simulation_record
+
+
+def test_read_simple_json_large_project(tmp_path):
+    """Test that references of a large project are resolved by read_simple_json.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    n_task = 2000
+    project = BaseProject()
+    workflow = project.create_workflow("workflow")
+    product = project.create_product("product")
+    team = project.create_team("team")
+    workplace = project.create_workplace("workplace")
+    previous_task = None
+    for i in range(n_task):
+        task = workflow.create_task(f"task{i}")
+        component = product.create_component(f"component{i}")
+        component.add_targeted_task(task)
+        team.add_targeted_task(task)
+        workplace.add_targeted_task(task)
+        if previous_task is not None:
+            task.add_input_task(previous_task)
+        previous_task = task
+    file_path = str(tmp_path / "large_project.json")
+    project.write_simple_json(file_path, indent=None)
+
+    read_project = BaseProject()
+    read_project.read_simple_json(file_path)
+    assert len(read_project.task_dict) == n_task
+    assert len(read_project.component_dict) == n_task
+    for task in project.get_all_task_set():
+        read_task = read_project.task_dict[task.ID]
+        assert read_task.input_task_id_dependency_set == (
+            task.input_task_id_dependency_set
+        )
+        assert read_task.target_component_id == task.target_component_id
+        assert read_task.allocated_team_id_set == {team.ID}
+        assert read_task.allocated_workplace_id_set == {workplace.ID}
+    for component in project.get_all_component_set():
+        read_component = read_project.component_dict[component.ID]
+        assert read_component.targeted_task_id_set == component.targeted_task_id_set
+        assert read_component.placed_workplace_id is None
+
+
+def test_write_simple_json_compact(dummy_project, tmp_path):
+    """Test that the compact JSON has the same data as the indented one.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    dummy_project.simulate(max_time=100)
+    file_path = str(tmp_path / "project.json")
+    compact_file_path = str(tmp_path / "compact_project.json")
+    dummy_project.write_simple_json(file_path)
+    dummy_project.write_simple_json(compact_file_path, compact=True)
+    with open(file_path, "r", encoding="utf-8") as f:
+        text = f.read()
+    with open(compact_file_path, "r", encoding="utf-8") as f:
+        compact_text = f.read()
+    assert json.loads(compact_text) == json.loads(text)
+    assert text == json.dumps(json.loads(text), indent=4)
+    assert compact_text == json.dumps(json.loads(text), separators=(",", ":"))
+
+    read_project = BaseProject()
+    read_project.read_simple_json(compact_file_path)
+    assert read_project.cost_record_list == dummy_project.cost_record_list
+
+
+def test_simple_json_backend(dummy_project, tmp_path):
+    """Test that JSON files are written and read in the same way by each JSON backend.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    json_file_path = str(tmp_path / "project.json")
+    dummy_project.simulate(max_time=100, record_mode=RecordMode.RLE)
+    task = next(iter(dummy_project.task_set))
+    task.lft = float("inf")
+
+    backend = get_json_backend()
+    text_list = []
+    log_list = []
+    try:
+        for name in JSON_BACKEND_LIST:
+            try:
+                set_json_backend(name)
+            except ValueError:
+                continue
+            for kwargs in [{}, {"indent": 2}, {"compact": True}]:
+                dummy_project.write_simple_json(json_file_path, **kwargs)
+                with open(json_file_path, "r", encoding="utf-8") as f:
+                    text = f.read()
+                # Infinity is written as null, which strict JSON parsers accept.
+                assert "Infinity" not in text
+                text_list.append((kwargs.get("indent"), kwargs.get("compact"), text))
+                read_project = BaseProject()
+                read_project.read_simple_json(json_file_path)
+                assert read_project.task_dict[task.ID].lft == float("inf")
+                assert read_project.task_dict[task.ID].state_record_list == list(
+                    task.state_record_list
+                )
+                log_list.append(get_simulation_record(read_project))
+            # Files of older versions with Infinity can be read.
+            assert loads_json('{"lft": Infinity}') == {"lft": float("inf")}
+    finally:
+        set_json_backend(backend)
+    assert all(log == log_list[0] for log in log_list)
+    for indent, compact, text in text_list:
+        assert all(
+            other_text == text
+            for other_indent, other_compact, other_text in text_list
+            if (other_indent, other_compact) == (indent, compact)
+        )
+    with pytest.raises(ValueError):
+        set_json_backend("unknown")
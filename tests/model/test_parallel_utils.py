@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for parallel_utils.
+
+This module contains unit tests for the parallel simulation of BaseProject replications.
+"""
+
+import numpy as np
+import pytest
+
+from pDESy.model.base_project import BaseProjectStatus
+
+
+def test_simulate_parallel(dummy_project):
+    """Test parallel simulation of BaseProject replications.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+    """
+    result_list = list(dummy_project.simulate_parallel(n_runs=3, max_workers=2))
+    assert [result["run_index"] for result in result_list] == [0, 1, 2]
+    assert [result["makespan"] for result in result_list] == [25.0, 25.0, 25.0]
+    assert all(
+        result["status"] == BaseProjectStatus.FINISHED_SUCCESS for result in result_list
+    )
+    assert dummy_project.status == BaseProjectStatus.NONE
+
+    # Task order is the one of this project, not the one of the copy in worker process.
+    assert len(result_list[0]["task_finish_time"]) == len(
+        dummy_project.get_all_task_set()
+    )
+    assert max(result_list[0]["task_finish_time"]) == 25.0
+
+    result_list = list(
+        dummy_project.simulate_parallel(
+            seed=32,
+            simulate_kwargs_list=[{"max_time": 5}, {"max_time": 100}],
+            max_workers=2,
+        )
+    )
+    assert [result["status"] for result in result_list] == [
+        BaseProjectStatus.FINISHED_FAILURE,
+        BaseProjectStatus.FINISHED_SUCCESS,
+    ]
+    assert result_list[0]["seed"] != result_list[1]["seed"]
+
+    with pytest.raises(ValueError):
+        list(dummy_project.simulate_parallel())
+    with pytest.raises(ValueError):
+        list(dummy_project.simulate_parallel(n_runs=3, simulate_kwargs_list=[{}]))
+    # rng is rejected before any worker process starts.
+    with pytest.raises(ValueError, match="rng"):
+        dummy_project.simulate_parallel(n_runs=2, rng=np.random.default_rng(0))
+    with pytest.raises(ValueError, match="rng"):
+        dummy_project.simulate_parallel(
+            simulate_kwargs_list=[{}, {"rng": np.random.default_rng(0)}]
+        )
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for record_utils.
+
+This module contains unit tests for the record modes and policies of BaseProject.
+"""
+
+import pytest
+
+from pDESy.model.record_utils import (
+    ColumnarRecord,
+    RecordMode,
+    RecordPolicy,
+    RunLengthRecord,
+)
+
+from .simulation_log import get_simulation_record
+
+
+def get_gantt_time_list(project):
+    """Get time lists for Gantt charts of all tasks, components, workers and facilities.
+
+    Args:
+        project (BaseProject): The simulated project.
+
+    Returns:
+        list: Time lists of each instance sorted by ID.
+    """
+    instance_list = sorted(
+        [
+            *project.get_all_task_set(),
+            *project.get_all_component_set(),
+            *project.get_all_worker_set(),
+            *project.get_all_facility_set(),
+        ],
+        key=lambda instance: instance.ID,
+    )
+    return [instance.get_time_list_for_gantt_chart() for instance in instance_list]
+
+
+def test_simulate_record_mode(dummy_project):
+    """Test that COLUMNAR and RLE record modes produce the same logs as LIST mode.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+    """
+    absence_time_list = [3, 4, 10]
+    task_list = list(dummy_project.get_all_task_set())
+    record_type_dict = {
+        RecordMode.COLUMNAR: ColumnarRecord,
+        RecordMode.RLE: RunLengthRecord,
+    }
+    for simulate in [dummy_project.simulate, dummy_project.backward_simulate]:
+        simulate(max_time=100, absence_time_list=absence_time_list)
+        expected_log = get_simulation_record(dummy_project)
+        expected_gantt_time_list = get_gantt_time_list(dummy_project)
+        expected_finish_time_list = dummy_project.get_task_finish_time_list(task_list)
+        for record_mode, record_type in record_type_dict.items():
+            simulate(
+                max_time=100,
+                absence_time_list=absence_time_list,
+                record_mode=record_mode,
+            )
+            assert get_simulation_record(dummy_project) == expected_log
+            assert get_gantt_time_list(dummy_project) == expected_gantt_time_list
+            assert (
+                dummy_project.get_task_finish_time_list(task_list)
+                == expected_finish_time_list
+            )
+            for instance in task_list + list(dummy_project.get_all_worker_set()):
+                assert isinstance(instance.state_record_list, record_type)
+            # Allocation records share the same values for the same allocation.
+            allocation_set = {
+                id(allocation)
+                for task in task_list
+                for allocation in (
+                    task.allocated_worker_facility_id_tuple_set_record_list
+                )
+                if len(allocation) == 0
+            }
+            assert len(allocation_set) == 1
+
+    # Records can be modified as lists.
+    expected_log_list = []
+    for record_mode in [RecordMode.LIST, *record_type_dict]:
+        dummy_project.simulate(
+            max_time=100,
+            absence_time_list=absence_time_list,
+            record_mode=record_mode,
+        )
+        dummy_project.remove_absence_time_list()
+        expected_log_list.append(get_simulation_record(dummy_project))
+        dummy_project.insert_absence_time_list(absence_time_list)
+        expected_log_list.append(get_simulation_record(dummy_project))
+    assert expected_log_list[:2] == expected_log_list[2:4] == expected_log_list[4:]
+
+    record_list = list(task_list[0].state_record_list)
+    assert task_list[0].state_record_list[2:-3] == record_list[2:-3]
+    assert task_list[0].state_record_list[-1] == record_list[-1]
+
+    # Simulation can be continued without initializing the log information.
+    task = task_list[0]
+    for record_mode in record_type_dict:
+        with pytest.warns(UserWarning):
+            dummy_project.simulate(max_time=5, record_mode=record_mode)
+        with pytest.warns(UserWarning):
+            dummy_project.simulate(
+                max_time=10,
+                initialize_state_info=False,
+                initialize_log_info=False,
+                record_mode=record_mode,
+            )
+        assert len(task.state_record_list) == len(dummy_project.cost_record_list) == 10
+
+
+def test_simulate_record_policy(dummy_project):
+    """Test that record policies keep the simulation results and the record lengths.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+    """
+    absence_time_list = [3, 4, 10]
+    task_list = list(dummy_project.get_all_task_set())
+    worker_list = list(dummy_project.get_all_worker_set())
+    dummy_project.simulate(max_time=100, absence_time_list=absence_time_list)
+    expected_log = get_simulation_record(dummy_project)
+    expected_finish_time_list = dummy_project.get_task_finish_time_list(task_list)
+    for record_mode in RecordMode:
+        # Logs are recorded only when states or allocations change.
+        dummy_project.simulate(
+            max_time=100,
+            absence_time_list=absence_time_list,
+            record_mode=record_mode,
+            record_policy=RecordPolicy.TRANSITION,
+        )
+        log = get_simulation_record(dummy_project)
+        assert log.keys() == expected_log.keys()
+        for key, record_list in log.items():
+            if key[-1] != "remaining_work_amount_record_list":
+                assert record_list == expected_log[key]
+            else:
+                assert len(record_list) == len(expected_log[key])
+        assert (
+            dummy_project.get_task_finish_time_list(task_list)
+            == expected_finish_time_list
+        )
+
+        # Logs of unrecorded steps hold the values of the last recorded step.
+        dummy_project.simulate(
+            max_time=100,
+            absence_time_list=absence_time_list,
+            record_mode=record_mode,
+            record_policy=RecordPolicy.INTERVAL,
+            record_interval=4,
+        )
+        log = get_simulation_record(dummy_project)
+        assert log["time"] == expected_log["time"]
+        assert log["cost"] == expected_log["cost"]
+        for task in task_list:
+            record_list = list(task.state_record_list)
+            assert len(record_list) == dummy_project.time
+            for time in range(dummy_project.time):
+                assert record_list[time] == record_list[time - time % 4]
+            if record_mode != RecordMode.COLUMNAR:
+                # Only the values of the recorded steps are stored.
+                for record in (
+                    task.state_record_list,
+                    task.remaining_work_amount_record_list,
+                ):
+                    assert isinstance(record, RunLengthRecord)
+                    assert all(
+                        start % 4 == 0 for start, _, _ in record.iter_runs()
+                    )
+        assert (
+            dummy_project.get_task_finish_time_list(task_list)
+            == expected_finish_time_list
+        )
+
+        # Only the logs of this project are recorded.
+        dummy_project.simulate(
+            max_time=100,
+            absence_time_list=absence_time_list,
+            record_mode=record_mode,
+            record_policy=RecordPolicy.NONE,
+        )
+        log = get_simulation_record(dummy_project)
+        assert log["time"] == expected_log["time"]
+        assert log["cost"] == expected_log["cost"]
+        for instance in task_list + worker_list:
+            assert len(instance.state_record_list) == 0
+        assert (
+            dummy_project.get_task_finish_time_list(task_list)
+            == expected_finish_time_list
+        )
+
+    # Finish times of Monte Carlo runs do not depend on the record policy.
+    result = dummy_project.simulate_monte_carlo(
+        3, seed=32, absence_time_list=absence_time_list
+    )
+    for record_interval in [4, 7]:
+        interval_result = dummy_project.simulate_monte_carlo(
+            3,
+            seed=32,
+            absence_time_list=absence_time_list,
+            record_policy=RecordPolicy.INTERVAL,
+            record_interval=record_interval,
+        )
+        assert (
+            interval_result["task_finish_time"].tolist()
+            == result["task_finish_time"].tolist()
+        )
+
+    with pytest.raises(ValueError):
+        dummy_project.simulate(record_policy=RecordPolicy.INTERVAL, record_interval=0)
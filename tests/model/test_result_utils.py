@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for result_utils.
+
+This module contains unit tests for the binary simulation results of BaseProject.
+"""
+
+import pytest
+
+from pDESy.model.base_project import BaseProject
+from pDESy.model.base_task import BaseTaskState
+from pDESy.model.base_worker import BaseWorkerState
+from pDESy.model.record_utils import ColumnarRecord, RecordMode, RecordPolicy
+
+from .simulation_log import get_simulation_record
+
+
+def test_write_and_read_simulation_result(dummy_project, tmp_path):
+    """Test that a simulation result is read as the simulated records.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    json_file_path = str(tmp_path / "project.json")
+    result_dir_path = str(tmp_path / "result")
+    dummy_project.write_simple_json(json_file_path)
+    for record_mode in RecordMode:
+        dummy_project.simulate(
+            max_time=100, absence_time_list=[3, 4, 10], record_mode=record_mode
+        )
+        expected_log = get_simulation_record(dummy_project)
+        dummy_project.write_simulation_result(result_dir_path)
+
+        read_project = BaseProject()
+        read_project.read_simple_json(json_file_path)
+        read_project.read_simulation_result(result_dir_path)
+        assert get_simulation_record(read_project) == expected_log
+        assert read_project.status == dummy_project.status
+        for task in dummy_project.get_all_task_set():
+            assert read_project.task_dict[task.ID].state == task.state
+        assert read_project.get_task_finish_time_list(
+            [read_project.task_dict[task.ID] for task in dummy_project.task_set]
+        ) == dummy_project.get_task_finish_time_list(list(dummy_project.task_set))
+
+    with pytest.raises(ValueError):
+        BaseProject().read_simulation_result(result_dir_path)
+
+
+def test_task_finish_time_after_write_and_read(dummy_project, tmp_path):
+    """Test that finish steps of tasks are written and read with the logs.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    json_file_path = str(tmp_path / "project.json")
+    result_dir_path = str(tmp_path / "result")
+    # Finish steps differ from the indices of the first FINISHED records.
+    dummy_project.simulate(
+        max_time=100, record_policy=RecordPolicy.INTERVAL, record_interval=4
+    )
+    task_list = list(dummy_project.get_all_task_set())
+    expected_finish_time_list = dummy_project.get_task_finish_time_list(task_list)
+    dummy_project.write_simple_json(json_file_path)
+    dummy_project.write_simulation_result(result_dir_path)
+
+    read_project = BaseProject()
+    read_project.read_simple_json(json_file_path)
+    read_task_list = [read_project.task_dict[task.ID] for task in task_list]
+    assert (
+        read_project.get_task_finish_time_list(read_task_list)
+        == expected_finish_time_list
+    )
+    read_project.read_simulation_result(result_dir_path)
+    assert (
+        read_project.get_task_finish_time_list(read_task_list)
+        == expected_finish_time_list
+    )
+
+
+def test_read_simulation_result_mmap(dummy_project, tmp_path):
+    """Test that memory-mapped records of a simulation result are decoded lazily.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    json_file_path = str(tmp_path / "project.json")
+    result_dir_path = str(tmp_path / "result")
+    dummy_project.write_simple_json(json_file_path)
+    dummy_project.simulate(max_time=100, absence_time_list=[3, 4, 10])
+    expected_log = get_simulation_record(dummy_project)
+    dummy_project.write_simulation_result(result_dir_path)
+
+    read_project = BaseProject()
+    read_project.read_simple_json(json_file_path)
+    read_project.read_simulation_result(result_dir_path, mmap_mode="r")
+    team = next(iter(read_project.team_set))
+    worker = next(iter(team.worker_set))
+    assert isinstance(worker.state_record_list, ColumnarRecord)
+    assert team.get_worker_set_by_state(
+        [3, 4], BaseWorkerState.ABSENCE
+    ) == team.worker_set
+    assert get_simulation_record(read_project) == expected_log
+
+    task = next(
+        task
+        for task in read_project.get_all_task_set()
+        if BaseTaskState.FINISHED in list(task.state_record_list)
+    )
+    allocation = task.allocated_worker_facility_id_tuple_set_record_list
+    allocation_list = list(allocation)
+    for value in allocation_list:
+        assert allocation.index(value) == allocation_list.index(value)
+    assert task.state_record_list.index(BaseTaskState.FINISHED) == [
+        time
+        for time, state in enumerate(task.state_record_list)
+        if state == BaseTaskState.FINISHED
+    ][0]
+    task.state_record_list.append(BaseTaskState.FINISHED)
+    assert len(task.state_record_list) == len(worker.state_record_list) + 1
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for snapshot_utils.
+
+This module contains unit tests for the snapshots of BaseProject.
+"""
+
+import numpy as np
+import pytest
+
+from pDESy.model.base_project import BaseProject, BaseProjectStatus
+
+from .simulation_log import get_simulation_record
+
+
+def test_snapshot_and_restore(dummy_project):
+    """Test that a simulation branched from a snapshot equals the whole simulation.
+
+    Args:
+        dummy_project (BaseProject): The dummy project fixture.
+    """
+    for worker in dummy_project.get_all_worker_set():
+        worker.workamount_skill_sd_map = {
+            name: 0.3 for name in worker.workamount_skill_mean_map
+        }
+    dummy_project.simulate(max_time=100, rng=np.random.default_rng(32))
+    expected_log = get_simulation_record(dummy_project)
+    component_error_list = [c.error for c in dummy_project.component_set]
+
+    with pytest.warns(UserWarning):
+        dummy_project.simulate(max_time=10, rng=np.random.default_rng(32))
+    snapshot = dummy_project.snapshot()
+    assert isinstance(snapshot, bytes)
+    prefix_log = get_simulation_record(dummy_project)
+
+    for _ in range(2):
+        dummy_project.restore(snapshot)
+        assert dummy_project.time == 10
+        assert get_simulation_record(dummy_project) == prefix_log
+        dummy_project.simulate(
+            max_time=100,
+            initialize_state_info=False,
+            initialize_log_info=False,
+            rng=dummy_project.rng,
+        )
+        assert dummy_project.status == BaseProjectStatus.FINISHED_SUCCESS
+        assert get_simulation_record(dummy_project) == expected_log
+        assert [c.error for c in dummy_project.component_set] == component_error_list
+
+    with pytest.raises(ValueError):
+        BaseProject().restore(snapshot)